@@ -0,0 +1,34 @@
+"""
+Benchmark the JSON codecs on a large synthetic uplink_blocks response
+
+    $ python -m benchmarks.bench_codec
+"""
+
+import timeit
+
+from uplink.codec import JsonCodec, OrjsonCodec, orjson
+
+from tests import reference
+
+
+def blocks_response(n_blocks, n_txs):
+    tx = reference.testTx(reference.TxAsset, reference.Transfer, reference.testTransfer).to_dict()
+    blocks = [reference.testBlock(i, [tx] * n_txs) for i in range(n_blocks)]
+    return {"tag": "RPCResp", "contents": blocks}
+
+
+def main():
+    response = blocks_response(2000, 20)
+    codecs = [JsonCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+
+    body = JsonCodec().dumps(response)
+    print("response size: {:.1f} MB".format(len(body) / 1e6))
+
+    for codec in codecs:
+        encode = min(timeit.repeat(lambda: codec.dumps(response), number=3, repeat=3)) / 3
+        decode = min(timeit.repeat(lambda: codec.loads(body), number=3, repeat=3)) / 3
+        print("{:>6}: encode {:7.1f} ms, decode {:7.1f} ms".format(codec.name, encode * 1e3, decode * 1e3))
+
+
+if __name__ == '__main__':
+    main()
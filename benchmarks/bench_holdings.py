@@ -0,0 +1,61 @@
+"""
+Benchmark holdings reports over many assets, with Python loops over
+Asset.holdings vs AssetHoldingsTable
+
+    $ python -m benchmarks.bench_holdings [assets] [holders] [accounts]
+"""
+
+import sys
+import time
+import heapq
+import random
+
+from uplink import Asset
+from uplink.holdings import AssetHoldingsTable
+
+from tests import reference
+
+
+def timed(name, fn):
+    start = time.time()
+    result = fn()
+    print("{:>28}: {:7.3f} s".format(name, time.time() - start))
+    return result
+
+
+def loop_report(assets):
+    totals = {}
+    for asset in assets:
+        for address, balance in asset.holdings.items():
+            totals[address] = totals.get(address, 0) + balance
+    return heapq.nlargest(10, totals.items(), key=lambda item: item[1])
+
+
+def table_report(assets):
+    return AssetHoldingsTable(assets).top_holders(10)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    holders = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    accounts = int(sys.argv[3]) if len(sys.argv) > 3 else 100000
+
+    rng = random.Random(0)
+    addresses = ["account{}".format(i) for i in range(accounts)]
+    assets = []
+    for i in range(count):
+        holdings = dict((address, rng.randint(1, 10 ** 6)) for address in rng.sample(addresses, holders))
+        assets.append(Asset(**reference.testAsset(address="asset{}".format(i), holdings=holdings)))
+
+    expected = timed("loops: top 10 by total", lambda: loop_report(assets))
+    top = timed("table: build + top 10", lambda: table_report(assets))
+    assert [balance for _, balance in top] == [balance for _, balance in expected]
+
+    table = AssetHoldingsTable(assets)
+    timed("table: top 10 by total", lambda: table.top_holders(10))
+    timed("table: quartiles", lambda: table.quantile([0.25, 0.5, 0.75]))
+    timed("table: join 1000 x all", lambda: table.join(addresses[:1000]))
+
+
+if __name__ == '__main__':
+    main()
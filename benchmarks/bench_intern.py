@@ -0,0 +1,50 @@
+"""
+Benchmark the memory held by parsed asset snapshots, with and without
+interning their strings
+
+    $ python -m benchmarks.bench_intern [assets] [holders] [accounts]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+from uplink.b58 import b58encode
+from uplink.cache import InternTable
+from uplink.codec import default_codec
+
+from tests import reference
+
+
+def measure(name, parse, bodies):
+    tracemalloc.start()
+    start = time.time()
+    snapshots = [parse(body) for body in bodies]
+    elapsed = time.time() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:>9}: {:6.3f} s, {:7.1f} MB held".format(name, elapsed, current / 1e6))
+    return snapshots
+
+
+def main():
+    assets = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    holders = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    accounts = int(sys.argv[3]) if len(sys.argv) > 3 else 20000
+
+    codec = default_codec()
+    addresses = [b58encode(os.urandom(32)) for _ in range(accounts)]
+    bodies = []
+    for i in range(assets):
+        holdings = dict((addresses[(i * 7919 + j) % accounts], j) for j in range(holders))
+        asset = reference.testAsset(address=addresses[i], holdings=holdings)
+        bodies.append(codec.dumps({"tag": "RPCResp", "contents": [asset]}))
+
+    measure("plain", codec.loads, bodies)
+    strings = InternTable()
+    measure("interned", lambda body: strings.intern_tree(codec.loads(body)), bodies)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark scanning block transactions when only a few of them are read,
+decoding every transaction up front vs on access
+
+    $ python -m benchmarks.bench_lazy_transactions [blocks] [per_block]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from uplink import *
+
+from tests import reference
+
+
+def scan(name, decode, responses):
+    tracemalloc.start()
+    start = time.time()
+    total = 0
+    blocks = []
+    for txs in responses:
+        transactions = decode(txs)
+        # Read one transaction in fifty, as a scanner looking for a few
+        # accounts would
+        for i in range(0, len(transactions), 50):
+            total += transactions[i].header.contents.contents.balance
+        blocks.append(transactions)
+    elapsed = time.time() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:>6}: {:6.3f} s, {:6.1f} MB held (total {})".format(name, elapsed, current / 1e6, total))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    per_block = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    tx = reference.testTx(TxAsset, Transfer, reference.testTransfer).to_dict()
+    responses = [[dict(tx) for _ in range(per_block)] for _ in range(count)]
+
+    scan("eager", lambda txs: [Transaction.from_dict(data) for data in txs], responses)
+    scan("lazy", LazyTransactions, responses)
+
+
+if __name__ == '__main__':
+    main()
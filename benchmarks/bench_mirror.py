@@ -0,0 +1,52 @@
+"""
+Benchmark asset lookups through RPCs vs a LedgerMirror, against a local
+stub node
+
+    $ python -m benchmarks.bench_mirror [lookups] [assets]
+"""
+
+import sys
+import time
+
+from uplink import *
+
+from tests import reference
+from tests.stub import StubNode, ok
+
+
+def timed(name, lookup, addresses):
+    start = time.time()
+    for address in addresses:
+        lookup(address)
+    elapsed = time.time() - start
+    print("{:>7}: {:8.1f} us per lookup".format(name, elapsed / len(addresses) * 1e6))
+
+
+def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    assets = [reference.testAsset(address="asset{}".format(i)) for i in range(count)]
+    routes = dict(('assets/{}'.format(asset["address"]), ok(asset)) for asset in assets)
+    routes.update({
+        'blocks/0': ok(reference.testBlock(0)),
+        'blocks/1': {"tag": "RPCRespError", "contents": "No block"},
+        'accounts': ok([]),
+        'assets': ok(assets),
+        'contracts': ok([]),
+    })
+    addresses = [assets[i % count]["address"] for i in range(lookups)]
+
+    with StubNode(routes) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        mirror = LedgerMirror(rpc)
+        mirror.bootstrap()
+
+        timed("rpc", rpc.uplink_get_asset, addresses)
+        timed("mirror", mirror.get_asset, addresses)
+        rpc.close()
+    print("{} requests served, {} of them for the mirror's bootstrap".format(len(node.requests), len(node.requests) - lookups))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""
+Benchmark the memory held by the Block and Asset response models and their
+compact variants, built from synthetic RPC responses
+
+    $ python -m benchmarks.bench_models_memory [count]
+"""
+
+import sys
+import tracemalloc
+
+from uplink import *
+
+from tests import reference
+
+
+def measure(name, build, count):
+    tracemalloc.start()
+    objects = [build(i) for i in range(count)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:>12}: {:8.1f} MB for {} objects, {:5.0f} bytes each".format(name, current / 1e6, count, current / count))
+    return objects
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    # Responses are decoded fresh for every object, as they would be from JSON
+    for name, cls in [("Block", Block), ("CompactBlock", CompactBlock)]:
+        measure(name, lambda i: cls(**reference.testBlock(i)), count)
+    for name, cls in [("Asset", Asset), ("CompactAsset", CompactAsset)]:
+        measure(name, lambda i: cls(**reference.testAsset(address=str(i))), count)
+
+
+if __name__ == '__main__':
+    main()
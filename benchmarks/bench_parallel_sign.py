@@ -0,0 +1,38 @@
+"""
+Benchmark signing transfer headers in the calling thread against a
+ParallelSigner with an increasing number of worker processes
+
+    $ python -m benchmarks.bench_parallel_sign
+"""
+
+import multiprocessing
+import timeit
+
+from uplink import *
+
+from tests import reference
+
+
+def main():
+    msgs = [TransferAssetHeader(reference.assetAddr, reference.toAddr, i).to_binary() for i in range(2000)]
+    items = [(reference.skey, msg) for msg in msgs]
+    signer = Signer(reference.skey)
+
+    start = timeit.default_timer()
+    for msg in msgs:
+        pack_signature(*signer.sign(msg))
+    print("    thread: {:8.0f} signatures/s".format(len(msgs) / (timeit.default_timer() - start)))
+
+    processes = 1
+    while processes <= multiprocessing.cpu_count():
+        with ParallelSigner([reference.skey], processes) as parallel:
+            parallel.sign_many(items[:processes * 16])
+            start = timeit.default_timer()
+            parallel.sign_many(items)
+            elapsed = timeit.default_timer() - start
+        print("{:>2} process: {:8.0f} signatures/s".format(processes, len(msgs) / elapsed))
+        processes *= 2
+
+
+if __name__ == '__main__':
+    main()
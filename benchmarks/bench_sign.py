@@ -0,0 +1,40 @@
+"""
+Benchmark signing a transfer header with ecdsa's SigningKey.sign against the
+precomputed generator table
+
+    $ python -m benchmarks.bench_sign
+"""
+
+import sha3
+import timeit
+
+from ecdsa import util
+
+from uplink import *
+from uplink import secp256k1
+
+from tests import reference
+
+
+def main():
+    msg = reference.testTransfer.to_binary()
+    sk = reference.skey
+
+    def baseline():
+        util.sigdecode_string(sk.sign(msg, hashfunc=sha3.sha3_256), order)
+
+    signer = Signer(sk)
+    secp256k1.base_multiply(1)
+
+    number = 200
+    for name, sign in [("ecdsa", baseline), ("Signer", lambda: signer.sign(msg))]:
+        best = min(timeit.repeat(sign, number=number, repeat=5))
+        print("{:>8}: {:8.1f} us per signature".format(name, best / number * 1e6))
+
+    start = timeit.default_timer()
+    secp256k1.point_table(secp256k1.GX, secp256k1.GY, secp256k1.WINDOW)
+    print("   table: {:8.1f} ms to build".format((timeit.default_timer() - start) * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+"""
+Benchmark Serializable.to_dict on transactions with deep CallHeader argument lists
+
+    $ python -m benchmarks.bench_to_dict
+"""
+
+import timeit
+
+from uplink import *
+
+from tests import reference
+
+
+def call_tx(n_args):
+    args = [VInt(i) for i in range(n_args)] + [VMsg("Hello world"), VFixed(Decimal("3.223"), 3)]
+    hdr = CallHeader(reference.testAddr, "set", args)
+    return Transaction(TxContract(Call(hdr)), b"signature", origin=reference.testAddr)
+
+
+def main():
+    for n_args in [0, 10, 100, 1000]:
+        tx = call_tx(n_args)
+        number = max(10, 20000 // (n_args + 10))
+        best = min(timeit.repeat(tx.to_dict, number=number, repeat=5))
+        print("to_dict, {:>4} args: {:8.1f} us".format(n_args, best / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
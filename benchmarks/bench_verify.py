@@ -0,0 +1,50 @@
+"""
+Benchmark verifying signatures of transfer headers from a handful of keys with
+ecdsa_verify against verify_many
+
+    $ python -m benchmarks.bench_verify [signatures] [processes]
+
+ecdsa_verify is timed on a sample only and extrapolated to the full count.
+"""
+
+import sys
+import timeit
+
+import sha3
+from ecdsa import SigningKey, SECP256k1, util
+
+from uplink import *
+
+from tests import reference
+
+KEYS = 10
+SAMPLE = 50
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    keys = [SigningKey.generate(curve=SECP256k1) for _ in range(KEYS)]
+    signers = [Signer(sk) for sk in keys]
+    items = []
+    for i in range(count):
+        msg = TransferAssetHeader(reference.assetAddr, reference.toAddr, i).to_binary()
+        signer = signers[i % KEYS]
+        items.append((signer.verifying_key, pack_signature(*signer.sign(msg)), msg))
+
+    def baseline():
+        for public_key, signature, msg in items[:SAMPLE]:
+            sig = util.sigencode_string(*unpack_signature(signature), order=order)
+            public_key.verify(sig, msg, hashfunc=sha3.sha3_256)
+
+    per_signature = timeit.timeit(baseline, number=1) / SAMPLE
+    print("ecdsa_verify: {:8.1f} s for {} signatures (extrapolated)".format(per_signature * count, count))
+
+    start = timeit.default_timer()
+    assert all(verify_many(items, processes=processes))
+    print(" verify_many: {:8.1f} s for {} signatures".format(timeit.default_timer() - start, count))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from distutils.core import setup
+from setuptools import setup
 
 exec(open('uplink/version.py').read())
 setup(name='Uplink SDK py',
@@ -15,7 +15,11 @@ setup(name='Uplink SDK py',
           "ecdsa == 0.13",
           "pytest >= 2.6.4",
           "pysha3 >= 1.0.2",
-          "base58 == 0.2.5",
-          'typing'
-      ]
+          'typing',
+          'futures; python_version < "3"'
+      ],
+      extras_require={
+          'aio': ['aiohttp; python_version >= "3.5"'],
+          'holdings': ['numpy'],
+      }
       )
@@ -0,0 +1,8 @@
+import sys
+from typing import List  # noqa: F401
+
+# The asyncio client and its tests use async/await syntax, a SyntaxError
+# before Python 3.5 even when aiohttp is missing
+collect_ignore = []  # type: List[str]
+if sys.version_info < (3, 5):
+    collect_ignore.append("test_aio.py")
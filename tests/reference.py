@@ -126,3 +126,35 @@ testCreateAsset = _testCreateAsset()
 testCreateContract = _testCreateContract()
 testRevokeAccount = _testRevokeAccount()
 testBind = _testBind()
+
+#------------------------------------------------------------------------
+# Responses
+#------------------------------------------------------------------------
+
+
+def testBlock(index, transactions=None):
+    return {
+        "index": index,
+        "header": {
+            "origin": testAddr,
+            "merkleRoot": "merkle{}".format(index),
+            "timestamp": testTimestamp + index,
+            "prevHash": "hash{}".format(index - 1),
+        },
+        "signatures": [],
+        "transactions": transactions or [],
+    }
+
+
+def testAsset(address=assetAddr, holdings=None):
+    return {
+        "address": address,
+        "issuedOn": testTimestamp,
+        "assetType": {"tag": "Discrete", "contents": None},
+        "name": "Test Asset",
+        "reference": "Token",
+        "supply": 1000,
+        "holdings": holdings or {testAddr: 1000},
+        "issuer": testAddr,
+        "metadata": {},
+    }
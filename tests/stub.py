@@ -0,0 +1,78 @@
+import json
+import threading
+
+from six.moves import socketserver
+from six.moves.BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+
+# ------------------------------------------------------------------------
+# Stub Uplink node
+# ------------------------------------------------------------------------
+
+
+class StubNode(socketserver.ThreadingMixIn, HTTPServer):
+    """
+    Local HTTP server answering Uplink RPCs with canned responses.
+
+    ``routes`` maps an endpoint path (without leading slash) to either a
+    response dict or a function taking the decoded request and returning one.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, routes=None):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), _StubHandler)
+        self.routes = routes or {}
+        self.requests = []
+        self.connections = set()
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, args=(0.01,))
+        self.thread.daemon = True
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length).decode())
+        path = self.path.lstrip('/')
+
+        with self.server.lock:
+            self.server.requests.append((path, request))
+            self.server.connections.add(self.client_address)
+
+        route = self.server.routes.get(path)
+        if route is None:
+            status, response = 404, {"tag": "RPCRespError", "contents": "Not found"}
+        else:
+            status, response = 200, route(request) if callable(route) else route
+
+        body = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def ok(contents):
+    return {"tag": "RPCResp", "contents": contents}
+
+
+def tx_ok(tx_hash):
+    return {"tag": "RPCTransactionOK", "txHash": tx_hash}
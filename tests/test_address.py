@@ -1,7 +1,21 @@
-from uplink.cryptography import derive_account_address
+from ecdsa import SigningKey, SECP256k1
+
+from uplink.cryptography import derive_account_address, derive_account_addresses
 
 from . import reference
 
 
 def test_address_derive():
     assert derive_account_address(reference.vkey) == reference.testAddr
+
+
+def test_address_derive_many():
+    keys = [SigningKey.generate(curve=SECP256k1).verifying_key for _ in range(3)]
+    pubkeys = keys + [reference.vkey, keys[0]]
+
+    addresses = derive_account_addresses(pubkeys)
+    assert addresses == [derive_account_address(key) for key in pubkeys]
+    assert addresses[3] == reference.testAddr
+    assert addresses[4] == addresses[0]
+    assert len(set(addresses)) == 4
+    assert derive_account_addresses(pubkeys) == addresses
@@ -0,0 +1,116 @@
+import time
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from uplink.aio import AsyncUplinkJsonRpc  # noqa: E402
+from uplink.protocol import Block, CompactBlock, VInt  # noqa: E402
+
+from . import reference  # noqa: E402
+from .stub import StubNode, ok, tx_ok  # noqa: E402
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_blocks():
+    with StubNode({'blocks': ok([reference.testBlock(0), reference.testBlock(1)])}) as node:
+        async def main():
+            async with AsyncUplinkJsonRpc(port=node.port) as rpc:
+                return await rpc.uplink_blocks()
+
+        blocks = run(main())
+
+    assert [b.index for b in blocks] == [0, 1]
+    assert all(isinstance(b, Block) for b in blocks)
+
+
+def test_compact_blocks():
+    with StubNode({'blocks': ok([reference.testBlock(0)])}) as node:
+        async def main():
+            async with AsyncUplinkJsonRpc(port=node.port, compact=True) as rpc:
+                return await rpc.uplink_blocks()
+
+        blocks = run(main())
+
+    assert type(blocks[0]) is CompactBlock
+
+
+def test_concurrent_calls_share_pool():
+    routes = dict(('blocks/{}'.format(i), ok(reference.testBlock(i))) for i in range(50))
+    with StubNode(routes) as node:
+        async def main():
+            async with AsyncUplinkJsonRpc(port=node.port, pool_size=4) as rpc:
+                return await asyncio.gather(*[rpc.uplink_block(i) for i in range(50)])
+
+        results = run(main())
+
+    assert [b.index for b in results] == list(range(50))
+    assert len(node.requests) == 50
+    assert len(node.connections) <= 4
+
+
+def test_single_flight():
+    with StubNode({'version': ok("1.0")}) as node:
+        async def main():
+            async with AsyncUplinkJsonRpc(port=node.port) as rpc:
+                results = await asyncio.gather(*[rpc.uplink_version() for _ in range(8)])
+                results.append(await rpc.uplink_version())
+                return results
+
+        results = run(main())
+
+    assert results == [ok("1.0")] * 9
+    assert len(set(map(id, results))) == 9
+    assert len(node.requests) == 2
+
+
+def test_transfer_asset():
+    with StubNode({'': tx_ok("abc")}) as node:
+        async def main():
+            async with AsyncUplinkJsonRpc(port=node.port) as rpc:
+                return await rpc.uplink_transfer_asset(reference.skey, reference.testAddr,
+                                                       reference.toAddr, 5, reference.assetAddr)
+
+        tx_hash = run(main())
+
+    assert tx_hash == "abc"
+    path, request = node.requests[0]
+    assert request["params"]["header"]["contents"]["contents"]["balance"] == 5
+
+
+def test_sim_call():
+    with StubNode({'': {"tag": "RPCRespOK", "contents": None}}) as node:
+        async def main():
+            async with AsyncUplinkJsonRpc(port=node.port) as rpc:
+                return await rpc.uplink_sim_call("sim", reference.testAddr, "setX", [VInt(1)])
+
+        run(main())
+
+    path, request = node.requests[0]
+    assert request["method"] == "Simulate"
+    assert request["params"]["contents"]["contents"]["contents"]["methodArgs"] == [{"tag": "VInt", "contents": 1}]
+
+
+def test_single_flight_leader_cancelled():
+    def slow_version(request):
+        time.sleep(0.2)
+        return ok("1.0")
+
+    with StubNode({'version': slow_version}) as node:
+        async def main():
+            async with AsyncUplinkJsonRpc(port=node.port) as rpc:
+                leader = asyncio.ensure_future(asyncio.wait_for(rpc.uplink_version(), 0.05))
+                await asyncio.sleep(0)
+                followers = [rpc.uplink_version() for _ in range(3)]
+                with pytest.raises(asyncio.TimeoutError):
+                    await leader
+                return await asyncio.gather(*followers)
+
+        results = run(main())
+
+    assert results == [ok("1.0")] * 3
+    assert len(node.requests) == 1
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from uplink import b58
+
+from . import reference
+
+
+@pytest.mark.parametrize(("raw", "encoded"), [
+    (b"", ""),
+    (b"\0", "1"),
+    (b"\0\0\x01", "112"),
+    (b"hello world", "StV1DL6CwTryKyV"),
+    (b"\xff" * 8, "jpXCZedGfVQ"),
+])
+def test_vectors(raw, encoded):
+    assert b58.b58encode(raw) == encoded
+    assert b58.b58decode(encoded) == raw
+    assert b58.b58decode(encoded.encode()) == raw
+
+
+def test_roundtrip():
+    for length in range(0, 70):
+        raw = b"\0" * (length % 3) + os.urandom(length)
+        assert b58.b58decode(b58.b58encode(raw)) == raw
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        b58.b58decode("0OIl")
+    with pytest.raises(TypeError):
+        b58.b58encode(u"text")
+
+
+def test_address_cache():
+    raw = b58.decode_address(reference.assetAddr)
+    assert len(raw) == 32
+    assert b58.decode_address(reference.assetAddr) is raw
+    assert b58.encode_address(raw) == reference.assetAddr
@@ -64,3 +64,38 @@ def test_call_arg_length(arg_count):
 def test_bind():
     tx = reference.testBind
     golden_binary("tx_bind.bin", tx)
+
+
+def test_to_binary_into():
+    txs = [reference.testTransfer, reference.testCreateAccount, reference.testCreateAsset,
+           reference.testCall(reference.test_args), reference.testBind] + reference.test_args
+    buf = bytearray(sum(tx.binary_size() for tx in txs) + 3)
+    view = memoryview(buf)
+
+    offset = 3
+    for tx in txs:
+        end = tx.to_binary_into(view, offset)
+        assert end - offset == tx.binary_size()
+        assert bytes(buf[offset:end]) == tx.to_binary()
+        offset = end
+    assert offset == len(buf)
+
+
+def test_call_template():
+    template = CallTemplate(reference.testAddr, "get")
+    for args in [[], reference.test_args, [VInt(1)] * 3]:
+        hdr = template.header(args)
+        expected = reference.testCall(args)
+        assert hdr.to_binary() == expected.to_binary()
+        assert hdr.to_dict() == expected.to_dict()
+        assert template.sign(reference.skey, args, k=reference.nonce) == expected.sign(reference.skey, k=reference.nonce)
+
+    with pytest.raises(AttributeError):
+        template.method = "set"
+    hdr = template.header([])
+    hdr.method = "set"
+    assert hdr.to_binary() == CallHeader(reference.testAddr, "set", []).to_binary()
+
+
+def test_asset_ref():
+    golden_binary("asset_ref.hex", AssetRef("Token"))
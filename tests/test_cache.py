@@ -0,0 +1,199 @@
+from uplink.cache import LRUCache, ReadCache, InternTable
+
+from . import reference
+from .stub import StubNode, ok, tx_ok
+from uplink import UplinkJsonRpc, TxAsset, Transfer
+
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get("b", "missing") == "missing"
+    assert len(cache) == 2
+
+
+def test_lru_update():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 3)
+    cache.put("c", 4)
+    assert cache.get("a") == 3
+    assert "b" not in cache
+
+    assert cache.pop("a") == 3
+    cache.clear()
+    assert len(cache) == 0
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_read_cache_ttl():
+    clock = Clock()
+    cache = ReadCache({'assets': 1.0}, clock=clock)
+    cache.put("assets/abc", "asset")
+    cache.put("blocks/1", "block")
+
+    assert cache.get("assets/abc") == "asset"
+    assert cache.get("blocks/1") is None
+
+    clock.now = 1.5
+    assert cache.get("assets/abc") is None
+    assert len(cache) == 0
+
+
+def test_read_cache_invalidate():
+    cache = ReadCache()
+    cache.put("assets/abc", 1)
+    cache.put("contracts/abc/callable", 2)
+    cache.put("accounts/xyz", 3)
+
+    cache.invalidate("abc")
+    assert cache.get("assets/abc") is None
+    assert cache.get("contracts/abc/callable") is None
+    assert cache.get("accounts/xyz") == 3
+
+
+def test_read_cache_invalidate_write():
+    cache = ReadCache()
+    cache.put("assets", [1])
+    cache.put("accounts/abc", 2)
+    cache.put("accounts/xyz", 3)
+
+    cache.invalidate_write("tx", ["abc"])
+    assert cache.get("assets") is None
+    assert cache.get("accounts/abc") is None
+    assert cache.get("accounts/xyz") == 3
+
+    # Fetched again before the transaction was applied
+    cache.put("assets", [1])
+    cache.put("accounts/abc", 2)
+    cache.processed("tx")
+    assert cache.get("assets") is None
+    assert cache.get("accounts/abc") is None
+
+    cache.put("assets", [1])
+    cache.processed("tx")
+    assert cache.get("assets") == [1]
+
+
+def test_read_cache_copies():
+    cache = ReadCache()
+    response = {"contents": {"holdings": {"a": 1}}}
+    cache.put("assets/abc", response)
+    response["contents"]["holdings"]["a"] = 2
+
+    cached = cache.get("assets/abc")
+    assert cached == {"contents": {"holdings": {"a": 1}}}
+    cached["contents"]["holdings"]["a"] = 3
+    assert cache.get("assets/abc") == {"contents": {"holdings": {"a": 1}}}
+
+    cache.ttls['version'] = 0
+    assert ReadCache().ttls['version'] == 60.0
+
+
+def test_client_cache():
+    asset = 'assets/{}'.format(reference.assetAddr)
+    with StubNode({asset: ok(reference.testAsset()), 'version': ok("1.0"), '': tx_ok("abc")}) as node:
+        rpc = UplinkJsonRpc(port=node.port, cache=ReadCache())
+        for _ in range(3):
+            assert rpc.uplink_get_asset(reference.assetAddr).name == "Test Asset"
+            rpc.uplink_version()
+        assert [path for path, request in node.requests] == [asset, 'version']
+
+        rpc.uplink_transfer_asset(reference.skey, reference.testAddr, reference.toAddr, 5, reference.assetAddr)
+        rpc.uplink_get_asset(reference.assetAddr)
+        rpc.uplink_version()
+        assert [path for path, request in node.requests][2:] == ['', asset]
+
+
+def test_client_cache_listings():
+    status = 'transactions/status/abc'
+    routes = {'assets': ok([reference.testAsset()]), status: ok("Accepted"), '': tx_ok("abc")}
+    with StubNode(routes) as node:
+        rpc = UplinkJsonRpc(port=node.port, cache=ReadCache())
+        rpc.uplink_assets()[0].holdings[reference.toAddr] = 1
+        assert reference.toAddr not in rpc.uplink_assets()[0].holdings
+
+        rpc.uplink_transfer_asset(reference.skey, reference.testAddr, reference.toAddr, 5, reference.assetAddr)
+        rpc.uplink_assets()
+        rpc.uplink_get_transaction_status("abc")
+        rpc.uplink_assets()
+        assert [path for path, request in node.requests] == ['assets', '', 'assets', status, 'assets']
+
+
+def test_intern_table():
+    strings = InternTable(maxsize=2)
+    a = strings.intern("".join(["ad", "dr"]))
+    assert strings.intern("".join(["ad", "dr"])) is a
+
+    strings.intern("b")
+    assert strings.intern("".join(["ad", "dr"])) is a
+    strings.intern("c")
+    assert len(strings) == 2
+    assert strings.intern("".join(["ad", "dr"])) is a
+
+    tree = strings.intern_tree({"".join(["ta", "g"]): ["x" * 100, 1, None]})
+    assert tree == {"tag": ["x" * 100, 1, None]}
+
+
+def test_client_interns_responses():
+    holdings = {reference.toAddr: 10, reference.testAddr: 20}
+    routes = {
+        'assets/a': ok(reference.testAsset(holdings=holdings)),
+        'assets/b': ok(reference.testAsset(holdings=holdings)),
+    }
+    with StubNode(routes) as node:
+        rpc = UplinkJsonRpc(port=node.port, strings=InternTable())
+        first = rpc.uplink_get_asset('a')
+        second = rpc.uplink_get_asset('b')
+
+    assert first.holdings == holdings
+    assert first.issuer is second.issuer
+    assert sorted(first.holdings)[0] is sorted(second.holdings)[0]
+
+
+def test_client_interned_endpoints():
+    routes = {'assets/a': ok(reference.testAsset()), 'version': ok("1.0"), '': tx_ok("abc")}
+    with StubNode(routes) as node:
+        strings = InternTable()
+        rpc = UplinkJsonRpc(port=node.port, strings=strings)
+        rpc.uplink_version()
+        rpc.uplink_transfer_asset(reference.skey, reference.testAddr, reference.toAddr, 5, reference.assetAddr)
+        assert len(strings) == 0
+        rpc.uplink_get_asset('a')
+        assert len(strings) > 0
+
+        assert UplinkJsonRpc(port=node.port, strings=False).uplink_get_asset('a').name == "Test Asset"
+
+
+def test_client_interns_blocks_and_mempool():
+    tx = reference.testTx(TxAsset, Transfer, reference.testTransfer).to_dict()
+    routes = {
+        'blocks': ok([reference.testBlock(0, [tx]), reference.testBlock(1, [tx])]),
+        'transactions/pool': ok({"size": 1, "transactions": [tx]}),
+        'transactions/invalid': ok([]),
+    }
+    with StubNode(routes) as node:
+        strings = InternTable()
+        rpc = UplinkJsonRpc(port=node.port, strings=strings)
+        rpc.uplink_get_invalid_transactions()
+        assert len(strings) == 0
+
+        first, second = rpc.uplink_blocks()
+        assert first.transactions[0].origin is second.transactions[0].origin
+        pool = rpc._call('GET', endpoint='transactions/pool')['contents']
+        assert pool['transactions'][0]['origin'] is first.transactions[0].origin
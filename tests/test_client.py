@@ -0,0 +1,164 @@
+import time
+import threading
+
+import pytest
+
+from uplink import *
+from uplink.transport import HttpTransport
+
+from . import reference
+from .stub import StubNode, ok, tx_ok
+
+
+def test_connections_are_reused():
+    with StubNode({'version': ok("1.0")}) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        for _ in range(5):
+            assert rpc.uplink_version() == ok("1.0")
+        rpc.close()
+
+    assert len(node.requests) == 5
+    assert len(node.connections) == 1
+
+
+def test_issue_transaction():
+    with StubNode({'': tx_ok("abc")}) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        tx_hash = rpc.uplink_transfer_asset(reference.skey, reference.testAddr,
+                                            reference.toAddr, 5, reference.assetAddr)
+
+    assert tx_hash == "abc"
+    path, request = node.requests[0]
+    assert request["method"] == "Transaction"
+    assert request["params"]["origin"] == reference.testAddr
+
+
+def test_bad_status_code():
+    with StubNode() as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        with pytest.raises(BadStatusCodeError):
+            rpc.uplink_version()
+
+
+def test_connection_failure():
+    with StubNode() as node:
+        port = node.port
+
+    rpc = UplinkJsonRpc(port=port, transport=HttpTransport(connect_timeout=1, retries=1))
+    with pytest.raises(RpcConnectionFail):
+        rpc.uplink_version()
+
+
+def test_submit_many():
+    def issue(request):
+        balance = request["params"]["header"]["contents"]["contents"]["balance"]
+        if balance < 0:
+            return {"tag": "RPCTransactionError", "contents": "Invalid balance"}
+        return tx_ok("tx{}".format(balance))
+
+    items = [(reference.skey, reference.testAddr,
+              TransferAssetHeader(reference.assetAddr, reference.toAddr, balance))
+             for balance in [1, 2, -3, 4]]
+    items.append(reference.testTx(TxAsset, Transfer, reference.testTransfer))
+
+    with StubNode({'': issue}) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        tx_hashes, errors = rpc.submit_many(items, concurrency=2)
+
+    assert tx_hashes == ["tx1", "tx2", None, "tx4", "tx5"]
+    assert [e is None for e in errors] == [True, True, False, True, True]
+    assert isinstance(errors[2], UplinkJsonRpcError)
+    assert len(node.requests) == 5
+
+
+def block_routes(count):
+    routes = {'blocks/{}'.format(i): ok(reference.testBlock(i)) for i in range(count)}
+    routes['blocks/{}'.format(count)] = {"tag": "RPCRespError", "contents": "No block"}
+    return routes
+
+
+def test_iter_blocks():
+    with StubNode(block_routes(20)) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        blocks = list(rpc.iter_blocks(prefetch=4))
+        assert [block.index for block in blocks] == list(range(20))
+        assert blocks[3].header.merkleRoot == "merkle3"
+
+        blocks = rpc.iter_blocks(start=5, stop=8)
+        assert [block.index for block in blocks] == [5, 6, 7]
+
+
+def test_iter_blocks_error():
+    with StubNode(block_routes(3)) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        with pytest.raises(UplinkJsonRpcError):
+            list(rpc.iter_blocks(stop=5))
+
+
+def test_transactions_decoded_on_access():
+    tx = reference.testTx(TxAsset, Transfer, reference.testTransfer).to_dict()
+    with StubNode({'transactions/3': ok([tx, tx])}) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        transactions = rpc.uplink_transactions(3)
+
+    assert len(transactions) == 2
+    assert transactions[0].header.contents.contents.toAddr == reference.toAddr
+
+
+def test_call_template():
+    template = CallTemplate(reference.testAddr, "set")
+    with StubNode({'': tx_ok("abc")}) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        assert rpc.uplink_call_template(reference.skey, reference.testAddr, template, [VInt(7)]) == "abc"
+
+    path, request = node.requests[0]
+    hdr = CallHeader(reference.testAddr, "set", [VInt(7)])
+    assert request["params"]["header"] == TxContract(Call(hdr)).to_dict()
+
+
+def test_single_flight():
+    def slow_version(request):
+        time.sleep(0.2)
+        return ok("1.0")
+
+    with StubNode({'version': slow_version}) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        start = threading.Event()
+        results = []
+
+        def query():
+            start.wait()
+            results.append(rpc.uplink_version())
+
+        threads = [threading.Thread(target=query) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [ok("1.0")] * 8
+        assert len(set(map(id, results))) == 8
+        assert len(node.requests) == 1
+
+        rpc.uplink_version()
+        assert len(node.requests) == 2
+
+
+def test_compact_models():
+    tx = reference.testTx(TxAsset, Transfer, reference.testTransfer).to_dict()
+    routes = {
+        'blocks': ok([reference.testBlock(0, [tx])]),
+        'assets': ok([reference.testAsset()]),
+        'transactions/0': ok([tx]),
+    }
+    with StubNode(routes) as node:
+        rpc = UplinkJsonRpc(port=node.port, compact=True)
+        block, = rpc.uplink_blocks()
+        asset, = rpc.uplink_assets()
+        assert type(block) is CompactBlock
+        assert type(block.transactions[0]) is CompactTransaction
+        assert type(asset) is CompactAsset
+        assert type(rpc.uplink_transactions(0)[0]) is CompactTransaction
+
+        assert type(UplinkJsonRpc(port=node.port).uplink_assets()[0]) is Asset
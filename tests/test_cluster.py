@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from uplink import *
+from uplink.cluster import LEAST_LATENCY
+
+from . import reference
+from .stub import StubNode, ok, tx_ok
+
+
+def nodes(*stubs):
+    return [('127.0.0.1', stub.port) for stub in stubs]
+
+
+def test_round_robin_reads():
+    with StubNode({'version': ok("a")}) as a, StubNode({'version': ok("b")}) as b:
+        rpc = UplinkClusterRpc(nodes(a, b))
+        versions = [rpc.uplink_version()["contents"] for _ in range(4)]
+        rpc.close()
+
+    assert sorted(versions) == ["a", "a", "b", "b"]
+
+
+def test_writes_go_to_preferred_node():
+    with StubNode({'': tx_ok("a")}) as a, StubNode({'': tx_ok("b")}) as b:
+        rpc = UplinkClusterRpc(nodes(a, b))
+        for _ in range(3):
+            tx_hash = rpc.uplink_transfer_asset(reference.skey, reference.testAddr,
+                                                reference.toAddr, 5, reference.assetAddr)
+            assert tx_hash == "a"
+        rpc.close()
+
+    assert len(b.requests) == 0
+
+
+def test_failover_and_ejection():
+    with StubNode({'version': ok("b"), '': tx_ok("b")}) as b:
+        with StubNode() as down:
+            port = down.port
+        rpc = UplinkClusterRpc([('127.0.0.1', port)] + nodes(b), max_failures=1)
+
+        assert rpc.uplink_version()["contents"] == "b"
+        assert not rpc.nodes[0].healthy(time.time())
+
+        # Writes move on to the next node while the preferred one is ejected
+        tx_hash = rpc.uplink_transfer_asset(reference.skey, reference.testAddr, reference.toAddr, 5,
+                                            reference.assetAddr)
+        assert tx_hash == "b"
+        rpc.close()
+
+
+def test_not_retried_on_client_errors():
+    with StubNode() as a, StubNode() as b:
+        rpc = UplinkClusterRpc(nodes(a, b))
+        with pytest.raises(BadStatusCodeError):
+            rpc.uplink_version()
+        rpc.close()
+
+    assert len(a.requests) + len(b.requests) == 1
+
+
+def test_slow_node_ejected():
+    def slow(request):
+        time.sleep(0.1)
+        return ok("slow")
+
+    with StubNode({'version': slow}) as a, StubNode({'version': ok("fast")}) as b:
+        rpc = UplinkClusterRpc(nodes(a, b), strategy=LEAST_LATENCY, slow_latency=0.05)
+        rpc.check_health()
+        assert [node.healthy(time.time()) for node in rpc.nodes] == [False, True]
+        assert all(rpc.uplink_version()["contents"] == "fast" for _ in range(3))
+        rpc.close()
+
+
+def test_from_peers():
+    peers = [{"tag": "Peer", "contents": {"peerPid": "nid://10.0.0.2:8001:0", "peerAccAddr": reference.testAddr}}]
+    with StubNode({'peers': ok(peers)}) as seed:
+        rpc = UplinkClusterRpc.from_peers('127.0.0.1', seed.port)
+
+    assert [(node.host, node.port) for node in rpc.nodes] == [('127.0.0.1', seed.port), ('10.0.0.2', seed.port)]
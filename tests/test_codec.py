@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+import uplink.codec as codec_module
+from uplink.codec import JsonCodec, OrjsonCodec, default_codec, orjson
+
+from . import reference
+
+codecs = [JsonCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+
+
+@pytest.mark.parametrize(("codec"), codecs, ids=lambda codec: codec.name)
+def test_roundtrip(codec):
+    tx = reference.testTx(reference.TxAsset, reference.Transfer, reference.testTransfer)
+    obj = {"method": "Transaction", "params": tx.to_dict(), "signature": b"abc", "big": 2 ** 70}
+
+    body = codec.dumps(obj)
+    assert isinstance(body, bytes)
+
+    expected = dict(obj, signature="abc")
+    assert json.loads(body.decode()) == expected
+    assert codec.loads(JsonCodec().dumps(tx.to_dict())) == tx.to_dict()
+
+
+def test_default_codec():
+    assert default_codec().name == ("json" if orjson is None else "orjson")
+
+
+def test_orjson_missing(monkeypatch):
+    monkeypatch.setattr(codec_module, "orjson", None)
+    with pytest.raises(ImportError):
+        OrjsonCodec()
+    assert default_codec().name == "json"
+
+
+@pytest.mark.parametrize(("codec"), codecs, ids=lambda codec: codec.name)
+def test_big_integers(codec):
+    numbers = [2 ** 64, 2 ** 64 - 1, -2 ** 63 - 1, 10 ** 30, 10 ** 18, 12345]
+    assert codec.loads(json.dumps({"contents": numbers}).encode()) == {"contents": numbers}
+    assert codec.loads(b'{"a": 1.5e300, "b": "12345678901234567890"}') == {"a": 1.5e300, "b": "12345678901234567890"}
@@ -0,0 +1,81 @@
+import glob
+
+import hexdump
+import pytest
+
+from uplink import *
+from uplink.decoding import decode_header, decode_value, iter_headers
+
+from . import reference
+
+golden_output = "tests/golden/"
+
+
+def golden_bytes(fname):
+    with open(fname, 'r') as fd:
+        return hexdump.restore(fd.read())
+
+
+@pytest.mark.parametrize(("fname"), sorted(glob.glob(golden_output + "*.bin")))
+def test_golden_roundtrip(fname):
+    data = golden_bytes(fname)
+    header, offset = decode_header(data)
+    assert offset == len(data)
+    assert header.to_binary() == data
+
+
+def test_decode_call_args():
+    header, offset = decode_header(reference.testCall(reference.test_args).to_binary())
+    assert header.address == reference.testAddr
+    assert header.method == "get"
+    assert header.args == reference.test_args
+
+
+def test_decode_headers():
+    hdr = reference.testTransfer
+    decoded, _ = decode_header(hdr.to_binary())
+    assert decoded.to_dict() == hdr.to_dict()
+
+    hdr = reference.testCreateAsset
+    decoded, _ = decode_header(hdr.to_binary())
+    assert decoded.assetName == hdr.assetName
+    assert decoded.metadata == hdr.metadata
+
+
+@pytest.mark.parametrize(("value"), [
+    VFixed(Decimal("-12.50"), 2),
+    VDateTime(datetime.datetime(2018, 2, 3, 10, 30, 5)),
+    VMsg(""),
+])
+def test_decode_value(value):
+    data = b"\x00" + value.to_binary()
+    assert decode_value(data, 1) == (value, len(data))
+
+
+def test_iter_headers():
+    headers = [reference.testTransfer, reference.testCreateAccount, reference.testCall([VInt(1)]),
+               reference.testRevokeAccount, reference.testCreateContract]
+    archive = b"".join(hdr.to_binary() for hdr in headers)
+
+    decoded = list(iter_headers(archive))
+    assert [type(hdr) for hdr in decoded] == [type(hdr) for hdr in headers]
+    assert b"".join(hdr.to_binary() for hdr in decoded) == archive
+
+
+@pytest.mark.parametrize(("hdr"), [
+    reference.testCreateContract,
+    reference.testTransfer,
+    reference.testRevokeAccount,
+    reference.testCreateAsset,
+    reference.testCall([VInt(1)]),
+    reference.testCall([VFixed(Decimal('123456.78'), 2)]),
+])
+def test_truncated(hdr):
+    data = hdr.to_binary()
+    for length in (1, len(data) - 1):
+        with pytest.raises(ValueError):
+            decode_header(data[:length])
+    with pytest.raises(ValueError):
+        decode_value(VInt(1).to_binary()[:-1])
+    with pytest.raises(ValueError):
+        decode_value(VFixed(Decimal('123456.78'), 2).to_binary()[:-1])
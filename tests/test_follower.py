@@ -0,0 +1,62 @@
+import pytest
+
+from uplink import *
+
+from . import reference
+
+
+class FakeChain(object):
+    """Chain of blocks served like UplinkJsonRpc would"""
+
+    def __init__(self, length):
+        self.blocks = [reference.testBlock(i) for i in range(length)]
+        self.requests = []
+
+    def uplink_block(self, block_id):
+        self.requests.append(block_id)
+        if block_id >= len(self.blocks):
+            raise UplinkJsonRpcError("RPCRespError", "No block")
+        return Block(**self.blocks[block_id])
+
+    def uplink_transactions(self, block_id=0):
+        return []
+
+
+def test_follow_new_blocks():
+    chain = FakeChain(5)
+    follower = ChainFollower(chain, prefetch=2)
+
+    delivered = []
+    assert follower.poll(lambda block, txs: delivered.append(block.index)) == 5
+    assert delivered == [0, 1, 2, 3, 4]
+
+    chain.blocks.extend(reference.testBlock(i) for i in range(5, 7))
+    del chain.requests[:]
+    assert [block.index for block, txs in follower.iter_new()] == [5, 6]
+    # Only the last processed block and the new ones are fetched
+    assert min(chain.requests) == 4
+
+
+def test_checkpoint(tmpdir):
+    path = str(tmpdir.join("checkpoint.json"))
+    chain = FakeChain(3)
+
+    for block, txs in ChainFollower(chain, checkpoint=path).iter_new():
+        if block.index == 1:
+            break
+
+    # Block 1 was not processed before the consumer stopped
+    follower = ChainFollower(chain, checkpoint=path)
+    assert follower.index == 1
+    assert [block.index for block, txs in follower.iter_new()] == [1, 2]
+
+
+def test_discontinuity():
+    chain = FakeChain(3)
+    follower = ChainFollower(chain)
+    follower.poll(lambda block, txs: None)
+
+    chain.blocks[2]["header"]["merkleRoot"] = "rewritten"
+    with pytest.raises(ChainDiscontinuity) as exc:
+        list(follower.iter_new())
+    assert exc.value.index == 2
@@ -0,0 +1,71 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from uplink import Asset  # noqa: E402
+from uplink.holdings import AssetHoldingsTable  # noqa: E402
+
+from . import reference  # noqa: E402
+
+
+def holdings_table():
+    copper = Asset(**reference.testAsset(address="copper"))
+    copper.holdings = {}
+    assets = [
+        Asset(**reference.testAsset(address="gold", holdings={"alice": 10, "bob": 5})),
+        Asset(**reference.testAsset(address="silver", holdings={"bob": 30, "carol": 1, "dave": 7})),
+        copper,
+    ]
+    return AssetHoldingsTable(assets)
+
+
+def test_totals():
+    table = holdings_table()
+    assert len(table) == 5
+    assert table.assets == ["gold", "silver", "copper"]
+    assert sorted(table.accounts) == ["alice", "bob", "carol", "dave"]
+
+    totals = dict(zip(table.accounts, table.totals().tolist()))
+    assert totals == {"alice": 10, "bob": 35, "carol": 1, "dave": 7}
+    assert table.total("bob") == 35
+    assert table.total("erin") == 0
+    assert table.asset_totals().tolist() == [15, 38, 0]
+
+
+def test_top_holders():
+    table = holdings_table()
+    assert table.top_holders(2) == [("bob", 35), ("alice", 10)]
+    assert table.top_holders(10, asset="silver") == [("bob", 30), ("dave", 7), ("carol", 1)]
+    assert table.top_holders(1, asset="gold") == [("alice", 10)]
+    assert table.top_holders(3, asset="copper") == []
+
+    with pytest.raises(ValueError):
+        table.top_holders(1, asset="lead")
+
+
+def test_quantile():
+    table = holdings_table()
+    assert table.quantile(0.5, asset="silver") == 7
+    assert table.quantile([0, 1]).tolist() == [1, 35]
+
+
+def test_join():
+    table = holdings_table()
+    joined = table.join(["dave", "erin", "bob"], assets=["silver", "gold", "lead"])
+    assert joined.tolist() == [[7, 0, 0], [0, 0, 0], [30, 5, 0]]
+    assert table.join(["alice"]).tolist() == [[10, 0, 0]]
+
+
+def test_join_repeated():
+    table = holdings_table()
+    joined = table.join(["bob", "zoe", "bob", "dave"], assets=["gold", "silver", "gold"])
+    assert joined.tolist() == [[5, 30, 5], [0, 0, 0], [5, 30, 5], [0, 7, 0]]
+    assert table.join([], assets=["gold"]).shape == (0, 1)
+    assert AssetHoldingsTable([]).join(["bob"]).tolist() == [[]]
+
+
+def test_empty():
+    table = AssetHoldingsTable([])
+    assert len(table) == 0
+    assert table.top_holders(5) == []
+    assert table.totals().tolist() == []
@@ -113,3 +113,83 @@ def test_call_arg_length(arg_count):
 def test_bind():
     tx = reference.testTx(TxAsset, Bind, reference.testBind)
     golden_json('tx_bind.json', tx)
+
+
+def test_compact_response_models():
+    tx = reference.testTx(TxAsset, Transfer, reference.testTransfer).to_dict()
+    block = CompactBlock(**reference.testBlock(3, [tx]))
+    asset = CompactAsset(**reference.testAsset())
+
+    assert not hasattr(block, '__dict__')
+    assert not hasattr(block.header, '__dict__')
+    assert not hasattr(asset, '__dict__')
+    assert block.header.merkleRoot == "merkle3"
+
+    assert block.to_dict() == Block(**reference.testBlock(3, [tx])).to_dict()
+    assert asset.to_dict() == Asset(**reference.testAsset()).to_dict()
+    assert CompactTransaction(**tx).to_dict() == Transaction(**tx).to_dict() == tx
+    assert type(block.transactions[0]) is CompactTransaction
+    assert not hasattr(block.transactions[0], '__dict__')
+
+
+def test_response_models_accept_attributes():
+    metadata = {"name": "test"}
+    account = Account(0, "key", metadata, reference.testAddr)
+    account.private_key = reference.skey
+    assert account.metadata == metadata
+    assert account.metadata is not metadata
+
+    block = Block(**reference.testBlock(3))
+    block.note = "seen"
+    assert block.to_dict()["note"] == "seen"
+
+
+@pytest.mark.parametrize(("tx_type", "wrapper", "hdr"), [
+    (TxAsset, Transfer, reference.testTransfer),
+    (TxAccount, CreateAccount, reference.testCreateAccount),
+    (TxAsset, CreateAsset, reference.testCreateAsset),
+    (TxContract, CreateContract, reference.testCreateContract),
+    (TxAccount, RevokeAccount, reference.testRevokeAccount),
+    (TxAsset, Bind, reference.testBind),
+    (TxContract, Call, reference.testCall(reference.test_args)),
+])
+def test_transaction_from_dict(tx_type, wrapper, hdr):
+    tx = reference.testTx(tx_type, wrapper, hdr).to_dict()
+    decoded = Transaction.from_dict(tx)
+
+    assert isinstance(decoded.header, tx_type)
+    assert isinstance(decoded.header.contents, wrapper)
+    assert decoded.header.contents.contents.to_binary() == hdr.to_binary()
+    assert decoded.to_dict() == tx
+
+
+def test_unknown_header_from_dict():
+    header = {"tag": "TxAsset", "contents": {"tag": "Split", "contents": {}}}
+    assert header_from_dict(header) is header
+
+
+def test_lazy_transactions():
+    txs = [reference.testTx(TxAsset, Transfer, TransferAssetHeader(reference.assetAddr, reference.toAddr, i)).to_dict()
+           for i in range(5)]
+    block = Block(**reference.testBlock(3, txs))
+    transactions = block.transactions
+
+    assert len(transactions) == 5
+    assert not transactions._decoded
+
+    tx = transactions[2]
+    assert isinstance(tx.header, TxAsset)
+    assert tx.header.contents.contents.balance == 2
+    assert transactions[2] is tx
+    assert transactions[-3] is tx
+    assert list(transactions._decoded) == [2]
+
+    assert [t.header.contents.contents.balance for t in transactions[1:3]] == [1, 2]
+    assert [t.header.contents.contents.balance for t in transactions] == list(range(5))
+    with pytest.raises(IndexError):
+        transactions[5]
+    with pytest.raises(IndexError):
+        transactions[-7]
+    assert sorted(transactions._decoded) == list(range(5))
+
+    assert block.to_dict()["transactions"] == txs
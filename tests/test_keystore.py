@@ -0,0 +1,80 @@
+import os
+import stat
+
+import pytest
+
+from uplink import *
+
+from . import reference
+
+
+def test_generate_and_load(tmpdir):
+    path = str(tmpdir.join("keys"))
+    with KeyStore(path) as store:
+        addresses = store.generate(5)
+        assert len(store) == 5
+        sk = store[addresses[2]]
+        assert derive_account_address(sk.verifying_key) == addresses[2]
+
+    with KeyStore(path, cache_size=2) as store:
+        assert set(store) == set(addresses)
+        for address in addresses:
+            assert derive_account_address(store.get(address).verifying_key) == address
+        assert store[addresses[2]].to_string() == sk.to_string()
+
+
+def test_generate_parallel(tmpdir):
+    with KeyStore(str(tmpdir.join("keys"))) as store:
+        addresses = store.generate(8, processes=2)
+        assert len(set(addresses)) == 8
+        assert all(address in store for address in addresses)
+
+
+def test_add(tmpdir):
+    path = str(tmpdir.join("keys"))
+    with KeyStore(path) as store:
+        assert store.add(reference.skey) == reference.testAddr
+
+    with KeyStore(path) as store:
+        sk = store[reference.testAddr]
+        assert sk.to_string() == reference.skey.to_string()
+        assert ecdsa_sign(sk, b"msg", k=reference.nonce) == ecdsa_sign(reference.skey, b"msg", k=reference.nonce)
+
+
+def test_signing_key():
+    sk = signing_key(reference.skey.privkey.secret_multiplier)
+    assert sk.verifying_key.to_string() == reference.vkey.to_string()
+    assert sk.to_pem() == reference.skey.to_pem()
+
+
+def test_file_mode(tmpdir):
+    path = str(tmpdir.join("keys"))
+    with KeyStore(path) as store:
+        store.generate(1)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_unknown_address(tmpdir):
+    with KeyStore(str(tmpdir.join("keys"))) as store:
+        with pytest.raises(ValueError):
+            store.get(reference.testAddr)
+
+
+def test_invalid_secret(tmpdir):
+    path = tmpdir.join("keys")
+    lines = "{} 0\n{} {:x}\n{} zz\n".format(reference.testAddr, reference.toAddr, order, reference.assetAddr)
+    path.write(lines.encode(), mode='wb')
+    with KeyStore(str(path)) as store:
+        with pytest.raises(ValueError):
+            store.get(reference.testAddr)
+        with pytest.raises(ValueError):
+            store.get(reference.toAddr)
+        with pytest.raises(ValueError):
+            store.get(reference.assetAddr)
+
+
+def test_signing_key_range():
+    with pytest.raises(ValueError):
+        signing_key(0)
+    with pytest.raises(ValueError):
+        signing_key(order)
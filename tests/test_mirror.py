@@ -0,0 +1,150 @@
+import copy
+import time
+
+import pytest
+
+from uplink import *
+from uplink.mirror import LedgerMirror, chain_height
+
+from . import reference
+
+
+def contract(address, state="initial"):
+    return Contract(timestamp=reference.testTimestamp, address=address, storage={}, methods=[], script="",
+                    owner=reference.testAddr, state=state, localStorageVars={}, localStorage={})
+
+
+def tx(tx_type, wrapper, hdr):
+    return reference.testTx(tx_type, wrapper, hdr).to_dict()
+
+
+class FakeLedger(object):
+    """Chain and ledger served like UplinkJsonRpc would, with new objects for every call"""
+
+    def __init__(self, length):
+        self.blocks = [reference.testBlock(i) for i in range(length)]
+        self.accounts = [Account("GMT", "key", {}, reference.toAddr)]
+        self.assets = [Asset(**reference.testAsset(holdings={reference.testAddr: 100}))]
+        self.contracts = [contract(reference.testAddr)]
+        self.requests = []
+
+    def add_block(self, *transactions):
+        self.blocks.append(reference.testBlock(len(self.blocks), list(transactions)))
+
+    def uplink_block(self, block_id):
+        self.requests.append(block_id)
+        if block_id >= len(self.blocks):
+            raise UplinkJsonRpcError("RPCRespError", "No block")
+        return Block(**self.blocks[block_id])
+
+    def uplink_transactions(self, block_id=0):
+        return LazyTransactions(self.blocks[block_id]["transactions"])
+
+    def uplink_accounts(self):
+        return copy.deepcopy(self.accounts)
+
+    def uplink_assets(self):
+        return copy.deepcopy(self.assets)
+
+    def uplink_contracts(self):
+        return copy.deepcopy(self.contracts)
+
+    def uplink_get_contract(self, address):
+        return copy.deepcopy([contract for contract in self.contracts if contract.address == address][0])
+
+
+@pytest.mark.parametrize(("length"), [0, 1, 2, 13, 64])
+def test_chain_height(length):
+    ledger = FakeLedger(length)
+    assert chain_height(ledger) == length
+    assert len(ledger.requests) <= 2 * length.bit_length() + 1
+    assert chain_height(ledger, length) == length
+
+
+def test_mirror_applies_blocks():
+    ledger = FakeLedger(2)
+    mirror = LedgerMirror(ledger)
+    assert mirror.bootstrap() == 2
+    assert mirror.update() == 0
+
+    ledger.add_block(
+        tx(TxAsset, Transfer, TransferAssetHeader(reference.assetAddr, reference.toAddr, 30)),
+        tx(TxAsset, Circulate, CirculateAssetHeader(reference.assetAddr, 10)),
+        tx(TxAccount, CreateAccount, reference.testCreateAccount),
+    )
+    ledger.add_block(tx(TxAccount, RevokeAccount, RevokeAccountHeader(reference.toAddr)))
+    assert mirror.staleness() == 2
+
+    assert mirror.update() == 2
+    assert mirror.index == 4
+    assert mirror.staleness() == 0
+
+    assert mirror.balance(reference.assetAddr, reference.testAddr) == 80
+    assert mirror.balance(reference.assetAddr, reference.toAddr) == 30
+    assert mirror.get_asset(reference.assetAddr).supply == 990
+    assert mirror.get_account(reference.testAddr).metadata == dict(stuff="key", bax="foo", fax="bar")
+    assert mirror.get_account(reference.toAddr) is None
+
+    ledger.add_block(tx(TxAsset, RevokeAsset, RevokeAssetHeader(reference.assetAddr)))
+    mirror.update()
+    assert mirror.get_asset(reference.assetAddr) is None
+    assert mirror.balance(reference.assetAddr, reference.toAddr) == 0
+
+
+def test_mirror_reloads_node_state():
+    ledger = FakeLedger(1)
+    mirror = LedgerMirror(ledger)
+    mirror.update()
+    asset = mirror.get_asset(reference.assetAddr)
+
+    ledger.add_block(
+        tx(TxAsset, CreateAsset, reference.testCreateAsset),
+        tx(TxContract, Call, reference.testCall([VInt(1)])),
+    )
+    ledger.assets = [Asset(**reference.testAsset(holdings={reference.testAddr: 1})),
+                     Asset(**reference.testAsset(address=reference.toAddr))]
+    ledger.contracts = [contract(reference.testAddr, state="set")]
+    mirror.update()
+
+    # Known assets keep their mirrored state, new ones are loaded
+    assert mirror.get_asset(reference.assetAddr) is asset
+    assert mirror.get_asset(reference.toAddr).address == reference.toAddr
+    assert mirror.get_contract(reference.testAddr).state == "set"
+
+
+def test_unstable_snapshot():
+    ledger = FakeLedger(1)
+    uplink_assets = ledger.uplink_assets
+
+    def growing_assets():
+        ledger.add_block()
+        return uplink_assets()
+    ledger.uplink_assets = growing_assets
+
+    with pytest.raises(UnstableSnapshot):
+        LedgerMirror(ledger, attempts=2).bootstrap()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_background_errors():
+    ledger = FakeLedger(1)
+    mirror = LedgerMirror(ledger, interval=0.01)
+
+    def failing_block(block_id):
+        raise RpcConnectionFail("connection error:", None)
+    uplink_block = ledger.uplink_block
+
+    with mirror:
+        mirror.start()
+        ledger.uplink_block = failing_block
+        wait_for(lambda: mirror.error is not None)
+        assert isinstance(mirror.error, RpcConnectionFail)
+
+        ledger.uplink_block = uplink_block
+        wait_for(lambda: mirror.error is None)
@@ -0,0 +1,49 @@
+import pytest
+import sha3
+from ecdsa import SigningKey, SECP256k1, util
+
+from uplink import *
+
+from . import reference
+from .stub import StubNode, tx_ok
+
+
+def verify(private_key, signature, msg):
+    sig = util.sigencode_string(*unpack_signature(signature), order=order)
+    return private_key.verifying_key.verify(sig, msg, hashfunc=sha3.sha3_256)
+
+
+@pytest.fixture(scope="module")
+def keys():
+    return [reference.skey, SigningKey.generate(curve=SECP256k1)]
+
+
+@pytest.fixture(scope="module")
+def signer(keys):
+    with ParallelSigner(keys, processes=2) as signer:
+        yield signer
+
+
+def test_sign_many(keys, signer):
+    items = [(keys[i % 2], VInt(i).to_binary()) for i in range(6)]
+    signatures = signer.sign_many(items)
+
+    assert len(signatures) == len(items)
+    for (key, msg), signature in zip(items, signatures):
+        assert verify(key, signature, msg)
+
+
+def test_unknown_key(signer):
+    with pytest.raises(ValueError):
+        signer.sign(SigningKey.generate(curve=SECP256k1), b"msg")
+
+
+def test_client_signer(signer):
+    with StubNode({'': tx_ok("abc")}) as node:
+        rpc = UplinkJsonRpc(port=node.port)
+        rpc.uplink_transfer_asset(reference.skey, reference.testAddr, reference.toAddr, 5,
+                                  reference.assetAddr, signer=signer)
+
+    path, request = node.requests[0]
+    hdr = TransferAssetHeader(reference.assetAddr, reference.toAddr, 5)
+    assert verify(reference.skey, request["params"]["signature"], hdr.to_binary())
@@ -63,3 +63,55 @@ def test_call_arg_length(arg_count):
 def test_create_asset():
     tx = reference.testCreateAsset
     golden_signature("tx_create_asset.sig", tx)
+
+
+def test_signer_matches_ecdsa():
+    from ecdsa import SigningKey, SECP256k1, util
+    import sha3
+
+    msg = reference.testTransfer.to_binary()
+    for i in range(5):
+        sk = SigningKey.generate(curve=SECP256k1, hashfunc=sha3.sha3_256)
+        k = util.randrange(order)
+        expected = util.sigdecode_string(sk.sign(msg, hashfunc=sha3.sha3_256, k=k), order)
+        assert Signer(sk).sign(msg, k=k) == expected
+
+    signer = Signer(reference.skey)
+    assert ecdsa_sign(signer, msg, k=reference.nonce) == ecdsa_sign(reference.skey, msg, k=reference.nonce)
+
+
+def test_base_multiply():
+    from ecdsa import SECP256k1
+    from uplink import secp256k1
+
+    for k in [1, 2, 255, 256, 2 ** 255 + 1, order - 1]:
+        point = k * SECP256k1.generator
+        assert secp256k1.base_multiply(k) == (point.x(), point.y())
+
+
+def test_unpack_signature():
+    r, s = reference.testTransfer.sign(reference.skey, k=reference.nonce)
+    assert unpack_signature(pack_signature(r, s)) == (r, s)
+
+    with pytest.raises(ValueError):
+        unpack_signature(pack_signature(r, s)[:-4])
+
+
+@pytest.mark.parametrize(("processes"), [None, 2])
+def test_verify_many(processes):
+    from ecdsa import SigningKey, SECP256k1
+
+    other = SigningKey.generate(curve=SECP256k1)
+    items = []
+    for i in range(12):
+        msg = VInt(i).to_binary()
+        sk = reference.skey if i % 4 else other
+        items.append((sk.verifying_key, pack_signature(*Signer(sk).sign(msg)), msg))
+
+    items[3] = (items[3][0], items[3][1], b"tampered")
+    items[5] = (other.verifying_key, items[5][1], items[5][2])
+    items[6] = (items[6][0], b"garbage", items[6][2])
+    items[7] = (items[7][0], unpack_signature(items[7][1]), items[7][2])
+
+    expected = [i not in (3, 5, 6) for i in range(12)]
+    assert verify_many(items, processes=processes) == expected
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from uplink.exceptions import RpcConnectionFail, TransactionNonExistent
+from uplink.tracker import TxTracker
+
+
+class ScriptedRpc(object):
+    """Answers status queries from a list of statuses per transaction"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def uplink_get_transaction_status(self, tx_hash):
+        with self.lock:
+            self.queries.append(tx_hash)
+            status = self.statuses[tx_hash].pop(0)
+        if status == "NonExistent":
+            raise TransactionNonExistent(tx_hash)
+        if status == "Error":
+            raise RpcConnectionFail("connection error:", None)
+        return status
+
+
+def test_wait_many():
+    rpc = ScriptedRpc({
+        "a": ["Pending", "Accepted"],
+        "b": ["Rejected"],
+        "c": ["Pending", "Pending", "Accepted"],
+    })
+    with TxTracker(rpc, min_delay=0.001, max_delay=0.01) as tracker:
+        statuses = tracker.wait(["a", "b", "c"], timeout=5)
+
+    assert statuses == {"a": "Accepted", "b": "Rejected", "c": "Accepted"}
+    assert sorted(rpc.queries) == ["a", "a", "b", "c", "c", "c"]
+
+
+def test_same_hash_is_polled_once():
+    rpc = ScriptedRpc({"a": ["Accepted"]})
+    with TxTracker(rpc, min_delay=0.05) as tracker:
+        first = tracker.track("a")
+        second = tracker.track("a")
+        assert first is second
+        assert first.result(5) == "Accepted"
+
+    assert rpc.queries == ["a"]
+
+
+def test_callback_and_nonexistent():
+    rpc = ScriptedRpc({"a": ["NonExistent"]})
+    done = []
+    with TxTracker(rpc, min_delay=0.001) as tracker:
+        future = tracker.track("a", callback=done.append)
+        with pytest.raises(TransactionNonExistent):
+            future.result(5)
+
+    assert done == [future]
+
+
+def test_transient_errors_are_retried():
+    rpc = ScriptedRpc({"a": ["Error", "Accepted"]})
+    with TxTracker(rpc, min_delay=0.001) as tracker:
+        assert tracker.track("a").result(5) == "Accepted"
+
+
+def test_close_cancels_pending():
+    rpc = ScriptedRpc({"a": ["Pending"] * 100})
+    tracker = TxTracker(rpc, min_delay=10)
+    future = tracker.track("a")
+    tracker.close()
+    assert future.cancelled()
+
+
+def test_cancelled_future():
+    rpc = ScriptedRpc({"a": ["Accepted"], "b": ["Pending", "Accepted"], "c": ["Accepted"]})
+    with TxTracker(rpc, min_delay=0.01, max_delay=0.01) as tracker:
+        cancelled = tracker.track("a")
+        pending = tracker.track("b")
+        assert cancelled.cancel()
+        assert tracker.track("c").result(5) == "Accepted"
+        assert pending.result(5) == "Accepted"
+        assert "a" not in tracker._pending
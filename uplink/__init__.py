@@ -6,5 +6,13 @@ from .protocol import *
 from .enum import *
 from .cryptography import *
 from .client import UplinkJsonRpc
+from .transport import HttpTransport
+from .tracker import TxTracker
+from .follower import ChainFollower
+from .mirror import LedgerMirror
+from .parallel import ParallelSigner
+from .keystore import KeyStore
+from .cache import ReadCache, InternTable
+from .cluster import UplinkClusterRpc
 from .utils import *
 from .version import *
\ No newline at end of file
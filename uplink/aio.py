@@ -0,0 +1,701 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio client for the Uplink JSON RPC interface.
+
+Requires Python 3.5+ and ``aiohttp``. Every ``uplink_*`` method of
+``UplinkJsonRpc`` is mirrored here as a coroutine, sharing one pooled
+``aiohttp`` session so that many RPCs can be in flight at once::
+
+    async with AsyncUplinkJsonRpc(host='localhost') as rpc:
+        blocks = await rpc.uplink_blocks()
+"""
+
+import time
+import codecs
+import asyncio
+
+import aiohttp
+
+from .cache import copy_tree
+from .client import UplinkRpcBase, UPLINK_PORT, sign_header
+from .protocol import (Transaction, LazyTransactions,
+                       MemPool, Transfer, TxAccount, TxAsset, TxContract, CreateAccount,
+                       CreateAsset, CreateContract, RevokeAccount, Call, Circulate,
+                       CreateAccountHeader, CreateAssetHeader, TransferAssetHeader, CirculateAssetHeader,
+                       CreateContractHeader, RevokeAccountHeader, RevokeAsset, RevokeAssetHeader, CallHeader)
+from .exceptions import (RpcConnectionFail, BadStatusCodeError,
+                         UplinkJsonRpcError)
+from .cryptography import (pack_signature,
+                           derive_contract_address,
+                           derive_account_address,
+                           derive_asset_address,
+                           ecdsa_sign)
+from .transport import DEFAULT_POOL_SIZE, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+
+
+class _AsyncSingleFlight(object):
+    """
+    Runs one call per key at a time, as a task of its own; coroutines asking
+    for a key whose call is in flight wait for it. When several coroutines
+    share a call, each gets its own copy of the decoded response.
+    """
+
+    def __init__(self):
+        # Key to [task, number of callers]
+        self._calls = {}
+
+    async def do(self, key, fn, *args):
+        call = self._calls.get(key)
+        if call is None:
+            task = asyncio.ensure_future(fn(*args))
+            call = self._calls[key] = [task, 0]
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        call[1] += 1
+
+        # Cancelling a caller, e.g. on a wait_for timeout, leaves the call
+        # running for the others
+        result = await asyncio.shield(call[0])
+        # The key is released before any caller resumes, so the count is final
+        return result if call[1] == 1 else copy_tree(result)
+
+
+class AsyncUplinkJsonRpc(UplinkRpcBase):
+    """Asyncio JSON RPC For Uplink"""
+
+    def __init__(self, host='localhost', port=UPLINK_PORT, tls=False, endpoint=None,
+                 pool_size=DEFAULT_POOL_SIZE, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=DEFAULT_READ_TIMEOUT, session=None, codec=None, cache=None,
+                 strings=None, compact=False):
+        super(AsyncUplinkJsonRpc, self).__init__(host, port, tls, endpoint, codec, cache, strings, compact)
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self._session = session
+        self._in_flight = _AsyncSingleFlight()
+
+    @property
+    def session(self):
+        # The session is created lazily so that it binds to the running loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_size)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self._session
+
+    async def close(self):
+        """Close the pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _call(self, method, params=None, endpoint=None):
+        cached = self._cached(method, endpoint)
+        if cached is not None:
+            return cached
+
+        if method == 'GET' and endpoint:
+            # Concurrent identical queries share a single request
+            return await self._in_flight.do(endpoint, self._fetch, method, params, endpoint)
+        return await self._fetch(method, params, endpoint)
+
+    async def _fetch(self, method, params, endpoint):
+        url = self._endpoint_url(endpoint)
+        data = self._request_body(method, params)
+
+        try:
+            async with self.session.post(url, data=data) as req:
+                status = req.status
+                content = await req.read()
+        except (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError):
+            raise RpcConnectionFail('connection error:', None)
+
+        if status // 100 != 2:
+            raise BadStatusCodeError("status code: ", status)
+        response = self._intern(endpoint, self._parse(content))
+        self._store(method, endpoint, response)
+        return response
+
+    # Issues a transaction to the uplink RPC interface, returning the
+    # tranasction hash on success, and throwing an exception on failure.
+    async def _issue_transaction(self, tx):
+        response = await self._call("Transaction", tx.to_dict())
+        return self._handle_issued(tx, response)
+
+    async def uplink_reset_db(self, private_key, public_key):
+        """
+        Resets and clears Uplink database.
+        This request will return an error if the node is not in test mode
+        :param private_key: private key of primary account
+        :param public_key: public key of primary account
+        """
+        address = derive_account_address(public_key)
+        r, s = ecdsa_sign(private_key, address)
+        signature = pack_signature(r, s)
+
+        params = {
+            "method": "ResetDB",
+            "params": {
+                "address": address,
+                "signature": signature
+            }
+        }
+        return await self._call("Test", params=params)
+
+    async def uplink_block(self, block_id):
+        """
+        Get a block by index
+        :param block_id:
+        :return: specific block
+        """
+        result = await self._call('GET', endpoint='blocks/{}'.format(block_id))
+        elems = self._handle_response(result, many=False)
+        return self._Block(**elems)
+
+    async def uplink_blocks(self):
+        """
+        Get a list of all blocks
+        :return: all blocks
+        """
+        result = await self._call('GET', endpoint='blocks')
+        elems = self._handle_response(result, many=True)
+        return [self._Block(**args) for args in elems]
+
+    async def uplink_peers(self):
+        """
+        Get a list of peers
+        :return: all peers
+        """
+        result = await self._call('GET', endpoint='peers')
+        elems = self._handle_response(result, many=True)
+        return [self._Peer(**args) for args in elems]
+
+    async def uplink_validators(self):
+        """
+        Get a list of validating peers
+        :return: all validating peers
+        """
+        result = await self._call('GET', endpoint='peers/validators')
+        elems = self._handle_response(result, many=True)
+        return [self._Peer(**args) for args in elems]
+
+    async def uplink_get_transaction_status(self, tx_hash):
+        """
+        Get a transactions status
+        :return:
+        """
+        response = await self._call('GET', endpoint='transactions/status/{}'.format(tx_hash))
+        return self._handle_tx_status(tx_hash, response)
+
+    async def uplink_transactions(self, block_id=0):
+        """
+        Get a list of transactions by block index
+        :param block_id:
+        :return: all transactions specified by block id, decoded on access
+        """
+        result = await self._call('GET', endpoint='transactions/{}'.format(block_id))
+        elems = self._handle_response(result, many=True)
+        return LazyTransactions(elems, self._Transaction)
+
+    async def uplink_accounts(self):
+        """
+        Get a list of accounts
+        :return: all accounts
+        """
+        result = await self._call('GET', endpoint='accounts')
+        elems = self._handle_response(result, many=True)
+        return [self._Account(**args) for args in elems]
+
+    async def uplink_get_account(self, address):
+        """
+        Get individual account by address [/accounts/<address>]
+        :param address: account address
+        :return: specific account and associated details
+        """
+        result = await self._call('GET', endpoint='accounts/{}'.format(address))
+        elems = self._handle_response(result, many=False)
+        return self._Account(**elems)
+
+    async def uplink_assets(self):
+        """
+        Get a list of all assets
+        :return: all assets
+        """
+        result = await self._call('GET', endpoint='assets')
+        elems = self._handle_response(result, many=True)
+        return [self._Asset(**args) for args in elems]
+
+    async def uplink_get_asset(self, address):
+        """
+        Get individual asset by address [/assets/<address>]
+        :param address: asset address
+        :return: specific asset and associated details
+        """
+        result = await self._call('GET', endpoint='assets/{}'.format(address))
+        elems = self._handle_response(result, many=False)
+        try:
+            if elems['errorMsg']:
+                print(elems['errorMsg'])
+                return False
+        except KeyError:
+            return self._Asset(**elems)
+
+    async def uplink_version(self):
+        """
+        Get current Uplink version
+        :return: version
+        """
+        return await self._call('GET', endpoint='version')
+
+    async def uplink_contracts(self):
+        """
+        Get a list of all contacts
+        :return: all contracts
+        """
+        result = await self._call('GET', endpoint='contracts')
+        elems = self._handle_response(result, many=True)
+        return [self._Contract(**args) for args in elems]
+
+    async def uplink_get_contract(self, address):
+        """
+        Get individual contract by address
+        :param address:
+        :return: specific contract and associated details
+        """
+        result = await self._call('GET', endpoint='contracts/{}'.format(address))
+        elems = self._handle_response(result, many=False)
+        return self._Contract(**elems)
+
+    async def uplink_get_contract_callable(self, address):
+        """
+        Get individual contract methods by address
+        return specific contract methods
+        """
+        result = await self._call('GET', endpoint='contracts/{}/callable'.format(address))
+        return self._handle_response(result, many=False)
+
+    async def uplink_get_invalid_transaction(self, tx_hash):
+        """
+        Get an invalid transaction
+        :return:
+        """
+        response = await self._call('GET', endpoint='transactions/invalid/{}'.format(tx_hash))
+        return self._handle_tx_status(tx_hash, response)
+
+    async def uplink_get_invalid_transactions(self):
+        """
+        Get list of invalid transactions
+        :return: all invalid transactions
+        """
+        result = await self._call('GET', endpoint='transactions/invalid')
+        return self._handle_response(result, many=True)
+
+    async def uplink_get_mempool(self):
+        """
+        Get list of unconfirmed transactions
+        :return all unconfirmed transactions on current node
+        """
+        result = await self._call('GET', endpoint='transactions/pool')
+        mem_pool_dict = self._handle_response(result, many=False)
+        return MemPool(mem_pool_dict)
+
+    async def uplink_get_mempool_size(self):
+        """
+        Get size of node mempool
+        :return: amount of unconfirmed transactions on current node
+        """
+        result = await self._call('GET', endpoint='transactions/pool/size')
+        return self._handle_response(result, many=False)
+
+    async def uplink_get_mempools(self):
+        """
+        Get unconfirmed transactions of all nodes in the network.
+        :return: amount of unconfirmed
+        """
+        return await self._call('GET', endpoint='transactions/pool/all')
+
+    async def uplink_get_mempools_sizes(self):
+        """
+        Get size of mempool for all nodes in the network.
+        :return: amount of unconfirmed transactions on all network nodes
+        """
+        return await self._call('GET', endpoint='transactions/pool/all/sizes')
+
+    async def uplink_test_saturate_network(self, n_txs, n_secs):
+        """
+        Send cmd to p2p network to spawn n txs over m seconds.
+        This request will return an error if the node is not in test mode
+        :param n_txs: number of transactions to send
+        :param n_secs: number of seconds to send those transactions in
+        """
+        params = {
+            "method": "SaturateNetwork",
+            "params": {"nTxs": n_txs,
+                       "nSecs": n_secs}
+        }
+        return await self._call("Test", params)
+
+    async def uplink_test_reset_mempools(self):
+        """
+        Send cmd to p2p network to reset all mempools of all nodes.
+        This request will return an error if the node is not in test mode
+        :return: clears list of unconfirmed transactions on network
+        """
+        params = {
+            "method": "ResetMemPools",
+            "params": {}
+        }
+        return await self._call("Test", params)
+
+    async def uplink_create_account(self, private_key, public_key,
+                                    from_address=None, metadata=None, timezone=None, signer=None):
+        """
+        Create new account
+        :param private_key: Private key of account to be created
+        :param public_key: Public key of account to be created
+        :param from_address: Address of account to be created
+        :param metadata: Metadata to be associated with created account
+        :param timezone: Timezone information related to account
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: account
+        """
+        if timezone is None:
+            timezone, localtz = time.tzname
+        if metadata is None:
+            metadata = {}
+
+        public_key_hex = codecs.encode(public_key.to_string(), 'hex')
+
+        acc_address = derive_account_address(public_key)
+        hdr = CreateAccountHeader(
+            public_key_hex, metadata, acc_address, timezone)
+        txb = TxAccount(CreateAccount(hdr))
+
+        signature = sign_header(private_key, hdr, signer)
+
+        origin = acc_address if from_address is None else from_address
+        tx = Transaction(txb, signature, origin=origin)
+
+        tx_hash = await self._issue_transaction(tx)
+        return (tx_hash, acc_address)
+
+    async def uplink_create_asset(self, private_key, origin, name,
+                                  supply, asset_type_nm, reference, issuer,
+                                  precision=None, metadata=None, signer=None):
+        """
+        Create Asset
+        :param private_key: private key of account creating asset
+        :param origin: address of account creating asset
+        :param name: name of asset
+        :param supply: amount of asset holdings to be created
+        :param asset_type_nm: name of asset type: Discrete, Fractional, Binary
+        :param reference: Token, Security, GBP, EUR, CHF, USD
+        :param issuer: same as origin
+        :param precision: decimal precision for Fractional assets only
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: tuple of transaction hash and asset address
+        """
+        if metadata is None:
+            metadata = {}
+
+        hdr = CreateAssetHeader(name, supply, asset_type_nm,
+                                reference, issuer, precision, metadata)
+        txb = TxAsset(CreateAsset(hdr))
+
+        signature = sign_header(private_key, hdr, signer)
+
+        tx = Transaction(txb, signature, origin=origin)
+
+        tx_hash = await self._issue_transaction(tx)
+        asset_address = derive_asset_address(tx_hash)
+        return (tx_hash, asset_address)
+
+    async def uplink_transfer_asset(self, private_key, from_address, to_address, balance, asset_address, signer=None):
+        """
+        Transfer Asset holdings
+        :param private_key: private key of account transferring holdings
+        :param from_address: address of account transferring holdings
+        :param to_address: address holdings are being transferred to
+        :param balance: amount of holdings to be transferred
+        :param asset_address: address of asset to be transferred
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: transaction hash if successful
+        """
+        hdr = TransferAssetHeader(asset_address, to_address, balance)
+        txb = TxAsset(Transfer(hdr))
+
+        signature = sign_header(private_key, hdr, signer)
+
+        tx = Transaction(txb, signature, origin=from_address)
+        return await self._issue_transaction(tx)
+
+    async def uplink_circulate_asset(self, private_key, from_address, amount, asset_address, signer=None):
+        """
+        Circulate asset supply
+        :param private_key: private key of account circulating asset
+        :param from_address: address of account circulating asset
+        :param amount: amount of asset holdings to be circulated
+        :param asset_address: address of asset to be circulated
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: transaction hash if successful
+        """
+        hdr = CirculateAssetHeader(asset_address, amount)
+        txb = TxAsset(Circulate(hdr))
+
+        signature = sign_header(private_key, hdr, signer)
+
+        tx = Transaction(txb, signature, origin=from_address)
+        return await self._issue_transaction(tx)
+
+    async def uplink_create_contract(self, private_key, from_address, script, signer=None):
+        """
+        Create a new Contract
+        :param private_key: private key of account creating contract
+        :param from_address: address of account creating contract
+        :param script: contract code
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: tuple of transaction hash and contract address
+        """
+        hdr = CreateContractHeader(script)
+        txb = TxContract(CreateContract(hdr))
+
+        signature = sign_header(private_key, hdr, signer)
+
+        tx = Transaction(txb, signature, origin=from_address)
+
+        tx_hash = await self._issue_transaction(tx)
+        contract_address = derive_contract_address(tx_hash)
+        return (tx_hash, contract_address)
+
+    async def uplink_revoke_asset(self, private_key, from_address, asset_addr, signer=None):
+        """
+        Revoke Asset
+        :param private_key: private key of account revoking asset - must be the same account as the initial
+        issuer of the asset
+        :param from_address: address of the account revoking asset
+        :param asset_addr: address of the asset being revoked
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: transaction hash if successful
+        """
+        hdr = RevokeAssetHeader(asset_addr)
+        txb = TxAsset(RevokeAsset(hdr))
+
+        signature = sign_header(private_key, hdr, signer)
+
+        tx = Transaction(txb, signature, origin=from_address)
+        return await self._issue_transaction(tx)
+
+    async def uplink_revoke_account(self, private_key, from_address, account_addr, signer=None):
+        """Revoke account access
+        :param private_key: private key of account revoking access - must be the same account as the account
+        being revoked
+        :param from_address: address of account revoking access
+        :param account_addr: address of the account being revoked
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: transaction hash if successful
+        """
+        hdr = RevokeAccountHeader(account_addr)
+        txb = TxAccount(RevokeAccount(hdr))
+
+        signature = sign_header(private_key, hdr, signer)
+
+        tx = Transaction(txb, signature, origin=from_address)
+        return await self._issue_transaction(tx)
+
+    async def uplink_call_contract(self, private_key, from_address, contract_addr, method, args, signer=None):
+        """Call contract method
+        :param private_key: private key of account calling contract method
+        :param from_address: address of account calling contract method
+        :param contract_addr: address of contract being called
+        :param method: method name off contract being called
+        :param args: arguments to the method
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: transaction hash if successful
+        """
+        hdr = CallHeader(contract_addr, method, args)
+        txb = TxContract(Call(hdr))
+
+        signature = sign_header(private_key, hdr, signer)
+
+        tx = Transaction(txb, signature, origin=from_address)
+        return await self._issue_transaction(tx)
+
+    async def uplink_call_template(self, private_key, from_address, template, args, signer=None):
+        """Call contract method through a CallTemplate of the contract and method
+        :param private_key: private key of account calling contract method
+        :param from_address: address of account calling contract method
+        :param template: CallTemplate of the contract method being called
+        :param args: arguments to the method
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: transaction hash if successful
+        """
+        hdr = template.header(args)
+        signature = sign_header(private_key, hdr, signer)
+
+        tx = Transaction(TxContract(Call(hdr)), signature, origin=from_address)
+        return await self._issue_transaction(tx)
+
+    async def uplink_query(self, query):
+        """Query Uplink Database - will only work if Uplink is created with postgres
+        :param query: query string to send to database
+        :return: response to query will be list of assets, accounts, or contracts.
+        """
+        result = await self._call('Query', params=query, endpoint='')
+        return self._handle_response(result, many=False)
+
+    async def uplink_sim_create(self, issuer, script, world=None):
+        """Create Simulation"""
+        params = {
+            "tag": "CreateSimulationMsg",
+            "contents": {
+                "issuer": issuer,
+                "fcl": script,
+                "world": world
+            }
+        }
+        result = await self._call('Simulate', params=params, endpoint='')
+        return self._handle_response(result, many=False)
+
+    async def uplink_sim_update(self, simulation_id, method_json):
+        """
+        Update Simulation
+        :param simulation_id: The id of the simulated contract to update
+        :param method_json: The dictionary representing the simulation update
+        :return: RPCRespOK on success
+        """
+        params = {
+            "tag": "UpdateSimulationMsg",
+            "contents": {
+                "simKey": simulation_id,
+                "contents": method_json
+            }
+        }
+        result = await self._call('Simulate', params=params, endpoint='')
+        if self._handle_success(result):
+            return result
+        else:
+            print(result)
+            raise UplinkJsonRpcError("Update Simulation failure:", result)
+
+    async def uplink_sim_update_set_time(self, simulation_id, timestamp):
+        """
+        Update Simulation - Set Timestamp
+        :param simulation_id: The id of the simulated contract to set the timestamp of
+        :param timestamp: ISO 8601 timestamp to set the contract's timestamp to
+        :return: RPCRespOK on success
+        """
+        params = {
+            "tag": "ModifyTimestamp",
+            "contents": {
+                "tag": "SetTimestamp",
+                "contents": timestamp
+            }
+        }
+        return await self.uplink_sim_update(simulation_id, params)
+
+    async def uplink_sim_update_add_timedelta(self, simulation_id, delta_str):
+        """
+        Update Simulation - Add time delta
+        :param simulation_id: The id of the simulated contract to increment the
+        timestamp of
+        :param delta_str: The string representing the timedelta to add to the
+        contract's timestamp
+        :return: RPCRespOK on success
+        """
+        params = {
+            "tag": "ModifyTimestamp",
+            "contents": {
+                "tag": "AddTimeDelta",
+                "contents": delta_str
+            }
+        }
+        return await self.uplink_sim_update(simulation_id, params)
+
+    async def uplink_sim_call(self, simulation_id, caller, method, args):
+        """
+        Update Simulation - Call Contact Method
+        :param simulation_id: The id of the simulated contract to call a method
+        of
+        :param method: The name of the contract method to call
+        :param args: A list of arguments to pass to the method call
+        """
+        params = {
+            "tag": "CallMethod",
+            "contents": {
+                "caller": caller,
+                "methodName": method,
+                "methodArgs": [arg.to_dict() for arg in args]
+            }
+        }
+        return await self.uplink_sim_update(simulation_id, params)
+
+    async def uplink_sim_query(self, simulation_id, query, addr=None, many=False):
+        """
+        Query Simulation
+        :param simulation_id: The id of the simulated contract to query
+        :param query: The name of the query to make
+        :param addr: Address of specific value to query
+        :param many: Whether or not to expect a list of items as a response
+        :return: The result of the "query" specified
+        """
+        params = {
+            "tag": "QuerySimulationMsg",
+            "contents": {
+                "simKey": simulation_id,
+                "contents": {
+                    "tag": query,
+                    "contents": addr
+                }
+            }
+        }
+        result = await self._call('Simulate', params=params, endpoint='')
+        return self._handle_response(result, many=many)
+
+    async def uplink_sim_query_methods(self, simulation_id):
+        """
+        Query Simulation - Contract Methods
+        :param simulation_id: The id of the simulated contract
+        :return: The list of callable contract methods
+        """
+        return await self.uplink_sim_query(simulation_id, "QueryMethods", many=True)
+
+    async def uplink_sim_query_contract(self, simulation_id):
+        """
+        Query Simulation Contract
+        :param simulation_id: The id of the simulated contract
+        :return: An Uplink Contract
+        """
+        res = await self.uplink_sim_query(simulation_id, "QueryContract")
+
+        error_val = res.get("errorMsg")
+        if error_val:
+            print(error_val)
+            raise ValueError("Contract Simulation with id " + simulation_id + " does not exist")
+        else:
+            return self._Contract(**res)
+
+    async def uplink_sim_query_assets(self, simulation_id):
+        """
+        Query Simulation - Assets
+        :param simulation_id: The id of the simulated contract
+        :return: A list of assets in the simulated contract's environment
+        """
+        return await self.uplink_sim_query(simulation_id, "QueryAssets", many=True)
+
+    async def uplink_sim_query_asset(self, simulation_id, address):
+        """
+        Query Simulation - Asset
+        :param simulation_id: The if of the simulated contract to query
+        :param address: The address of the asset
+        :return: An Uplink Asset
+        """
+        res = await self.uplink_sim_query(simulation_id, "QueryAsset", address)
+
+        error_val = res.get("errorMsg")
+        if error_val:
+            print(error_val)
+            raise ValueError("Asset with address " + address + " does not exist")
+        else:
+            return self._Asset(**res)
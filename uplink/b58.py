@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict  # noqa: F401
+
+from uplink.utils import to_bytes, from_bytes
+
+ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+# Digits are converted CHUNK at a time, so that most of the arithmetic is on
+# small integers and big integer divisions happen once per chunk
+CHUNK = 10
+CHUNK_BASE = 58 ** CHUNK
+
+# Digit values, by character as str and as bytes
+_INDEX = dict((char, i) for i, char in enumerate(ALPHABET))  # type: Dict[Any, int]
+_INDEX.update((char.encode(), i) for char, i in list(_INDEX.items()))
+
+# Pairs of digits, indexed by their value
+_PAIRS = [a + b for a in ALPHABET for b in ALPHABET]
+
+if hasattr(int, 'from_bytes'):
+    def _from_bytes(data):
+        return int.from_bytes(data, 'big')
+
+    def _to_bytes(number, length):
+        return number.to_bytes(length, 'big')
+else:
+    _from_bytes = from_bytes
+    _to_bytes = to_bytes
+
+# ------------------------------------------------------------------------
+# Codec
+# ------------------------------------------------------------------------
+
+
+def b58encode(data):
+    """Encode bytes using Base58"""
+    if not isinstance(data, bytes):
+        raise TypeError("a bytes-like object is required, not '%s'" % type(data).__name__)
+
+    stripped = data.lstrip(b'\0')
+    zeros = len(data) - len(stripped)
+    number = _from_bytes(stripped)
+
+    chunks = []
+    while number:
+        number, chunk = divmod(number, CHUNK_BASE)
+        chunks.append(chunk)
+
+    pairs = []
+    for chunk in chunks:
+        for _ in range(CHUNK // 2):
+            chunk, pair = divmod(chunk, 58 * 58)
+            pairs.append(_PAIRS[pair])
+    digits = ''.join(reversed(pairs)).lstrip(ALPHABET[0])
+
+    return ALPHABET[0] * zeros + digits
+
+
+def b58decode(string):
+    """Decode a Base58 encoded string to bytes"""
+    if not isinstance(string, str):
+        string = string.decode('ascii')
+
+    stripped = string.lstrip(ALPHABET[0])
+    zeros = len(string) - len(stripped)
+
+    index = _INDEX
+    number = 0
+    head = len(stripped) % CHUNK or CHUNK
+    start, end = 0, head
+    try:
+        while start < len(stripped):
+            chunk = 0
+            for char in stripped[start:end]:
+                chunk = chunk * 58 + index[char]
+            number = number * 58 ** (end - start) + chunk
+            start, end = end, end + CHUNK
+    except KeyError as e:
+        raise ValueError("Invalid base58 character {!r}".format(e.args[0]))
+
+    return b'\0' * zeros + (_to_bytes(number, (number.bit_length() + 7) // 8) if number else b'')
+
+
+# ------------------------------------------------------------------------
+# Address Cache
+# ------------------------------------------------------------------------
+
+# Headers encode the same few asset, contract and account addresses over and
+# over, so their raw forms are kept in bounded caches. Like encoding.layout,
+# the caches are plain dicts cleared when full, which keeps lookups cheap.
+
+MAX_ADDRESSES = 4096
+
+_decoded = {}  # type: Dict[str, bytes]
+_encoded = {}  # type: Dict[bytes, str]
+
+
+def decode_address(address):
+    """Raw bytes of a Base58 address, cached"""
+    try:
+        return _decoded[address]
+    except KeyError:
+        if len(_decoded) >= MAX_ADDRESSES:
+            _decoded.clear()
+        raw = _decoded[address] = b58decode(address)
+        return raw
+
+
+def encode_address(raw):
+    """Base58 address of raw address bytes, cached"""
+    try:
+        return _encoded[raw]
+    except KeyError:
+        if len(_encoded) >= MAX_ADDRESSES:
+            _encoded.clear()
+        address = _encoded[raw] = b58encode(raw)
+        return address
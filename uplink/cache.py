@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+
+import six
+from collections import OrderedDict
+
+# ------------------------------------------------------------------------
+# LRU Cache
+# ------------------------------------------------------------------------
+
+
+class LRUCache(object):
+    """
+    Thread safe mapping holding at most ``maxsize`` entries, evicting the
+    least recently used one when full.
+
+    :param maxsize: maximum number of entries
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Look up a key, marking it as the most recently used"""
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+            self._data[key] = value
+            return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry if full"""
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def keys(self):
+        """Snapshot of the keys, least recently used first"""
+        with self._lock:
+            return list(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+# ------------------------------------------------------------------------
+# Read Cache
+# ------------------------------------------------------------------------
+
+# Seconds responses stay cached, by the first segment of their endpoint
+DEFAULT_TTLS = {
+    'version': 60.0,
+    'assets': 1.0,
+    'accounts': 1.0,
+    'contracts': 1.0,
+}
+
+# Endpoints listing every ledger value of a kind, which any write may change
+LISTING_ENDPOINTS = frozenset(['assets', 'accounts', 'contracts'])
+
+
+def copy_tree(obj):
+    """
+    Copy of a decoded JSON document, rebuilding its dicts and lists so that
+    changes to the copy leave the original alone
+    """
+    kind = type(obj)
+    if kind is dict:
+        return {key: copy_tree(value) for key, value in obj.items()}
+    if kind is list:
+        return [copy_tree(value) for value in obj]
+    return obj
+
+
+class ReadCache(object):
+    """
+    Responses of read queries, kept for a time to live that depends on the
+    endpoint and bounded in number by LRU eviction. Endpoints without a time
+    to live, e.g. blocks or mempool queries, are never cached.
+
+    Responses are copied in and out, so callers may modify what they get.
+    A write drops the responses about the addresses it touches and the
+    listings, once when the node accepts it and again when its status shows
+    it processed, as responses fetched in between predate its block.
+
+    :param ttls: dict of seconds to live by first endpoint segment, e.g.
+    {'assets': 1.0} caches assets/<address> responses for a second
+    :param maxsize: maximum number of cached responses
+    :param clock: function returning the current time in seconds
+    """
+
+    def __init__(self, ttls=None, maxsize=1024, clock=time.time):
+        self.ttls = dict(DEFAULT_TTLS) if ttls is None else ttls
+        self.clock = clock
+        self._entries = LRUCache(maxsize)
+        # Addresses touched by the writes not known to be processed yet
+        self._unprocessed = LRUCache(maxsize)
+
+    def _ttl(self, endpoint):
+        return self.ttls.get(endpoint.split('/', 1)[0])
+
+    def get(self, endpoint):
+        """Cached response of an endpoint, None if missing or expired"""
+        entry = self._entries.get(endpoint)
+        if entry is None:
+            return None
+        expires, response = entry
+        if expires < self.clock():
+            self._entries.pop(endpoint)
+            return None
+        return copy_tree(response)
+
+    def put(self, endpoint, response):
+        """Cache the response of an endpoint, if it has a time to live"""
+        ttl = self._ttl(endpoint)
+        if ttl:
+            self._entries.put(endpoint, (self.clock() + ttl, copy_tree(response)))
+
+    def _drop(self, addresses, listings):
+        for endpoint in self._entries.keys():
+            if (listings and endpoint in LISTING_ENDPOINTS) or not addresses.isdisjoint(endpoint.split('/')):
+                self._entries.pop(endpoint)
+
+    def invalidate(self, address):
+        """Drop the cached responses about an address"""
+        self._drop(frozenset([address]), False)
+
+    def invalidate_write(self, tx_hash, addresses):
+        """
+        Drop the cached responses a write may change, i.e. those about the
+        addresses it touches and the listings, until processed(tx_hash)
+        :param tx_hash: hash of the accepted transaction
+        :param addresses: addresses of the ledger values it touches
+        """
+        addresses = frozenset(addresses)
+        self._unprocessed.put(tx_hash, addresses)
+        self._drop(addresses, True)
+
+    def processed(self, tx_hash):
+        """Drop the cached responses of a write again, once it is processed"""
+        addresses = self._unprocessed.pop(tx_hash)
+        if addresses is not None:
+            self._drop(addresses, True)
+
+    def clear(self):
+        self._entries.clear()
+        self._unprocessed.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# ------------------------------------------------------------------------
+# Intern Table
+# ------------------------------------------------------------------------
+
+# Strings longer than this, e.g. signatures or contract scripts, are rarely
+# repeated and are left alone
+MAX_INTERN_LENGTH = 64
+
+
+class InternTable(object):
+    """
+    Canonical copies of the short strings seen in responses, so that the
+    addresses, tags and keys repeated across a response, and across
+    responses, share one object each. The least recently used strings are
+    evicted once the table holds ``maxsize``.
+
+    :param maxsize: maximum number of strings held
+    """
+
+    def __init__(self, maxsize=262144):
+        self.maxsize = maxsize
+        self._strings = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _intern(self, string):
+        strings = self._strings
+        try:
+            canonical = strings.pop(string)
+        except KeyError:
+            canonical = string
+            if len(strings) >= self.maxsize:
+                strings.popitem(last=False)
+        strings[canonical] = canonical
+        return canonical
+
+    def intern(self, string):
+        """Canonical copy of a string"""
+        with self._lock:
+            return self._intern(string)
+
+    def intern_tree(self, obj):
+        """
+        Intern the dict keys and short string values of a decoded JSON
+        document, rebuilding its dicts and lists
+        :param obj: decoded JSON value
+        :return: equal value sharing interned strings
+        """
+        intern = self._intern
+        text = six.text_type
+
+        def walk(obj):
+            kind = type(obj)
+            if kind is dict:
+                return {intern(key): walk(value) for key, value in obj.items()}
+            if kind is list:
+                return [walk(value) for value in obj]
+            if kind is text and len(obj) <= MAX_INTERN_LENGTH:
+                return intern(obj)
+            return obj
+
+        with self._lock:
+            return walk(obj)
+
+    def clear(self):
+        with self._lock:
+            self._strings.clear()
+
+    def __len__(self):
+        return len(self._strings)
+
+
+# Table shared by the clients unless they are given their own
+shared_strings = InternTable()
@@ -1,18 +1,19 @@
 # -*- coding: utf-8 -*-
 
-import json
 import time
 import codecs
-import requests
+import threading
 import hashlib
-from base58 import b58encode
-from requests.exceptions import ConnectionError as RequestsConnectionError
-from .protocol import (Block, Peer, Account, Asset, Contract, Transaction,
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from .protocol import (Block, Peer, Account, Asset, Contract, Transaction, LazyTransactions,
+                       CompactBlock, CompactPeer, CompactAccount, CompactAsset, CompactContract, CompactTransaction,
                        MemPool, Transfer, TxAccount, TxAsset, TxContract, CreateAccount,
                        CreateAsset, CreateContract, RevokeAccount, Call, SyncLocal, Bind,
                        CreateAccountHeader, CreateAssetHeader, TransferAssetHeader, Circulate, CirculateAssetHeader, AssetType,
-                       CreateContractHeader, RevokeAccountHeader, RevokeAsset, RevokeAssetHeader, CallHeader, BindHeader, SyncHeader)
-from .exceptions import (RpcConnectionFail, BadStatusCodeError, BadJsonError,
+                       CreateContractHeader, RevokeAccountHeader, RevokeAsset, RevokeAssetHeader, CallHeader, BindHeader, SyncHeader,
+                       wrap_header)
+from .exceptions import (BadStatusCodeError, BadJsonError,
                          BadResponseError, UplinkJsonRpcError,
                          TransactionNonExistent)
 from .cryptography import (pack_signature,
@@ -21,53 +22,203 @@ from .cryptography import (pack_signature,
                            derive_account_address,
                            derive_asset_address,
                            ecdsa_sign)
+from .transport import HttpTransport
+from .codec import default_codec
+from .cache import shared_strings, copy_tree
+from .tracker import TX_PROCESSED
 
 UPLINK_PORT = 8545
 
+# Header fields holding the addresses of ledger values a transaction changes,
+# besides its origin account
+TOUCHED_ADDRESSES = {
+    TransferAssetHeader: ('assetAddr', 'toAddr'),
+    CirculateAssetHeader: ('assetAddr',),
+    RevokeAssetHeader: ('address',),
+    RevokeAccountHeader: ('address',),
+    CallHeader: ('address',),
+    BindHeader: ('asset', 'contract'),
+    SyncHeader: ('contract',),
+}
+
+
+# Endpoint prefixes of the queries whose responses are interned: the ledger,
+# blocks and mempool, where the same addresses recur across responses
+INTERNED_ENDPOINTS = ('accounts', 'assets', 'contracts', 'blocks', 'transactions/pool')
+
+
+def sign_header(private_key, hdr, signer=None):
+    """
+    Sign a transaction header
+    :param private_key: private key of the account issuing the transaction
+    :param hdr: transaction header, e.g. TransferAssetHeader
+    :param signer: ParallelSigner to sign with in a worker process, if any
+    :return: packed signature
+    """
+    if signer is not None:
+        return signer.sign(private_key, hdr.to_binary())
+    r, s = hdr.sign(private_key)
+    return pack_signature(r, s)
+
+
+def sign_transaction(private_key, origin, hdr, signer=None):
+    """
+    Sign a transaction header and wrap it into a Transaction
+    :param private_key: private key of the account issuing the transaction
+    :param origin: address of the account issuing the transaction
+    :param hdr: transaction header, e.g. TransferAssetHeader
+    :param signer: ParallelSigner to sign with in a worker process, if any
+    :return: signed transaction
+    """
+    signature = sign_header(private_key, hdr, signer)
+    return Transaction(wrap_header(hdr), signature, origin=origin)
+
+
+def _prefetch(fetch, start=0, stop=None, prefetch=8):
+    """
+    Yield fetch(index) for consecutive indexes, running up to prefetch calls
+    ahead in a thread pool. Without a stop index, iteration ends at the first
+    index the node answers with an error response.
+    """
+    pool = ThreadPoolExecutor(max_workers=prefetch)
+    pending = deque()
+    index = start
+    try:
+        while True:
+            while len(pending) < prefetch and (stop is None or index < stop):
+                pending.append(pool.submit(fetch, index))
+                index += 1
+            if not pending:
+                return
+
+            try:
+                result = pending.popleft().result()
+            except UplinkJsonRpcError as e:
+                # Past the tip of the chain, the node answers with an error
+                if stop is None and type(e) is UplinkJsonRpcError:
+                    return
+                raise
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+class _SingleFlight(object):
+    """
+    Runs one call per key at a time; callers asking for a key whose call is
+    in flight wait for it. When several callers share a call, each gets its
+    own copy of the decoded response.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Key to [future, number of waiting callers]
+        self._calls = {}
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = [Future(), 0]
+            else:
+                call[1] += 1
+        future = call[0]
+        if not leader:
+            return copy_tree(future.result())
 
-class UplinkJsonRpc(object):
-    """JSON RPC For Uplink"""
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._calls[key]
+        if call[1]:
+            # Waiters copy from a response the leader's caller never sees
+            future.set_result(copy_tree(result))
+        else:
+            future.set_result(result)
+        return result
 
-    def __init__(self, host='localhost', port=UPLINK_PORT, tls=False, endpoint=None, privkey=None, pubkey=None):
+
+class UplinkRpcBase(object):
+    """Connection settings and response handling shared by the Uplink clients"""
+
+    # Response models, replaced by their Compact variants with compact=True
+    _Block, _Peer, _Account, _Asset, _Contract, _Transaction = Block, Peer, Account, Asset, Contract, Transaction
+
+    def __init__(self, host='localhost', port=UPLINK_PORT, tls=False, endpoint=None, codec=None, cache=None,
+                 strings=None, compact=False):
         self.host = host
         self.port = port
         self.endpoint = endpoint
         self.tls = tls
-
-    def _call(self, method, params=None, endpoint=None):
-        self.endpoint = endpoint
-        params = params or {}
-        data = {
+        self.codec = codec or default_codec()
+        self.cache = cache
+        if strings is None:
+            strings = shared_strings
+        elif strings is False:
+            strings = None
+        self.strings = strings
+        self.compact = compact
+        if compact:
+            self._Block, self._Peer, self._Account = CompactBlock, CompactPeer, CompactAccount
+            self._Asset, self._Contract, self._Transaction = CompactAsset, CompactContract, CompactTransaction
+
+        scheme = 'https' if tls else 'http'
+        self.url = '{}://{}:{}'.format(scheme, host, port)
+
+    def _endpoint_url(self, endpoint=None):
+        if endpoint is None:
+            return self.url
+        return '{}/{}'.format(self.url, endpoint)
+
+    def _request_body(self, method, params=None):
+        return self.codec.dumps({
             'method': method,
-            'params': params,
-        }
-        scheme = 'http'
-        if self.tls:
-            scheme += 's'
-        if self.endpoint is None:
-            url = '{}://{}:{}'.format(scheme, self.host, self.port)
-        else:
-            url = '{}://{}:{}/{}'.format(scheme, self.host,
-                                         self.port, self.endpoint)
+            'params': params or {},
+        })
 
+    def _parse(self, content):
         try:
-            req = requests.post(url, data=json.dumps(data))
-        except RequestsConnectionError:
-            raise RpcConnectionFail('connection error:', None)
-        if req.status_code / 100 != 2:
-            raise BadStatusCodeError("status code: ", req.status_code)
-        try:
-            response = req.json()
+            return self.codec.loads(content)
         except ValueError:
-            raise BadJsonError("bad json error", req.error)
-
+            raise BadJsonError("bad json error", content)
+
+    def _intern(self, endpoint, response):
+        """Intern the keys and short strings of a ledger, block or mempool query response"""
+        if self.strings is None or not endpoint:
+            return response
+        for prefix in INTERNED_ENDPOINTS:
+            if endpoint == prefix or endpoint.startswith(prefix + '/'):
+                return self.strings.intern_tree(response)
         return response
 
-    # Issues a transaction to the uplink RPC interface, returning the
-    # tranasction hash on success, and throwing an exception on failure.
-    def _issue_transaction(self, tx):
-        response = self._call("Transaction", tx.to_dict())
+    def _cached(self, method, endpoint):
+        if self.cache is None or method != 'GET' or not endpoint:
+            return None
+        return self.cache.get(endpoint)
+
+    def _store(self, method, endpoint, response):
+        if self.cache is not None and method == 'GET' and endpoint and response.get("tag") == "RPCResp":
+            self.cache.put(endpoint, response)
+
+    def _invalidate(self, tx, tx_hash):
+        """Drop the cached responses an accepted transaction may change"""
+        if self.cache is None:
+            return
+        hdr = tx.header.contents.contents
+        addresses = [tx.origin] + [getattr(hdr, name) for name in TOUCHED_ADDRESSES.get(type(hdr), ())]
+        self.cache.invalidate_write(tx_hash, addresses)
+
+    def _handle_issued(self, tx, response):
         if response["tag"] == "RPCTransactionOK":
+            self._invalidate(tx, response["txHash"])
             return response["txHash"]
         else:
             print(response)
@@ -90,6 +241,108 @@ class UplinkJsonRpc(object):
         else:
             return False
 
+    def _handle_tx_status(self, tx_hash, response):
+        if response["contents"] == "NonExistent":
+            raise TransactionNonExistent(tx_hash)
+        if self.cache is not None and response["contents"] in TX_PROCESSED:
+            # Responses cached before the transaction was applied are stale
+            self.cache.processed(tx_hash)
+        return response["contents"]
+
+
+class UplinkJsonRpc(UplinkRpcBase):
+    """JSON RPC For Uplink"""
+
+    def __init__(self, host='localhost', port=UPLINK_PORT, tls=False, endpoint=None, privkey=None, pubkey=None,
+                 transport=None, codec=None, cache=None, strings=None, compact=False):
+        super(UplinkJsonRpc, self).__init__(host, port, tls, endpoint, codec, cache, strings, compact)
+        self.transport = transport or HttpTransport()
+        self._in_flight = _SingleFlight()
+
+    def _call(self, method, params=None, endpoint=None):
+        self.endpoint = endpoint
+        cached = self._cached(method, endpoint)
+        if cached is not None:
+            return cached
+
+        if method == 'GET' and endpoint:
+            # Concurrent identical queries share a single request
+            return self._in_flight.do(endpoint, self._fetch, method, params, endpoint)
+        return self._fetch(method, params, endpoint)
+
+    def _fetch(self, method, params, endpoint):
+        url = self._endpoint_url(endpoint)
+        response = self._intern(endpoint, self._post(url, self._request_body(method, params)))
+        self._store(method, endpoint, response)
+        return response
+
+    def _post(self, url, body):
+        req = self.transport.post(url, body)
+        if req.status_code // 100 != 2:
+            raise BadStatusCodeError("status code: ", req.status_code)
+        return self._parse(req.content)
+
+    def _post_transaction(self, body):
+        return self._post(self.url, body)
+
+    def close(self):
+        """Close the connections held by the client's transport"""
+        self.transport.close()
+
+    # Issues a transaction to the uplink RPC interface, returning the
+    # tranasction hash on success, and throwing an exception on failure.
+    def _issue_transaction(self, tx):
+        response = self._call("Transaction", tx.to_dict())
+        return self._handle_issued(tx, response)
+
+    def submit_many(self, transactions, workers=4, concurrency=None, signer=None):
+        """
+        Sign and issue many transactions, pipelining signing and submission
+        :param transactions: list of signed Transaction objects or of
+        (private_key, origin, header) tuples to be signed
+        :param workers: number of threads signing transaction headers
+        :param concurrency: maximum number of transactions in flight, defaults
+        to the transport's pool size
+        :param signer: ParallelSigner to sign with in worker processes, if any;
+        enough threads are then used to keep all of its processes busy
+        :return: tuple of transaction hashes and errors, both in input order;
+        an item that failed has a None hash and its exception as error
+        """
+        if concurrency is None:
+            concurrency = getattr(self.transport, 'pool_size', workers)
+        if signer is not None:
+            workers = max(workers, 2 * signer.processes)
+
+        tx_hashes = [None] * len(transactions)
+        errors = [None] * len(transactions)
+
+        def prepare(item):
+            tx = item if isinstance(item, Transaction) else sign_transaction(*item, signer=signer)
+            return tx, self._request_body("Transaction", tx.to_dict())
+
+        def submit(tx, body):
+            return self._handle_issued(tx, self._post_transaction(body))
+
+        with ThreadPoolExecutor(max_workers=workers) as signers, \
+                ThreadPoolExecutor(max_workers=concurrency) as issuers:
+            prepared = [signers.submit(prepare, item) for item in transactions]
+            issued = {}
+            for i, future in enumerate(prepared):
+                try:
+                    tx, body = future.result()
+                except Exception as e:
+                    errors[i] = e
+                else:
+                    issued[i] = issuers.submit(submit, tx, body)
+
+            for i, future in issued.items():
+                try:
+                    tx_hashes[i] = future.result()
+                except Exception as e:
+                    errors[i] = e
+
+        return tx_hashes, errors
+
     def uplink_reset_db(self, private_key, public_key):
         """
         Resets and clears Uplink database.
@@ -121,7 +374,7 @@ class UplinkJsonRpc(object):
         block_by_id = 'blocks/{}'.format(block_id)
         result = self._call('GET', endpoint=block_by_id)
         elems = self._handle_response(result, many=False)
-        return Block(**elems)
+        return self._Block(**elems)
 
     def uplink_blocks(self):
         """
@@ -130,7 +383,20 @@ class UplinkJsonRpc(object):
         """
         result = self._call('GET', endpoint='blocks')
         elems = self._handle_response(result, many=True)
-        return [Block(**args) for args in elems]
+        return [self._Block(**args) for args in elems]
+
+    def iter_blocks(self, start=0, stop=None, prefetch=8):
+        """
+        Iterate over blocks one at a time, fetching up to prefetch of them
+        ahead concurrently. Only the blocks in the prefetch window are held in
+        memory, so the whole chain can be walked in constant memory.
+        :param start: index of the first block
+        :param stop: index to stop before, defaults to the end of the chain,
+        i.e. the first block the node reports an error for
+        :param prefetch: number of blocks fetched ahead
+        :return: generator of Block objects
+        """
+        return _prefetch(self.uplink_block, start, stop, prefetch)
 
     def uplink_peers(self):
         """
@@ -139,7 +405,7 @@ class UplinkJsonRpc(object):
         """
         result = self._call('GET', endpoint='peers')
         elems = self._handle_response(result, many=True)
-        return [Peer(**args) for args in elems]
+        return [self._Peer(**args) for args in elems]
 
     def uplink_validators(self):
         """
@@ -148,7 +414,7 @@ class UplinkJsonRpc(object):
         """
         result = self._call('GET', endpoint='peers/validators')
         elems = self._handle_response(result, many=True)
-        return [Peer(**args) for args in elems]
+        return [self._Peer(**args) for args in elems]
 
     def uplink_get_transaction_status(self, tx_hash):
         """
@@ -156,21 +422,18 @@ class UplinkJsonRpc(object):
         :return:
         """
         response = self._call('GET', endpoint='transactions/status/{}'.format(tx_hash))
-        if response["contents"] == "NonExistent":
-            raise TransactionNonExistent(tx_hash)
-        else:
-            return response["contents"]
+        return self._handle_tx_status(tx_hash, response)
 
     def uplink_transactions(self, block_id=0):
         """
         Get a list of transactions by block index
         :param block_id:
-        :return: all transactions specified by block id
+        :return: all transactions specified by block id, decoded on access
         """
         transactions_by_id = 'transactions/{}'.format(block_id)
         result = self._call('GET', endpoint=transactions_by_id)
         elems = self._handle_response(result, many=True)
-        return [Transaction(**args) for args in elems]
+        return LazyTransactions(elems, self._Transaction)
 
     def uplink_accounts(self):
         """
@@ -179,7 +442,7 @@ class UplinkJsonRpc(object):
         """
         result = self._call('GET', endpoint='accounts')
         elems = self._handle_response(result, many=True)
-        return [Account(**args) for args in elems]
+        return [self._Account(**args) for args in elems]
 
     def uplink_get_account(self, address):
         """
@@ -190,7 +453,7 @@ class UplinkJsonRpc(object):
         account_by_address = 'accounts/{}'.format(address)
         result = self._call('GET', endpoint=account_by_address)
         elems = self._handle_response(result, many=False)
-        return Account(**elems)
+        return self._Account(**elems)
 
     def uplink_assets(self):
         """
@@ -200,7 +463,7 @@ class UplinkJsonRpc(object):
         result = self._call('GET', endpoint='assets')
         elems = self._handle_response(result, many=True)
 
-        return [Asset(**args) for args in elems]
+        return [self._Asset(**args) for args in elems]
 
     def uplink_get_asset(self, address):
         """
@@ -216,7 +479,7 @@ class UplinkJsonRpc(object):
                 print(elems['errorMsg'])
                 return False
         except KeyError:
-            return Asset(**elems)
+            return self._Asset(**elems)
 
     def uplink_version(self):
         """
@@ -233,7 +496,7 @@ class UplinkJsonRpc(object):
         result = self._call('GET', endpoint='contracts')
         elems = self._handle_response(result, many=True)
 
-        return [Contract(**args) for args in elems]
+        return [self._Contract(**args) for args in elems]
 
     def uplink_get_contract(self, address):
         """
@@ -244,7 +507,7 @@ class UplinkJsonRpc(object):
         contract_by_address = 'contracts/{}'.format(address)
         result = self._call('GET', endpoint=contract_by_address)
         elems = self._handle_response(result, many=False)
-        return Contract(**elems)
+        return self._Contract(**elems)
 
     def uplink_get_contract_callable(self, address):
         """
@@ -262,10 +525,7 @@ class UplinkJsonRpc(object):
         :return:
         """
         response = self._call('GET', endpoint='transactions/invalid/{}'.format(tx_hash))
-        if response["contents"] == "NonExistent":
-            raise TransactionNonExistent(tx_hash)
-        else:
-            return response["contents"]
+        return self._handle_tx_status(tx_hash, response)
 
     def uplink_get_invalid_transactions(self):
         """
@@ -334,7 +594,7 @@ class UplinkJsonRpc(object):
         return self._call("Test", params)
 
     def uplink_create_account(self, private_key, public_key,
-                              from_address=None, metadata=None, timezone=None):
+                              from_address=None, metadata=None, timezone=None, signer=None):
         """
         Create new account
         :param private_key: Private key of account to be created
@@ -342,6 +602,7 @@ class UplinkJsonRpc(object):
         :param from_address: Address of account to be created
         :param metadata: Metadata to be associated with created account
         :param timezone: Timezone information related to account
+        :param signer: ParallelSigner to sign with in a worker process, if any
         :return: account
         """
         if timezone is None:
@@ -357,8 +618,7 @@ class UplinkJsonRpc(object):
             public_key_hex, metadata, acc_address, timezone)
         txb = TxAccount(CreateAccount(hdr))
 
-        r, s = hdr.sign(private_key)
-        signature = pack_signature(r, s)
+        signature = sign_header(private_key, hdr, signer)
 
         origin = acc_address if from_address is None else from_address
         tx = Transaction(txb, signature, origin=origin)
@@ -368,7 +628,7 @@ class UplinkJsonRpc(object):
 
     def uplink_create_asset(self, private_key, origin, name,
                             supply, asset_type_nm, reference, issuer,
-                            precision=None, metadata=None):
+                            precision=None, metadata=None, signer=None):
         """
         Create Asset 
         :param private_key: private key of account creating asset
@@ -379,6 +639,7 @@ class UplinkJsonRpc(object):
         :param reference: Token, Security, GBP, EUR, CHF, USD
         :param issuer: same as origin
         :param precision: decimal precision for Fractional assets only
+        :param signer: ParallelSigner to sign with in a worker process, if any
         :return: tuple of transaction hash and asset address
         """
         """Create Asset - returns (result, to_address)"""
@@ -390,8 +651,7 @@ class UplinkJsonRpc(object):
                                 reference, issuer, precision, metadata)
         txb = TxAsset(CreateAsset(hdr))
 
-        r, s = hdr.sign(private_key)
-        signature = pack_signature(r, s)
+        signature = sign_header(private_key, hdr, signer)
 
         tx = Transaction(txb, signature, origin=origin)
 
@@ -399,7 +659,7 @@ class UplinkJsonRpc(object):
         asset_address = derive_asset_address(tx_hash)
         return (tx_hash, asset_address)
 
-    def uplink_transfer_asset(self, private_key, from_address, to_address, balance, asset_address):
+    def uplink_transfer_asset(self, private_key, from_address, to_address, balance, asset_address, signer=None):
         """
         Transfer Asset holdings
         :param private_key: private key of account transferring holdings
@@ -407,54 +667,54 @@ class UplinkJsonRpc(object):
         :param to_address: address holdings are being transferred to
         :param balance: amount of holdings to be transferred
         :param asset_address: address of asset to be transferred
+        :param signer: ParallelSigner to sign with in a worker process, if any
         :return: transaction hash if successful
         """
 
         hdr = TransferAssetHeader(asset_address, to_address, balance)
 
         txb = TxAsset(Transfer(hdr))
-        r, s = hdr.sign(private_key)
-        signature = pack_signature(r, s)
+        signature = sign_header(private_key, hdr, signer)
 
         tx = Transaction(txb, signature, origin=from_address)
         
         tx_hash = self._issue_transaction(tx)
         return tx_hash
 
-    def uplink_circulate_asset(self, private_key, from_address, amount, asset_address):
+    def uplink_circulate_asset(self, private_key, from_address, amount, asset_address, signer=None):
         """
         Circulate asset supply
         :param private_key: private key of account circulating asset
         :param from_address: address of account circulating asset
         :param amount: amount of asset holdings to be circulated
         :param asset_address: address of asset to be circulated
+        :param signer: ParallelSigner to sign with in a worker process, if any
         :return: transaction hash if successful
         """
         hdr = CirculateAssetHeader(asset_address, amount)
         txb = TxAsset(Circulate(hdr))
 
-        r, s = hdr.sign(private_key)
-        signature = pack_signature(r, s)
+        signature = sign_header(private_key, hdr, signer)
 
         tx = Transaction(txb, signature, origin=from_address)
         
         tx_hash = self._issue_transaction(tx)
         return tx_hash
 
-    def uplink_create_contract(self, private_key, from_address, script):
+    def uplink_create_contract(self, private_key, from_address, script, signer=None):
         """
         Create a new Contract
         :param private_key: private key of account creating contract
         :param from_address: address of account creating contract
         :param script: contract code
+        :param signer: ParallelSigner to sign with in a worker process, if any
         :return: tuple of transaction hash and contract address
         """
 
         hdr = CreateContractHeader(script)
         txb = TxContract(CreateContract(hdr))
 
-        r, s = hdr.sign(private_key)
-        signature = pack_signature(r, s)
+        signature = sign_header(private_key, hdr, signer)
 
         tx = Transaction(txb, signature, origin=from_address)
 
@@ -462,66 +722,81 @@ class UplinkJsonRpc(object):
         contract_address = derive_contract_address(tx_hash)
         return (tx_hash, contract_address)
 
-    def uplink_revoke_asset(self, private_key, from_address, asset_addr):
+    def uplink_revoke_asset(self, private_key, from_address, asset_addr, signer=None):
         """
         Revoke Asset
         :param private_key: private key of account revoking asset - must be the same account as the initial issuer of the asset
         :param from_address: address of the account revoking asset
         :param asset_addr: address of the asset being revoked
+        :param signer: ParallelSigner to sign with in a worker process, if any
         :return: transaction hash if successful
         """
 
         hdr = RevokeAssetHeader(asset_addr)
         txb = TxAsset(RevokeAsset(hdr))
 
-        r, s = hdr.sign(private_key)
-        signature = pack_signature(r, s)
+        signature = sign_header(private_key, hdr, signer)
 
         tx = Transaction(txb, signature, origin=from_address)
         
         tx_hash = self._issue_transaction(tx)
         return tx_hash
 
-    def uplink_revoke_account(self, private_key, from_address, account_addr):
+    def uplink_revoke_account(self, private_key, from_address, account_addr, signer=None):
         """Revoke account access
         :param private_key: private key of account revoking access - must be the same account as the account being revoked
         :param from_address: address of account revoking access
         :param account_addr: address of the account being revoked
+        :param signer: ParallelSigner to sign with in a worker process, if any
         :return: transaction hash if successful
         """
 
         hdr = RevokeAccountHeader(account_addr)
         txb = TxAccount(RevokeAccount(hdr))
 
-        r, s = hdr.sign(private_key)
-        signature = pack_signature(r, s)
+        signature = sign_header(private_key, hdr, signer)
 
         tx = Transaction(txb, signature, origin=from_address)
         
         tx_hash = self._issue_transaction(tx)
         return tx_hash
 
-    def uplink_call_contract(self, private_key, from_address, contract_addr, method, args):
+    def uplink_call_contract(self, private_key, from_address, contract_addr, method, args, signer=None):
         """Call contract method
         :param private_key: private key of account calling contract method
         :param from_address: address of account calling contract method
         :param contract_addr: address of contract being called
         :param method: method name off contract being called
         :param args: arguments to the method
+        :param signer: ParallelSigner to sign with in a worker process, if any
         :return: transaction hash if successful
         """
 
         hdr = CallHeader(contract_addr, method, args)
         txb = TxContract(Call(hdr))
 
-        r, s = hdr.sign(private_key)
-        signature = pack_signature(r, s)
+        signature = sign_header(private_key, hdr, signer)
 
         tx = Transaction(txb, signature, origin=from_address)
         
         tx_hash = self._issue_transaction(tx)
         return tx_hash
 
+    def uplink_call_template(self, private_key, from_address, template, args, signer=None):
+        """Call contract method through a CallTemplate of the contract and method
+        :param private_key: private key of account calling contract method
+        :param from_address: address of account calling contract method
+        :param template: CallTemplate of the contract method being called
+        :param args: arguments to the method
+        :param signer: ParallelSigner to sign with in a worker process, if any
+        :return: transaction hash if successful
+        """
+        hdr = template.header(args)
+        signature = sign_header(private_key, hdr, signer)
+
+        tx = Transaction(TxContract(Call(hdr)), signature, origin=from_address)
+        return self._issue_transaction(tx)
+
     def uplink_query(self, query):
         """Query Uplink Database - will only work if Uplink is created with postgres
         :param query: query string to send to database
@@ -660,7 +935,7 @@ class UplinkJsonRpc(object):
             print(error_val)
             raise ValueError("Contract Simulation with id " + simulation_id + " does not exist")
         else:
-            return Contract(**res)
+            return self._Contract(**res)
 
     def uplink_sim_query_assets(self, simulation_id):
         """
@@ -684,4 +959,4 @@ class UplinkJsonRpc(object):
             print(error_val)
             raise ValueError("Asset with address " + address + " does not exist")
         else:
-            return Asset(**res)
+            return self._Asset(**res)
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+
+from .client import UplinkJsonRpc, UPLINK_PORT
+from .exceptions import RpcConnectionFail, BadStatusCodeError, BadJsonError
+
+ROUND_ROBIN = 'round_robin'
+LEAST_LATENCY = 'least_latency'
+
+# Weight of the latest response time in a node's average latency
+LATENCY_WEIGHT = 0.3
+
+
+def _is_node_failure(error):
+    """Whether an error is the node's fault, so the request may go elsewhere"""
+    if isinstance(error, BadStatusCodeError):
+        return error.response >= 500
+    return isinstance(error, (RpcConnectionFail, BadJsonError))
+
+
+class _Node(object):
+    """Address and health of a node in the cluster"""
+
+    def __init__(self, host, port, tls):
+        self.host = host
+        self.port = port
+        self.url = '{}://{}:{}'.format('https' if tls else 'http', host, port)
+        self.latency = None
+        self.failures = 0
+        self.ejected_until = 0
+
+    def endpoint_url(self, endpoint=None):
+        if endpoint is None:
+            return self.url
+        return '{}/{}'.format(self.url, endpoint)
+
+    def healthy(self, now):
+        return self.ejected_until <= now
+
+    def __repr__(self):
+        return "<Node(url=%s)>" % self.url
+
+
+class UplinkClusterRpc(UplinkJsonRpc):
+    """
+    JSON RPC client for a cluster of Uplink nodes.
+
+    Reads are spread across the healthy nodes, either in turn or to the one
+    with the lowest average latency, and are retried on the next node when a
+    node fails to answer. Writes go to the first healthy node in the order
+    given, and are never retried elsewhere, as the node may have acted on
+    them already.
+
+    A node is ejected for ``eject_for`` seconds after ``max_failures``
+    consecutive failures, or as soon as its average latency exceeds
+    ``slow_latency`` seconds. Ejected nodes are only used when no node is
+    healthy. ``check_health`` queries every node's version to refresh their
+    state, and runs every ``health_interval`` seconds in the background if
+    set.
+
+    :param nodes: list of (host, port) tuples, the preferred node for writes
+    first
+    :param strategy: ROUND_ROBIN or LEAST_LATENCY
+    :param max_failures: consecutive failures after which a node is ejected
+    :param slow_latency: average seconds per response above which a node is
+    ejected, None to never eject slow nodes
+    :param eject_for: seconds an ejected node is left out
+    :param health_interval: seconds between background health checks, None
+    for no background checks
+    """
+
+    def __init__(self, nodes, tls=False, strategy=ROUND_ROBIN, max_failures=3, slow_latency=2.0,
+                 eject_for=30.0, health_interval=None, transport=None, codec=None, cache=None,
+                 strings=None, compact=False):
+        if not nodes:
+            raise ValueError("A cluster needs at least one node")
+        if strategy not in (ROUND_ROBIN, LEAST_LATENCY):
+            raise ValueError("Unknown strategy {}".format(strategy))
+
+        host, port = nodes[0]
+        super(UplinkClusterRpc, self).__init__(host, port, tls, transport=transport, codec=codec, cache=cache,
+                                               strings=strings, compact=compact)
+        self.nodes = [_Node(host, port, tls) for host, port in nodes]
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.slow_latency = slow_latency
+        self.eject_for = eject_for
+
+        self._lock = threading.Lock()
+        self._turn = 0
+        self._closed = threading.Event()
+        self._checker = None
+        if health_interval is not None:
+            self._checker = threading.Thread(target=self._check_periodically, args=(health_interval,))
+            self._checker.daemon = True
+            self._checker.start()
+
+    @classmethod
+    def from_peers(cls, host='localhost', port=UPLINK_PORT, tls=False, **kwargs):
+        """
+        Cluster of a node and of its peers, assuming they all serve RPCs on
+        the same port
+        :param host: host of the seed node, preferred for writes
+        :param port: RPC port of the nodes
+        :return: UplinkClusterRpc
+        """
+        seed = UplinkJsonRpc(host, port, tls)
+        try:
+            peers = seed.uplink_peers()
+        finally:
+            seed.close()
+
+        nodes = [(host, port)]
+        for peer in peers:
+            # Peer process ids look like nid://<host>:<p2p port>:<id>
+            peer_host = peer.contents.peer_pid.split('://', 1)[-1].split(':', 1)[0]
+            if (peer_host, port) not in nodes:
+                nodes.append((peer_host, port))
+        return cls(nodes, tls, **kwargs)
+
+    # ------------------------------------------------------------------------
+    # Node selection
+    # ------------------------------------------------------------------------
+
+    def _healthy(self):
+        now = time.time()
+        healthy = [node for node in self.nodes if node.healthy(now)]
+        return healthy or list(self.nodes)
+
+    def _read_nodes(self):
+        """Nodes to try a read on, in order"""
+        nodes = self._healthy()
+        if self.strategy == LEAST_LATENCY:
+            # Nodes without a measured latency go first, to measure them
+            return sorted(nodes, key=lambda node: node.latency or 0)
+        with self._lock:
+            turn = self._turn % len(nodes)
+            self._turn += 1
+        return nodes[turn:] + nodes[:turn]
+
+    def _write_node(self):
+        return self._healthy()[0]
+
+    def _record(self, node, latency=None, error=None):
+        with self._lock:
+            if error is not None:
+                node.failures += 1
+                if node.failures >= self.max_failures:
+                    node.ejected_until = time.time() + self.eject_for
+                    node.failures = 0
+                return
+
+            node.failures = 0
+            if node.latency is None:
+                node.latency = latency
+            else:
+                node.latency += LATENCY_WEIGHT * (latency - node.latency)
+            if self.slow_latency is not None and node.latency > self.slow_latency:
+                node.ejected_until = time.time() + self.eject_for
+                node.latency = None
+            else:
+                node.ejected_until = 0
+
+    def _post_to(self, node, endpoint, body):
+        start = time.time()
+        try:
+            response = self._post(node.endpoint_url(endpoint), body)
+        except Exception as e:
+            if _is_node_failure(e):
+                self._record(node, error=e)
+            raise
+        self._record(node, latency=time.time() - start)
+        return response
+
+    # ------------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------------
+
+    def _fetch(self, method, params, endpoint):
+        body = self._request_body(method, params)
+        if method != 'GET':
+            return self._post_to(self._write_node(), endpoint, body)
+
+        error = None
+        for node in self._read_nodes():
+            try:
+                response = self._post_to(node, endpoint, body)
+            except Exception as e:
+                if not _is_node_failure(e):
+                    raise
+                error = e
+                continue
+            response = self._intern(endpoint, response)
+            self._store(method, endpoint, response)
+            return response
+        raise error
+
+    def _post_transaction(self, body):
+        return self._post_to(self._write_node(), None, body)
+
+    def check_health(self):
+        """Query the version of every node, updating their health"""
+        body = self._request_body('GET')
+        for node in self.nodes:
+            try:
+                self._post_to(node, 'version', body)
+            except Exception:
+                pass
+
+    def _check_periodically(self, interval):
+        while not self._closed.wait(interval):
+            self.check_health()
+
+    def close(self):
+        """Stop background health checks and close the pooled connections"""
+        self._closed.set()
+        super(UplinkClusterRpc, self).close()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _default(obj):
+    """Encode values the JSON encoders do not handle natively"""
+    if isinstance(obj, bytes):
+        return obj.decode()
+    raise TypeError("Object of type {} is not JSON serializable".format(type(obj).__name__))
+
+
+class JsonCodec(object):
+    """
+    Encodes request bodies to bytes and decodes response bodies, using the
+    standard library json module. Keys are not sorted, as nothing on the wire
+    depends on their order.
+    """
+
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj, default=_default, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data):
+        return json.loads(data.decode('utf-8'))
+
+
+# Maps digits to b'1' and other bytes to b'0', to find runs of digits quickly
+_DIGITS = bytes(bytearray(0x31 if 0x30 <= c <= 0x39 else 0x30 for c in range(256)))
+
+# Integers of this many digits may exceed 64 bits
+_LONG_INTEGER = b'1' * 19
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    JSON codec using orjson, the default when it is installed. Objects orjson
+    cannot encode, such as integers beyond 64 bits, fall back to the
+    standard library. orjson decodes integers beyond 64 bits into floats, so
+    responses holding a run of 19 or more digits are decoded by the standard
+    library instead.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson")
+
+    def dumps(self, obj):
+        try:
+            return orjson.dumps(obj, default=_default)
+        except TypeError:
+            return super(OrjsonCodec, self).dumps(obj)
+
+    def loads(self, data):
+        if _LONG_INTEGER in data.translate(_DIGITS):
+            return super(OrjsonCodec, self).loads(data)
+        return orjson.loads(data)
+
+
+def default_codec():
+    """Codec used by clients given none, OrjsonCodec if orjson is installed"""
+    if orjson is not None:
+        return OrjsonCodec()
+    return JsonCodec()
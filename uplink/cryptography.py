@@ -4,8 +4,14 @@ import base64
 import hashlib
 import struct
 import codecs
-from base58 import b58encode, b58decode
+import multiprocessing
+from typing import Any  # noqa: F401
+from uplink.b58 import b58encode
 from ecdsa import SigningKey, SECP256k1, util, ellipticcurve, VerifyingKey
+from ecdsa.curves import Curve
+
+from uplink import secp256k1
+from uplink.cache import LRUCache
 
 # ------------------------------------------------------------------------
 # Time
@@ -52,24 +58,69 @@ def derive_asset_address(tx_hash):
     return tx_hash_to_address(tx_hash)
 
 
-def derive_account_address(pubkey):
-    """Account address derives from public key: b58(sha256(sha256(ripemd160(sha256(pubkey)))))"""
-    x = pubkey.pubkey.point.x()
-    y = pubkey.pubkey.point.y()
+# Addresses of recently seen public keys, keyed on the public point
+ADDRESS_CACHE_SIZE = 4096
+
+_addresses = LRUCache(ADDRESS_CACHE_SIZE)
+
+# Prototype RIPEMD-160 hash copied for each address, created on first use as
+# OpenSSL builds without the legacy provider lack the algorithm
+_ripemd160 = None  # type: Any
+
+
+def _new_ripemd160():
+    global _ripemd160
+    if _ripemd160 is None:
+        _ripemd160 = hashlib.new('ripemd160')
+    return _ripemd160.copy()
 
+
+def _account_address(x, y):
     sha_step1 = hashlib.sha3_256((str(x) + str(y)).encode()).digest()
 
-    ripe = hashlib.new('ripemd160')
+    ripe = _new_ripemd160()
     ripe.update(sha_step1)
     ripe = ripe.digest()
 
     sha_step2 = hashlib.sha3_256(ripe).digest()
     sha_step3 = hashlib.sha3_256(sha_step2)
 
-    address = b58encode(sha_step3.digest())
+    return b58encode(sha_step3.digest())
+
+
+def derive_account_address(pubkey):
+    """Account address derives from public key: b58(sha256(sha256(ripemd160(sha256(pubkey)))))"""
+    point = pubkey.pubkey.point
+    key = (point.x(), point.y())
+
+    address = _addresses.get(key)
+    if address is None:
+        address = _account_address(*key)
+        _addresses.put(key, address)
     return address
 
 
+def derive_account_addresses(pubkeys):
+    """
+    Derive the account addresses of many public keys
+    :param pubkeys: list of public keys
+    :return: list of addresses in input order
+    """
+    addresses = []
+    derived = {}
+    for pubkey in pubkeys:
+        point = pubkey.pubkey.point
+        key = (point.x(), point.y())
+
+        address = derived.get(key) or _addresses.get(key)
+        if address is None:
+            address = _account_address(*key)
+            _addresses.put(key, address)
+        derived[key] = address
+        addresses.append(address)
+    return addresses
+
+
 # ------------------------------------------------------------------------
 # Digital Signatures
 # ------------------------------------------------------------------------
@@ -79,9 +130,44 @@ def derive_account_address(pubkey):
 order = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 
 
+class _TableGenerator(ellipticcurve.Point):
+    """SECP256k1 generator multiplied with the precomputed table of uplink.secp256k1"""
+
+    def __mul__(self, other):
+        k = other % order
+        if k == 0:
+            return ellipticcurve.INFINITY
+        x, y = secp256k1.base_multiply(k)
+        return ellipticcurve.Point(SECP256k1.curve, x, y, order)
+
+    def __rmul__(self, other):
+        return self * other
+
+
+# SECP256k1 with the table generator, for deriving public keys
+_TABLE_CURVE = Curve(SECP256k1.name, SECP256k1.curve,
+                     _TableGenerator(SECP256k1.curve, secp256k1.GX, secp256k1.GY, order),
+                     SECP256k1.oid, SECP256k1.openssl_name)
+
+
+def signing_key(secret):
+    """
+    SigningKey of a private key scalar, equivalent to
+    SigningKey.from_secret_exponent but deriving the public point with the
+    precomputed generator table
+    :param secret: private key scalar, 1 <= secret < order
+    :return: SigningKey hashing with sha3_256
+    """
+    if not 1 <= secret < order:
+        raise ValueError("Private key scalar out of range")
+    sk = SigningKey.from_secret_exponent(secret, curve=_TABLE_CURVE, hashfunc=sha3.sha3_256)
+    sk.curve = sk.verifying_key.curve = SECP256k1
+    return sk
+
+
 def ecdsa_new():
     """Create a new ecdsa key pair returns (publickey, privatekey)"""
-    sk = SigningKey.generate(curve=SECP256k1, hashfunc=sha3.sha3_256)
+    sk = signing_key(util.randrange(order))
     pk = sk.verifying_key
     return (pk, sk)
 
@@ -117,8 +203,42 @@ def save_key(sk, name):
     return 'name'
 
 
+class Signer(object):
+    """
+    Signs messages with a SECP256k1 SigningKey using precomputed multiples of
+    the curve generator, producing the same signatures as SigningKey.sign.
+    """
+
+    def __init__(self, sk):
+        self.sk = sk
+        self.secret = sk.privkey.secret_multiplier
+        self.verifying_key = sk.verifying_key
+
+    def sign(self, msg, k=None):
+        """
+        Sign a message hashed with sha3_256
+        :param msg: message bytes
+        :param k: nonce, random if None
+        :return: tuple (r, s)
+        """
+        return _sign_secret(self.secret, msg, k)
+
+
+def _sign_secret(secret, msg, k=None):
+    """Sign a message with a SECP256k1 private key scalar"""
+    number = util.string_to_number(sha3.sha3_256(msg).digest())
+    if k is None:
+        k = util.randrange(order)
+    return secp256k1.sign_number(secret, number, k)
+
+
 def ecdsa_sign(sk, msg, k=None):
     """Sign ecdsa"""
+    if isinstance(sk, Signer):
+        return sk.sign(msg, k)
+    if sk.curve is SECP256k1:
+        return Signer(sk).sign(msg, k)
+
     sig = sk.sign(msg, hashfunc=sha3.sha3_256, k=k)
     signature = util.sigdecode_string(sig, order)
 
@@ -144,6 +264,23 @@ def pack_signature(r, s):
     return signature
 
 
+def unpack_signature(signature):
+    """Split a signature serialized by pack_signature into (r, s)"""
+    try:
+        data = base64.b64decode(signature)
+        r_len, = struct.unpack(">h", data[:2])
+        r = int(data[2:2 + r_len])
+        if data[2 + r_len:3 + r_len] != b':':
+            raise ValueError("Missing separator")
+        s_len, = struct.unpack(">h", data[3 + r_len:5 + r_len])
+        s_enc = data[5 + r_len:]
+        if len(s_enc) != s_len:
+            raise ValueError("Bad length")
+        return r, int(s_enc)
+    except (TypeError, struct.error, ValueError) as e:
+        raise ValueError("Malformed signature: {}".format(e))
+
+
 def ecdsa_verify(pk, sig, msg):
     """Verify ecdsa"""
     r, s = sig
@@ -151,6 +288,66 @@ def ecdsa_verify(pk, sig, msg):
     return pk.verify(sigg, msg)
 
 
+# Public keys with at least this many signatures to verify get a table of
+# precomputed multiples, which costs about as much as 8 verifications without
+KEY_TABLE_MIN = 8
+
+# Largest number of signatures a worker process verifies at a time
+VERIFY_CHUNK = 1024
+
+
+def _verify_group(group):
+    public, entries = group
+    table = None
+    if len(entries) >= KEY_TABLE_MIN:
+        table = secp256k1.point_table(*public)
+
+    results = []
+    for i, r, s, msg in entries:
+        number = util.string_to_number(sha3.sha3_256(msg).digest())
+        results.append((i, secp256k1.verify_number(public, number, r, s, table)))
+    return results
+
+
+def verify_many(items, processes=None):
+    """
+    Verify many signatures, sharing precomputation between the signatures of
+    the same public key
+    :param items: list of (public_key, signature, msg) tuples, where the
+    signature is either packed or an (r, s) tuple
+    :param processes: number of worker processes to verify in, if more than one
+    :return: list of booleans in input order; a malformed signature is invalid
+    """
+    results = [False] * len(items)
+    groups = {}
+    for i, (public_key, signature, msg) in enumerate(items):
+        try:
+            r, s = unpack_signature(signature) if not isinstance(signature, tuple) else signature
+        except ValueError:
+            continue
+        point = public_key.pubkey.point
+        groups.setdefault((point.x(), point.y()), []).append((i, r, s, msg))
+
+    if processes is None or processes <= 1:
+        for group in groups.items():
+            for i, valid in _verify_group(group):
+                results[i] = valid
+        return results
+
+    chunks = [(public, entries[start:start + VERIFY_CHUNK])
+              for public, entries in groups.items()
+              for start in range(0, len(entries), VERIFY_CHUNK)]
+    pool = multiprocessing.Pool(processes)
+    try:
+        for verified in pool.imap_unordered(_verify_group, chunks):
+            for i, valid in verified:
+                results[i] = valid
+    finally:
+        pool.close()
+        pool.join()
+    return results
+
+
 def make_qrcode(data, name):
     """Make QR codes"""
     import qrcode
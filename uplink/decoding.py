@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+import struct
+import datetime
+from datetime import timedelta
+from decimal import Decimal
+
+from uplink.b58 import encode_address
+
+import uplink.enum as enum
+import uplink.encoding as encoding
+from uplink.utils import from_bytes
+from uplink.protocol import (VInt, VFloat, VFixed, VBool, VAccount, VAsset, VContract, VMsg, VVoid,
+                             VDateTime, VTimeDelta, VUndefined, VEnum,
+                             CreateContractHeader, SyncHeader, CallHeader, CreateAssetHeader,
+                             TransferAssetHeader, CirculateAssetHeader, BindHeader, RevokeAssetHeader,
+                             CreateAccountHeader, RevokeAccountHeader)
+
+# Decoders read from a bytes-like object through a memoryview, unpacking fields
+# in place. Each one takes the view and the offset to read at, and returns the
+# decoded object along with the offset following it.
+
+# ------------------------------------------------------------------------
+# Fields
+# ------------------------------------------------------------------------
+
+
+def _bytes(view, offset, prefix=encoding.U16):
+    length, = prefix.unpack_from(view, offset)
+    offset += prefix.size
+    end = offset + length
+    if end > len(view):
+        raise ValueError("Truncated field at offset {}".format(offset))
+    return view[offset:end].tobytes(), end
+
+
+def _text(view, offset, prefix=encoding.U16):
+    data, offset = _bytes(view, offset, prefix)
+    return data.decode(), offset
+
+
+def _address(raw):
+    return encode_address(raw)
+
+
+def _metadata(view, offset):
+    count, = encoding.U16.unpack_from(view, offset)
+    offset += encoding.U16.size
+
+    metadata = {}
+    for _ in range(count):
+        key, offset = _text(view, offset)
+        metadata[key], offset = _text(view, offset)
+    return metadata, offset
+
+# ------------------------------------------------------------------------
+# Values
+# ------------------------------------------------------------------------
+
+
+def _v_fixed(view, offset):
+    tag, precision, sign, length = encoding.V_FIXED.unpack_from(view, offset)
+    offset += encoding.V_FIXED.size
+    if offset + length > len(view):
+        raise ValueError("Truncated fixed point value at offset {}".format(offset))
+    digits = from_bytes(view[offset:offset + length], byteorder='little')
+    precision += 1
+
+    value = Decimal((0 if sign >= 0 else 1, tuple(int(d) for d in str(digits)), -precision))
+    return VFixed(value, precision), offset + length
+
+
+def _v_datetime(view, offset):
+    fields = encoding.V_DATETIME.unpack_from(view, offset)
+    tag, year, month, day, hour, minute, second, nanosec, dayofweek = fields
+    value = datetime.datetime(year, month, day, hour, minute, second)
+    return VDateTime(value), offset + encoding.V_DATETIME.size
+
+
+def _v_timedelta(view, offset):
+    fields = encoding.V_TIMEDELTA.unpack_from(view, offset)
+    tag, years, months, days, hours, minutes, seconds, nanosecs = fields
+    if years or months:
+        raise ValueError("Cannot decode a time delta of years or months into a timedelta")
+    value = timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds, microseconds=nanosecs // 1000)
+    return VTimeDelta(value), offset + encoding.V_TIMEDELTA.size
+
+
+def _fixed_value(fmt, cls, convert=None):
+    def decode(view, offset):
+        tag, contents = fmt.unpack_from(view, offset)
+        return cls(contents if convert is None else convert(contents)), offset + fmt.size
+    return decode
+
+
+def _text_value(cls):
+    def decode(view, offset):
+        contents, offset = _text(view, offset + encoding.V_TAG.size)
+        return cls(contents), offset
+    return decode
+
+
+def _const_value(value):
+    def decode(view, offset):
+        return value, offset + encoding.V_TAG.size
+    return decode
+
+
+_VALUES = {
+    enum.VTypeInt: _fixed_value(encoding.V_INT, VInt),
+    enum.VTypeFloat: _fixed_value(encoding.V_FLOAT, VFloat),
+    enum.VTypeFixed: _v_fixed,
+    enum.VTypeBool: _fixed_value(encoding.V_BOOL, VBool),
+    enum.VTypeAccount: _fixed_value(encoding.V_ADDR, VAccount, _address),
+    enum.VTypeAsset: _fixed_value(encoding.V_ADDR, VAsset, _address),
+    enum.VTypeContract: _fixed_value(encoding.V_ADDR, VContract, _address),
+    enum.VTypeMsg: _text_value(VMsg),
+    enum.VTypeVoid: _const_value(VVoid),
+    enum.VTypeDateTime: _v_datetime,
+    enum.VTypeTimeDelta: _v_timedelta,
+    enum.VTypeEnum: _text_value(VEnum),
+    enum.VTypeUndefined: _const_value(VUndefined),
+}
+
+
+def decode_value(data, offset=0):
+    """
+    Decode a contract value (VInt, VFixed, VDateTime, ...)
+    :param data: bytes-like object holding the encoded value
+    :param offset: offset of the value in data
+    :return: tuple of the value and the offset following it
+    """
+    view = memoryview(data)
+    try:
+        tag, = encoding.V_TAG.unpack_from(view, offset)
+        decoder = _VALUES[tag]
+    except struct.error:
+        raise ValueError("Truncated value at offset {}".format(offset))
+    except KeyError:
+        raise ValueError("Unknown value type {} at offset {}".format(tag, offset))
+    try:
+        return decoder(view, offset)
+    except struct.error:
+        raise ValueError("Truncated value at offset {}".format(offset))
+
+# ------------------------------------------------------------------------
+# Headers
+# ------------------------------------------------------------------------
+
+
+def _create_contract(view, offset):
+    script, offset = _text(view, offset + encoding.TX_TYPE.size)
+    return CreateContractHeader(script), offset
+
+
+def _sync_local(view, offset):
+    fst, snd, contract = encoding.TX_ADDR.unpack_from(view, offset)
+    return SyncHeader(contract), offset + encoding.TX_ADDR.size
+
+
+def _call(view, offset):
+    fst, snd, address = encoding.TX_ADDR.unpack_from(view, offset)
+    method, offset = _text(view, offset + encoding.TX_ADDR.size, encoding.U64)
+    count, = encoding.U64.unpack_from(view, offset)
+    offset += encoding.U64.size
+
+    args = []
+    for _ in range(count):
+        arg, offset = decode_value(view, offset)
+        args.append(arg)
+    return CallHeader(_address(address), method, args), offset
+
+
+def _create_asset(view, offset):
+    name, offset = _text(view, offset + encoding.TX_TYPE.size)
+    supply, _ = encoding.ASSET_SUPPLY.unpack_from(view, offset)
+    reference, offset = _text(view, offset + encoding.ASSET_SUPPLY.size)
+    asset_type, offset = _text(view, offset)
+
+    precision = None
+    if asset_type == enum.AssetFractional:
+        precision, = encoding.I8.unpack_from(view, offset)
+        precision += 1
+        offset += encoding.I8.size
+
+    metadata, offset = _metadata(view, offset)
+    # The issuer is not part of the signed header
+    return CreateAssetHeader(name, supply, asset_type, reference, None, precision, metadata), offset
+
+
+def _transfer(view, offset):
+    fst, snd, asset, to, balance = encoding.TRANSFER.unpack_from(view, offset)
+    return TransferAssetHeader(_address(asset), _address(to), balance), offset + encoding.TRANSFER.size
+
+
+def _circulate(view, offset):
+    fst, snd, asset, amount = encoding.CIRCULATE.unpack_from(view, offset)
+    return CirculateAssetHeader(_address(asset), amount), offset + encoding.CIRCULATE.size
+
+
+def _bind(view, offset):
+    # The proof is not length prefixed, so it runs to the end of the data
+    fst, snd, contract, asset = encoding.BIND.unpack_from(view, offset)
+    proof = view[offset + encoding.BIND.size:].tobytes()
+    contract = contract.rstrip(b'\x00').decode()
+    asset = asset.rstrip(b'\x00').decode()
+    return BindHeader(asset, contract, proof), len(view)
+
+
+def _revoke(cls):
+    def decode(view, offset):
+        fst, snd, address = encoding.TX_ADDR.unpack_from(view, offset)
+        return cls(_address(address)), offset + encoding.TX_ADDR.size
+    return decode
+
+
+def _create_account(view, offset):
+    pubkey, offset = _bytes(view, offset + encoding.TX_TYPE.size)
+    timezone, offset = _text(view, offset)
+    metadata, offset = _metadata(view, offset)
+    # The account address is not part of the signed header
+    return CreateAccountHeader(pubkey, metadata, None, timezone), offset
+
+
+_HEADERS = {
+    enum.TxTypeCreateContract: _create_contract,
+    enum.TxTypeSyncLocal: _sync_local,
+    enum.TxTypeCall: _call,
+    enum.TxTypeCreateAsset: _create_asset,
+    enum.TxTypeTransfer: _transfer,
+    enum.TxTypeCirculate: _circulate,
+    enum.TxTypeBind: _bind,
+    enum.TxTypeRevokeAsset: _revoke(RevokeAssetHeader),
+    enum.TxTypeCreateAccount: _create_account,
+    enum.TxTypeRevokeAccount: _revoke(RevokeAccountHeader),
+}
+
+
+def decode_header(data, offset=0):
+    """
+    Decode a transaction header, dispatching on its transaction type flags
+    :param data: bytes-like object holding the encoded header
+    :param offset: offset of the header in data
+    :return: tuple of the header and the offset following it
+    """
+    view = memoryview(data)
+    try:
+        flags = encoding.TX_TYPE.unpack_from(view, offset)
+        decoder = _HEADERS[flags]
+    except struct.error:
+        raise ValueError("Truncated header at offset {}".format(offset))
+    except KeyError:
+        raise ValueError("Unknown transaction type {} at offset {}".format(flags, offset))
+    try:
+        return decoder(view, offset)
+    except struct.error:
+        raise ValueError("Truncated header at offset {}".format(offset))
+
+
+def iter_headers(data):
+    """
+    Decode the transaction headers concatenated in data, one at a time. A
+    BindHeader can only be the last one, as its proof runs to the end.
+    """
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        header, offset = decode_header(view, offset)
+        yield header
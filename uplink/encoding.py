@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import struct
+from typing import Dict, Tuple  # noqa: F401
+
+# ------------------------------------------------------------------------
+# Precompiled Layouts
+# ------------------------------------------------------------------------
+
+# Binary layouts of headers and values. Fixed size layouts are compiled once
+# here; variable size ones are compiled once per combination of field lengths
+# by layout().
+
+U16 = struct.Struct('>H')
+U64 = struct.Struct('>Q')
+I8 = struct.Struct('>b')
+
+TX_TYPE = struct.Struct('>HH')
+TRANSFER = struct.Struct('>HH32s32sq')
+CIRCULATE = struct.Struct('>HH32sq')
+TX_ADDR = struct.Struct('>HH32s')
+BIND = struct.Struct('>HH32s32s')
+ASSET_SUPPLY = struct.Struct('>QH')
+
+V_TAG = struct.Struct('>b')
+V_INT = struct.Struct('>bq')
+V_FLOAT = struct.Struct('>bd')
+V_BOOL = struct.Struct('>b?')
+V_ADDR = struct.Struct('>b32s')
+V_FIXED = struct.Struct('>bbbH')
+V_DATETIME = struct.Struct('>bQQQQQQQQ')
+V_TIMEDELTA = struct.Struct('>bQQQQQQQ')
+
+MAX_LAYOUTS = 4096
+
+_layouts = {}  # type: Dict[Tuple[str, Tuple[int, ...]], struct.Struct]
+_concatenated = {}  # type: Dict[Tuple[struct.Struct, ...], struct.Struct]
+
+
+def layout(template, *lengths):
+    """
+    Compiled struct for a format template whose placeholders are filled in
+    with field lengths, e.g. layout('>H{}s', 5) for '>H5s'
+    """
+    key = (template, lengths)
+    try:
+        return _layouts[key]
+    except KeyError:
+        if len(_layouts) >= MAX_LAYOUTS:
+            _layouts.clear()
+        compiled = _layouts[key] = struct.Struct(template.format(*lengths))
+        return compiled
+
+
+def text(value):
+    """Encode a string field, leaving bytes as they are"""
+    return value if isinstance(value, bytes) else value.encode()
+
+
+def concat(layouts):
+    """Compiled struct packing a sequence of layouts one after the other"""
+    key = tuple(layouts)
+    try:
+        return _concatenated[key]
+    except KeyError:
+        if len(_concatenated) >= MAX_LAYOUTS:
+            _concatenated.clear()
+        compiled = _concatenated[key] = struct.Struct('>' + ''.join(fmt.format.lstrip('>') for fmt in key))
+        return compiled
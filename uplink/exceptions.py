@@ -34,3 +34,23 @@ class TransactionRejected(UplinkJsonRpcError):
 class TransactionNonExistent(UplinkJsonRpcError):
     def __init__(self, tx_hash):
         self.tx_hash = tx_hash
+
+
+# Raised by ChainFollower when a block it has already processed no longer
+# matches the chain on the node, e.g. after the node's database was reset
+class ChainDiscontinuity(UplinkJsonRpcError):
+    def __init__(self, index, expected, found):
+        self.index = index
+        self.expected = expected
+        self.found = found
+        self.message = "Block {} changed since it was processed".format(index)
+        self.response = found
+
+
+# Raised by LedgerMirror when the chain grew while every snapshot of the
+# ledger was being read, so no snapshot matches a known block
+class UnstableSnapshot(UplinkJsonRpcError):
+    def __init__(self, attempts):
+        self.attempts = attempts
+        self.message = "The chain grew during each of {} snapshot attempts".format(attempts)
+        self.response = None
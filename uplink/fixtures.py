@@ -2,10 +2,12 @@ import time
 
 import os
 import pytest
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 from uplink.exceptions import TransactionRejected
 from uplink.client import UplinkJsonRpcError, UplinkJsonRpc, Account
 from uplink.cryptography import ecdsa_new
+from uplink.tracker import TxTracker
 
 testAddr = 'fwBVDsVh8SYQy98CzYpNPcbyTRczVUZ96HszhNRB8Ve'
 host = os.getenv('RPC_HOST', 'localhost')
@@ -465,13 +467,16 @@ def wait_until_tx_accepted(rpc, tx_hash):
         raise TransactionRejected(tx_hash, status)
 
 
-def wait_until_tx_processed(rpc, tx_hash):
+def wait_until_tx_processed(rpc, tx_hash, timeout=20):
     """
     Wait until a transaction has been either Accepted or Rejected
     """
-    query_tx_status = rpc.uplink_get_transaction_status
-    wait_until(lambda: query_tx_status(tx_hash) in ["NonExistent", "Accepted", "Rejected"])
-    return query_tx_status(tx_hash) 
+    with TxTracker(rpc) as tracker:
+        try:
+            return tracker.track(tx_hash).result(timeout)
+        except FuturesTimeoutError:
+            pytest.fail("Timed out")
+
 
 def wait_until(pred, tries=20, delay=1):
     """
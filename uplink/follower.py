@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+
+from .client import _prefetch
+from .exceptions import ChainDiscontinuity
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _fingerprint(block):
+    header = block.header
+    return [header.prevHash, header.merkleRoot, header.timestamp]
+
+
+class ChainFollower(object):
+    """
+    Follow the chain of a node, fetching only the blocks added since the last
+    one processed, along with their transactions.
+
+    The follower remembers the index of the next block to process and the
+    header of the last one, optionally in a small JSON checkpoint file so that
+    a restarted process resumes where it stopped. A block counts as processed
+    once the consumer asks for the next one, so after a crash the last block
+    delivered may be delivered again.
+
+    Before fetching new blocks the last processed block is fetched again and
+    compared with the one remembered; if its header changed, the chain has
+    been rewritten and ChainDiscontinuity is raised.
+
+    :param rpc: UplinkJsonRpc client
+    :param start: index of the first block to process, when there is no
+    checkpoint yet
+    :param checkpoint: path of the checkpoint file, if any
+    :param prefetch: number of blocks fetched ahead
+    :param interval: seconds between polls when following the chain
+    """
+
+    def __init__(self, rpc, start=0, checkpoint=None, prefetch=8, interval=1.0):
+        self.rpc = rpc
+        self.checkpoint = checkpoint
+        self.prefetch = prefetch
+        self.interval = interval
+        self.index = start
+        self.last = None
+
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint, 'r') as fd:
+                state = json.load(fd)
+            self.index = state['index']
+            self.last = state['last']
+
+    def _fetch(self, index):
+        return self.rpc.uplink_block(index), self.rpc.uplink_transactions(index)
+
+    def _check_continuity(self):
+        if self.last is None:
+            return
+        block = self.rpc.uplink_block(self.index - 1)
+        found = _fingerprint(block)
+        if found != self.last:
+            raise ChainDiscontinuity(self.index - 1, self.last, found)
+
+    def _advance(self, block):
+        self.index = block.index + 1
+        self.last = _fingerprint(block)
+
+        if self.checkpoint is not None:
+            tmp = self.checkpoint + '.tmp'
+            with open(tmp, 'w') as fd:
+                json.dump({'index': self.index, 'last': self.last}, fd)
+            _replace(tmp, self.checkpoint)
+
+    def iter_new(self):
+        """
+        Iterate over the blocks added since the last one processed
+        :return: generator of (Block, list of Transaction) tuples
+        """
+        self._check_continuity()
+        for block, transactions in _prefetch(self._fetch, self.index, None, self.prefetch):
+            if block.index != self.index:
+                raise ChainDiscontinuity(self.index, self.index, block.index)
+            yield block, transactions
+            self._advance(block)
+
+    def poll(self, callback):
+        """
+        Deliver the blocks added since the last one processed
+        :param callback: function called with each block and its transactions
+        :return: number of blocks delivered
+        """
+        count = 0
+        for block, transactions in self.iter_new():
+            callback(block, transactions)
+            count += 1
+        return count
+
+    def follow(self):
+        """
+        Iterate over new blocks indefinitely, polling the node every interval
+        seconds once the tip of the chain is reached
+        :return: generator of (Block, list of Transaction) tuples
+        """
+        while True:
+            for item in self.iter_new():
+                yield item
+            time.sleep(self.interval)
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar view of asset holdings, for reports over many assets.
+
+Requires ``numpy``, installed with the ``holdings`` extra::
+
+    table = AssetHoldingsTable(rpc.uplink_assets())
+    richest = table.top_holders(10)
+"""
+
+import numpy as np
+
+
+class AssetHoldingsTable(object):
+    """
+    Holdings of many assets, one row per (asset, account) pair. Accounts and
+    assets are numbered once, in ``accounts`` and ``assets``, and the rows are
+    kept as three NumPy arrays of asset numbers, account numbers and balances,
+    so that aggregates run as array operations instead of Python loops.
+
+    :param assets: Asset objects, e.g. from uplink_assets()
+    """
+
+    def __init__(self, assets):
+        self.assets = []
+        counts = []
+        addresses = []
+        balances = []
+        for asset in assets:
+            self.assets.append(asset.address)
+            counts.append(len(asset.holdings))
+            addresses.extend(asset.holdings)
+            balances.extend(asset.holdings.values())
+
+        # Number the accounts in order of first appearance
+        self._accounts = dict.fromkeys(addresses)
+        self.accounts = list(self._accounts)
+        self._accounts.update(zip(self.accounts, range(len(self.accounts))))
+        self._assets = dict((address, i) for i, address in enumerate(self.assets))
+
+        self.asset_ids = np.repeat(np.arange(len(self.assets), dtype=np.int32), counts)
+        self.account_ids = np.array(list(map(self._accounts.__getitem__, addresses)), np.int32)
+        self.balances = np.array(balances, np.int64)
+
+    def __len__(self):
+        return len(self.balances)
+
+    def __repr__(self):
+        return "<AssetHoldingsTable(assets=%i, accounts=%i)>" % (len(self.assets), len(self.accounts))
+
+    def _rows(self, asset):
+        """Mask of the rows of an asset"""
+        try:
+            return self.asset_ids == self._assets[asset]
+        except KeyError:
+            raise ValueError("Unknown asset {}".format(asset))
+
+    # ------------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------------
+
+    def totals(self):
+        """
+        Total held by each account across all assets
+        :return: int64 array, aligned with ``accounts``
+        """
+        totals = np.zeros(len(self.accounts), np.int64)
+        np.add.at(totals, self.account_ids, self.balances)
+        return totals
+
+    def total(self, address):
+        """Total held by an account across all assets, 0 if it holds none"""
+        i = self._accounts.get(address)
+        if i is None:
+            return 0
+        return int(self.balances[self.account_ids == i].sum())
+
+    def asset_totals(self):
+        """
+        Total held of each asset
+        :return: int64 array, aligned with ``assets``
+        """
+        totals = np.zeros(len(self.assets), np.int64)
+        np.add.at(totals, self.asset_ids, self.balances)
+        return totals
+
+    def top_holders(self, n, asset=None):
+        """
+        Accounts holding the most, of one asset or in total
+        :param n: number of accounts
+        :param asset: asset address, None for the totals across assets
+        :return: list of (address, balance) tuples, largest balance first
+        """
+        if asset is None:
+            ids = np.arange(len(self.accounts))
+            balances = self.totals()
+        else:
+            rows = self._rows(asset)
+            ids = self.account_ids[rows]
+            balances = self.balances[rows]
+
+        if n < len(balances):
+            top = np.argpartition(-balances, n)[:n]
+        else:
+            top = np.arange(len(balances))
+        top = top[np.argsort(-balances[top], kind='stable')]
+        return [(self.accounts[ids[i]], int(balances[i])) for i in top]
+
+    def quantile(self, q, asset=None):
+        """
+        Quantiles of the balances of one asset's holders, or of the totals of
+        all accounts
+        :param q: quantile or sequence of quantiles, between 0 and 1
+        :param asset: asset address, None for the totals across assets
+        :return: float or float array
+        """
+        balances = self.totals() if asset is None else self.balances[self._rows(asset)]
+        return np.quantile(balances, q)
+
+    # ------------------------------------------------------------------------
+    # Joins
+    # ------------------------------------------------------------------------
+
+    def join(self, addresses, assets=None):
+        """
+        Balances of the given accounts in the given assets, e.g. to line the
+        holdings up with account records
+        :param addresses: account addresses, one row each
+        :param assets: asset addresses, one column each, defaults to ``assets``
+        :return: int64 array of shape (len(addresses), len(assets)), 0 where an
+        account holds none of an asset
+        """
+        assets = self.assets if assets is None else assets
+
+        # Distinct known accounts and assets, numbered in the result of the
+        # join below; unknown or repeated addresses are copied from it after
+        row_ids, rows = _numbering(self._accounts, addresses, len(self.accounts))
+        column_ids, columns = _numbering(self._assets, assets, len(self.assets))
+
+        row = row_ids[self.account_ids]
+        column = column_ids[self.asset_ids]
+        selected = (row >= 0) & (column >= 0)
+
+        # The last row and column stay 0, for unknown addresses
+        distinct = np.zeros((row_ids.max() + 2, column_ids.max() + 2), np.int64)
+        distinct[row[selected], column[selected]] = self.balances[selected]
+        return distinct[rows][:, columns]
+
+
+def _numbering(numbers, addresses, count):
+    """
+    Number the distinct known addresses of a list
+    :param numbers: dict of address to id, e.g. AssetHoldingsTable._accounts
+    :param addresses: list of addresses, possibly repeated or unknown
+    :param count: number of ids
+    :return: array of the number of each id, -1 for ids not listed, and array
+    of the number of each address, -1 for unknown ones
+    """
+    ids = np.array([numbers.get(address, -1) for address in addresses], np.int64)
+    known = np.unique(ids[ids >= 0])
+    # One extra entry, which the unknown addresses' id of -1 points to
+    id_numbers = np.full(count + 1, -1, np.int64)
+    id_numbers[known] = np.arange(len(known))
+    return id_numbers, id_numbers[ids]
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+import multiprocessing
+
+from ecdsa import util
+
+from uplink import secp256k1
+from uplink.cache import LRUCache
+from uplink.cryptography import order, signing_key, derive_account_address, _account_address
+
+
+def _generate(_):
+    secret = util.randrange(order)
+    x, y = secp256k1.base_multiply(secret)
+    return _account_address(x, y), secret
+
+
+class KeyStore(object):
+    """
+    Many private keys kept in a single file, one ``address secret`` line per
+    key with the secret in hex, and loaded by account address on demand.
+
+    Opening a keystore only indexes the offset of each address in the file;
+    a key is parsed when first requested and kept in an LRU cache of
+    ``cache_size`` SigningKey objects.
+
+    Secrets are stored unencrypted, as save_key does for PEM files: anyone
+    able to read the file holds the keys. A new keystore file is created
+    readable and writable by its owner only.
+
+    :param path: path of the keystore file, created if missing
+    :param cache_size: maximum number of parsed keys kept in memory
+    """
+
+    def __init__(self, path, cache_size=1024):
+        self.path = path
+        self._keys = LRUCache(cache_size)
+        self._index = {}
+        self._lock = threading.Lock()
+
+        self._file = os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o600), 'r+b')
+
+        offset = 0
+        for line in self._file:
+            address = line.split(b' ', 1)[0].decode()
+            self._index[address] = offset
+            offset += len(line)
+
+    def _append(self, entries):
+        lines = ['{} {:x}\n'.format(address, secret).encode() for address, secret in entries]
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(b''.join(lines))
+            self._file.flush()
+            for (address, secret), line in zip(entries, lines):
+                self._index[address] = offset
+                offset += len(line)
+
+    def generate(self, count, processes=None):
+        """
+        Generate new keys and add them to the keystore
+        :param count: number of keys to generate
+        :param processes: number of worker processes generating keys, if more
+        than one
+        :return: list of the addresses of the new keys
+        """
+        if processes is None or processes <= 1:
+            entries = [_generate(i) for i in range(count)]
+        else:
+            pool = multiprocessing.Pool(processes)
+            try:
+                entries = pool.map(_generate, range(count), max(1, count // (processes * 4)))
+            finally:
+                pool.close()
+                pool.join()
+
+        self._append(entries)
+        return [address for address, secret in entries]
+
+    def add(self, private_key):
+        """
+        Add a private key to the keystore
+        :param private_key: SigningKey
+        :return: account address of the key
+        """
+        address = derive_account_address(private_key.verifying_key)
+        self._append([(address, private_key.privkey.secret_multiplier)])
+        self._keys.put(address, private_key)
+        return address
+
+    def get(self, address):
+        """
+        Private key of an account, loaded from the file on first use. Raises
+        ValueError if the keystore holds no key for the address or its line
+        in the file is not a valid secret.
+        :param address: account address
+        :return: SigningKey
+        """
+        private_key = self._keys.get(address)
+        if private_key is not None:
+            return private_key
+        if address not in self._index:
+            raise ValueError("No key for address {}".format(address))
+
+        with self._lock:
+            self._file.seek(self._index[address])
+            line = self._file.readline()
+        try:
+            secret = int(line.split(b' ', 1)[1], 16)
+            private_key = signing_key(secret)
+        except (IndexError, ValueError):
+            raise ValueError("Invalid key for address {} in {}".format(address, self.path))
+        self._keys.put(address, private_key)
+        return private_key
+
+    def __getitem__(self, address):
+        return self.get(address)
+
+    def __contains__(self, address):
+        return address in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(list(self._index))
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
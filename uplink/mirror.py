@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from .follower import ChainFollower
+from .exceptions import UplinkJsonRpcError, ChainDiscontinuity, UnstableSnapshot
+from .cryptography import _account_address
+from .protocol import (Account, Transfer, Circulate, CreateAccount, RevokeAccount, RevokeAsset, CreateAsset,
+                       CreateContract, Call, Bind, SyncLocal)
+
+
+def _has_block(rpc, index):
+    try:
+        rpc.uplink_block(index)
+    except UplinkJsonRpcError as e:
+        # Subclasses are connection or response errors, not a missing block
+        if type(e) is not UplinkJsonRpcError:
+            raise
+        return False
+    return True
+
+
+def chain_height(rpc, start=0):
+    """
+    Number of blocks on a node, found with a few block queries: galloping
+    from start, then bisecting
+    :param rpc: UplinkJsonRpc client
+    :param start: number of blocks known to exist
+    :return: index of the first missing block
+    """
+    found, step = start - 1, 1
+    missing = start
+    while _has_block(rpc, missing):
+        found = missing
+        missing += step
+        step *= 2
+
+    while missing - found > 1:
+        middle = (found + missing) // 2
+        if _has_block(rpc, middle):
+            found = middle
+        else:
+            missing = middle
+    return missing
+
+
+def _pubkey_address(pubkey):
+    """Account address of a hex encoded public key, as in CreateAccount headers"""
+    if isinstance(pubkey, bytes):
+        pubkey = pubkey.decode()
+    half = len(pubkey) // 2
+    return _account_address(int(pubkey[:half], 16), int(pubkey[half:], 16))
+
+
+class LedgerMirror(object):
+    """
+    In-process copy of the accounts, assets and contracts of a node, kept up
+    to date from new blocks so that lookups need no RPC.
+
+    ``bootstrap`` loads the ledger and the chain height it matches; if the
+    chain grows while the ledger is read, it tries again, and raises
+    UnstableSnapshot after ``attempts`` tries. ``update`` then follows the
+    chain with a ChainFollower, applying the transactions of each new block:
+
+    - Transfer, Circulate, CreateAccount, RevokeAccount and RevokeAsset are
+      applied in memory
+    - assets and contracts created by CreateAsset and CreateContract are
+      loaded once the new blocks are applied, as their addresses derive from
+      the transaction hash
+    - contracts changed by Call, Bind and SyncLocal are fetched again once the
+      new blocks are applied, as their state is computed by the node
+
+    Objects loaded after the new blocks reflect the node's state when they are
+    fetched, which includes any block added in the meantime.
+
+    The mirror keeps the objects the client builds for it, which are its own
+    as the client builds new ones for every call, even from cached responses.
+    Lookups return the mirrored objects, which later updates modify in place.
+    ``staleness`` reports how many blocks the node has that the mirror has
+    not applied yet. If the node's chain is rewritten, ``update`` raises
+    ChainDiscontinuity and the mirror should be bootstrapped again. Background
+    updates started with ``start`` bootstrap again on their own, and keep the
+    exception of the last failed update in ``error``, None once an update
+    succeeds.
+
+    :param rpc: UplinkJsonRpc client
+    :param prefetch: number of blocks fetched ahead
+    :param interval: seconds between updates when following the chain
+    :param attempts: number of snapshot attempts made by bootstrap
+    """
+
+    def __init__(self, rpc, prefetch=8, interval=1.0, attempts=3):
+        self.rpc = rpc
+        self.prefetch = prefetch
+        self.interval = interval
+        self.attempts = attempts
+
+        self.accounts = {}
+        self.assets = {}
+        self.contracts = {}
+        self.index = 0
+        self.error = None
+
+        self._lock = threading.Lock()
+        # Held through each update, which the user and background threads may
+        # both run over the same ChainFollower
+        self._update_lock = threading.Lock()
+        self._follower = None
+        self._closed = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------------
+    # Synchronisation
+    # ------------------------------------------------------------------------
+
+    def bootstrap(self):
+        """
+        Load the ledger from the node
+        :return: number of blocks the loaded ledger reflects
+        """
+        height = chain_height(self.rpc)
+        for _ in range(self.attempts):
+            accounts = self.rpc.uplink_accounts()
+            assets = self.rpc.uplink_assets()
+            contracts = self.rpc.uplink_contracts()
+
+            after = chain_height(self.rpc, height)
+            if after == height:
+                break
+            height = after
+        else:
+            raise UnstableSnapshot(self.attempts)
+
+        with self._lock:
+            self.accounts = dict((account.address, account) for account in accounts)
+            self.assets = dict((asset.address, asset) for asset in assets)
+            self.contracts = dict((contract.address, contract) for contract in contracts)
+            self.index = height
+        self._follower = ChainFollower(self.rpc, start=height, prefetch=self.prefetch)
+        return height
+
+    def update(self):
+        """
+        Apply the blocks added to the chain since the last update
+        :return: number of blocks applied
+        """
+        with self._update_lock:
+            return self._update()
+
+    def _update(self):
+        if self._follower is None:
+            self.bootstrap()
+
+        count = 0
+        created = set()
+        changed = set()
+        for block, transactions in self._follower.iter_new():
+            with self._lock:
+                for tx in transactions:
+                    self._apply(tx, created, changed)
+                self.index = block.index + 1
+            count += 1
+
+        if CreateAsset in created:
+            self._load_new(self.assets, self.rpc.uplink_assets())
+        if CreateContract in created:
+            self._load_new(self.contracts, self.rpc.uplink_contracts())
+        for address in changed:
+            contract = self.rpc.uplink_get_contract(address)
+            with self._lock:
+                self.contracts[address] = contract
+        return count
+
+    def _load_new(self, mirrored, objects):
+        with self._lock:
+            for obj in objects:
+                if obj.address not in mirrored:
+                    mirrored[obj.address] = obj
+
+    def _apply(self, tx, created, changed):
+        """
+        Apply a transaction to the mirrored ledger
+        :param created: set of the kinds of creations seen, whose objects
+        are loaded after the update
+        :param changed: set of the contract addresses to fetch again
+        """
+        wrapper = getattr(tx.header, 'contents', None)
+        kind = type(wrapper)
+        hdr = getattr(wrapper, 'contents', None)
+
+        if kind is Transfer:
+            asset = self.assets.get(hdr.assetAddr)
+            if asset is not None:
+                holdings = asset.holdings
+                holdings[tx.origin] = holdings.get(tx.origin, 0) - hdr.balance
+                holdings[hdr.toAddr] = holdings.get(hdr.toAddr, 0) + hdr.balance
+        elif kind is Circulate:
+            asset = self.assets.get(hdr.assetAddr)
+            if asset is not None:
+                asset.supply -= hdr.amount
+                asset.holdings[tx.origin] = asset.holdings.get(tx.origin, 0) + hdr.amount
+        elif kind is CreateAccount:
+            address = _pubkey_address(hdr.pubKey)
+            self.accounts[address] = Account(hdr.timezone, hdr.pubKey, dict(hdr.metadata.contents), address)
+        elif kind is RevokeAccount:
+            self.accounts.pop(hdr.address, None)
+        elif kind is RevokeAsset:
+            self.assets.pop(hdr.address, None)
+        elif kind in (CreateAsset, CreateContract):
+            created.add(kind)
+        elif kind is Call:
+            changed.add(hdr.address)
+        elif kind in (Bind, SyncLocal):
+            changed.add(hdr.contract)
+
+    def staleness(self):
+        """Number of blocks on the node not applied to the mirror yet"""
+        return chain_height(self.rpc, self.index) - self.index
+
+    # ------------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------------
+
+    def get_account(self, address):
+        """Mirrored account, None if unknown"""
+        with self._lock:
+            return self.accounts.get(address)
+
+    def get_asset(self, address):
+        """Mirrored asset, None if unknown"""
+        with self._lock:
+            return self.assets.get(address)
+
+    def get_contract(self, address):
+        """Mirrored contract, None if unknown"""
+        with self._lock:
+            return self.contracts.get(address)
+
+    def balance(self, asset_address, account_address):
+        """Holdings of an account in an asset, 0 if it holds none"""
+        with self._lock:
+            asset = self.assets.get(asset_address)
+            if asset is None:
+                return 0
+            return asset.holdings.get(account_address, 0)
+
+    # ------------------------------------------------------------------------
+    # Background Updates
+    # ------------------------------------------------------------------------
+
+    def start(self):
+        """Update the mirror every interval seconds in a background thread"""
+        if self._follower is None:
+            self.bootstrap()
+        self._closed.clear()
+        self._thread = threading.Thread(target=self._update_periodically)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _update_periodically(self):
+        while not self._closed.wait(self.interval):
+            try:
+                self.update()
+            except Exception as e:
+                # Retried on the next interval, as check_health does
+                self.error = e
+                if isinstance(e, ChainDiscontinuity):
+                    with self._update_lock:
+                        self._follower = None
+            else:
+                self.error = None
+
+    def close(self):
+        """Stop background updates"""
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import multiprocessing
+from typing import List  # noqa: F401
+
+from uplink import secp256k1
+from uplink.cryptography import Signer, pack_signature, _sign_secret
+
+# Private keys held by a worker process, by position in the signer's key list
+_secrets = []  # type: List[int]
+
+
+def _init_worker(secrets):
+    global _secrets
+    _secrets = secrets
+    secp256k1._get_table()
+
+
+def _sign_in_worker(item):
+    key_id, msg = item
+    r, s = _sign_secret(_secrets[key_id], msg)
+    return pack_signature(r, s)
+
+
+def _secret(private_key):
+    if isinstance(private_key, Signer):
+        return private_key.secret
+    return private_key.privkey.secret_multiplier
+
+
+class ParallelSigner(object):
+    """
+    Signs header byte streams in a pool of worker processes, sidestepping the
+    GIL. The private keys are handed to the workers once, when they start;
+    each request only carries the position of its key and the message.
+
+    Pass it as ``signer`` to the client's transaction methods, which then sign
+    with it instead of in the calling thread.
+
+    :param private_keys: SigningKey or Signer objects the workers sign with
+    :param processes: number of worker processes, defaults to the CPU count
+    """
+
+    def __init__(self, private_keys, processes=None):
+        secrets = [_secret(key) for key in private_keys]
+        self._ids = dict((secret, i) for i, secret in enumerate(secrets))
+        self.processes = processes or multiprocessing.cpu_count()
+        self._pool = multiprocessing.Pool(self.processes, _init_worker, (secrets,))
+
+    def _item(self, private_key, msg):
+        try:
+            return self._ids[_secret(private_key)], msg
+        except KeyError:
+            raise ValueError("Private key is not held by the signer")
+
+    def sign(self, private_key, msg):
+        """
+        Sign a message
+        :param private_key: one of the signer's private keys
+        :param msg: message bytes, e.g. from a header's to_binary()
+        :return: packed signature
+        """
+        return self._pool.apply(_sign_in_worker, (self._item(private_key, msg),))
+
+    def sign_many(self, items, chunksize=16):
+        """
+        Sign many messages, spread over the worker processes
+        :param items: list of (private_key, msg) tuples
+        :param chunksize: number of messages sent to a worker at a time
+        :return: packed signatures in input order
+        """
+        items = [self._item(private_key, msg) for private_key, msg in items]
+        return self._pool.map(_sign_in_worker, items, chunksize)
+
+    def close(self):
+        """Stop the worker processes"""
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,15 +1,21 @@
 import json
-import struct
 import six
 from uplink.utils import to_bytes
-from base58 import b58decode
+from uplink.b58 import decode_address
 from typing import NamedTuple
 from decimal import Decimal
 import datetime
 from datetime import timedelta
 import uplink.enum as enum
+import uplink.encoding as encoding
+from uplink.encoding import layout, concat, text
 from uplink.cryptography import (ecdsa_sign, derive_asset_address)
 
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence  # type: ignore
+
 
 # ------------------------------------------------------------------------
 # Serializers
@@ -18,45 +24,172 @@ from uplink.cryptography import (ecdsa_sign, derive_asset_address)
 
 class Serializer(object):
     @staticmethod
-    def serialize(object, **kwargs):
-        return json.dumps(object, sort_keys=True, **kwargs)
+    def serialize(object, sort_keys=True, **kwargs):
+        return json.dumps(object, sort_keys=sort_keys, **kwargs)
 
 
 def _to_dict(obj, classkey=None, *args, **kwargs):
+    try:
+        convert = _converters[type(obj)]
+    except KeyError:
+        convert = _converters[type(obj)] = _converter(obj)
+    return convert(obj, classkey)
+
+
+def _converter(obj):
+    """
+    Pick how objects of this type convert to dicts. The choice is made from
+    the first object seen of each type and reused for all others.
+    """
     if isinstance(obj, dict):
-        data = {}
-        for (k, v) in obj.items():
-            data[k] = _to_dict(v, classkey)
-        return data
-
+        return _dict_to_dict
     elif hasattr(obj, "_asdict"):
-        return _to_dict(obj._asdict())
+        if _uses_tagged_asdict(type(obj)):
+            return _tagged_converter(type(obj))
+        return _asdict_to_dict
     elif hasattr(obj, "_ast"):
-        return _to_dict(obj._ast())
+        return _ast_to_dict
     elif hasattr(obj, "__iter__") and not (isinstance(obj, str) or isinstance(obj, bytes)):
-        return [_to_dict(v, classkey) for v in obj]
+        return _iter_to_dict
     elif hasattr(obj, "__dict__"):
+        return _object_to_dict
+    elif _slot_names(type(obj)):
+        return _slots_converter(type(obj))
+    elif isinstance(obj, bytes):
+        return _bytes_to_dict
+    else:
+        return _scalar_to_dict
+
+
+def _uses_tagged_asdict(cls):
+    """Whether cls inherits Tagged._asdict without overriding it"""
+    for base in cls.__mro__:
+        if base is Tagged:
+            return True
+        if "_asdict" in vars(base):
+            return False
+    return False
 
-        data = dict([(key, _to_dict(value, classkey))
-                     for key, value in six.iteritems(obj.__dict__)
-                     if not callable(value) and not key.startswith('_')])
 
-        if classkey is not None and hasattr(obj, "__class__"):
+def _slot_names(cls):
+    """Public attribute names declared in the __slots__ of cls and its bases"""
+    names = []
+    for base in reversed(cls.__mro__):
+        slots = vars(base).get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if not name.startswith('_'))
+    return names
+
+
+def _slots_converter(cls):
+    """Converter building the dict of a __slots__ object, like _object_to_dict"""
+    names = _slot_names(cls)
+
+    def convert(obj, classkey):
+        data = {}
+        for name in names:
+            try:
+                value = getattr(obj, name)
+            except AttributeError:
+                continue
+            if type(value) in _SCALARS:
+                data[name] = value
+            elif not callable(value):
+                data[name] = _to_dict(value, classkey)
+
+        if classkey is not None:
             data[classkey] = obj.__class__.__name__
         return data
-    else:
-        if isinstance(obj, bytes):
-            obj = obj.decode()
-        return obj
+    return convert
+
+
+def _tagged_converter(cls):
+    """Converter building the dict of a Tagged named tuple from its fields directly"""
+    fields = cls._fields
+    tag = cls.__name__
+
+    def convert(obj, classkey):
+        data = {}
+        for field, value in zip(fields, obj):
+            data[field] = value if type(value) in _SCALARS else _to_dict(value)
+        data['tag'] = tag
+        return data
+    return convert
+
+
+def _dict_to_dict(obj, classkey):
+    return {k: _to_dict(v, classkey) for k, v in obj.items()}
+
+
+def _asdict_to_dict(obj, classkey):
+    return _to_dict(obj._asdict())
+
+
+def _ast_to_dict(obj, classkey):
+    return _to_dict(obj._ast())
+
+
+def _iter_to_dict(obj, classkey):
+    return [_to_dict(v, classkey) for v in obj]
+
+
+def _object_to_dict(obj, classkey):
+    data = {}
+    for key, value in six.iteritems(obj.__dict__):
+        if type(value) in _SCALARS:
+            if not key.startswith('_'):
+                data[key] = value
+        elif not key.startswith('_') and not callable(value):
+            data[key] = _to_dict(value, classkey)
+
+    if classkey is not None:
+        data[classkey] = obj.__class__.__name__
+    return data
+
+
+def _bytes_to_dict(obj, classkey):
+    return obj.decode()
+
+
+def _scalar_to_dict(obj, classkey):
+    return obj
+
+
+# Types converting to themselves, which converters may skip calling _to_dict on
+_SCALARS = frozenset([six.text_type, int, float, bool, type(None)])
+
+_converters = dict.fromkeys(_SCALARS, _scalar_to_dict)
+_converters[bytes] = _bytes_to_dict
 
 
 class Serializable(object):
+    __slots__ = ()
+
     def to_dict(self, *args, **kwargs):
         return _to_dict(self, *args, **kwargs)
 
-    def to_binary(self):
+    def _layout(self):
+        """Compiled struct and field values of the binary encoding"""
         raise NotImplementedError
 
+    def binary_size(self):
+        """Size in bytes of the binary encoding"""
+        return self._layout()[0].size
+
+    def to_binary_into(self, buf, offset=0):
+        """
+        Write the binary encoding into a writable buffer (bytearray, memoryview)
+        at offset, returning the offset following it
+        """
+        fmt, values = self._layout()
+        fmt.pack_into(buf, offset, *values)
+        return offset + fmt.size
+
+    def to_binary(self):
+        fmt, values = self._layout()
+        return fmt.pack(*values)
+
     def to_json(self, **kwargs):
         return Serializer.serialize(self.to_dict(), **kwargs)
 
@@ -87,7 +220,7 @@ class Block(Serializable):
 
     def __init__(self, header, signatures, index, transactions):
         self.header = BlockHeader(header)
-        self.transactions = transactions
+        self.transactions = LazyTransactions(transactions)
         self.index = index
         self.signatures = signatures
         self.addr = None
@@ -190,14 +323,15 @@ class AssetType(Serializable):
     def _asdict(self):
         return {"tag": self.type, "contents": self.precision}
 
-    def to_binary(self):
-        fmt = ">H{}s".format(len(self.type))
-        typ = struct.pack(fmt, len(self.type), self.type.encode())
-
-        prec = self.precision
-        mprec = b'' if prec is None else struct.pack(">b", (self.precision - 1))
+    def _format(self):
+        """Format template, field lengths and values, to embed in a header layout"""
+        if self.precision is None:
+            return "H{}s", (len(self.type),), (len(self.type), text(self.type))
+        return "H{}sb", (len(self.type),), (len(self.type), text(self.type), self.precision - 1)
 
-        return (typ + mprec)
+    def _layout(self):
+        template, lengths, values = self._format()
+        return layout(">" + template, *lengths), values
 
 
 class AssetRef(Serializable):
@@ -209,24 +343,22 @@ class AssetRef(Serializable):
         else:
             raise ValueError(str(asset_ref) + "is not a valid asset reference")
 
-    def to_binary(self):
-        fmt = ">H{}s".format(len(self.type))
-        byts = struct.pack(fmt, len(self.ref))
-        return struct.pack(fmt, len(self.ref), byts)
+    def _layout(self):
+        return layout(">H{}s", len(self.ref)), (len(self.ref), text(self.ref))
 
 
 class VInt(Tagged, Serializable, NamedTuple("VInt", [('contents', int)])):
-    def to_binary(self):
-        return struct.pack('>bq', enum.VTypeInt, self.contents)
+    def _layout(self):
+        return encoding.V_INT, (enum.VTypeInt, self.contents)
 
 
 class VFloat(Tagged, Serializable, NamedTuple('VFloat', [('contents', float)])):
-    def to_binary(self):
-        return struct.pack('>bd', enum.VTypeFloat, self.contents)
+    def _layout(self):
+        return encoding.V_FLOAT, (enum.VTypeFloat, self.contents)
 
 
 class VFixed(Tagged, Serializable, NamedTuple('VFixed', [('contents', Decimal), ('precision', int)])):
-    def to_binary(self):
+    def _layout(self):
         value = self.contents.as_tuple()
         digits = int("".join(map(str, value.digits)))
         if value.sign == 0:
@@ -237,8 +369,8 @@ class VFixed(Tagged, Serializable, NamedTuple('VFixed', [('contents', Decimal),
         length = length_bits // 8
         if not length_bits % 8 == 0:
             length = length + 1
-        return struct.pack('>bbbH{}s'.format(length), enum.VTypeFixed, (self.precision - 1), sign, length,
-                           to_bytes(digits, length, byteorder='little'))
+        return layout('>bbbH{}s', length), (enum.VTypeFixed, (self.precision - 1), sign, length,
+                                            to_bytes(digits, length, byteorder='little'))
 
     def _asdict(self):
         result = super(VFixed, self)._asdict()
@@ -247,33 +379,32 @@ class VFixed(Tagged, Serializable, NamedTuple('VFixed', [('contents', Decimal),
 
 
 class VBool(Tagged, Serializable, NamedTuple('VBool', [('contents', bool)])):
-    def to_binary(self):
-        return struct.pack('>b?', enum.VTypeBool, self.contents)
+    def _layout(self):
+        return encoding.V_BOOL, (enum.VTypeBool, self.contents)
 
 class VAccount(Tagged, Serializable, NamedTuple('VAccount', [('contents', str)])):
-    def to_binary(self):
-        return struct.pack('>b32s', enum.VTypeAccount, b58decode(self.contents))
+    def _layout(self):
+        return encoding.V_ADDR, (enum.VTypeAccount, decode_address(self.contents))
 
 
 class VAsset(Tagged, Serializable, NamedTuple('VAsset', [('contents', str)])):
-    def to_binary(self):
-        return struct.pack('>b32s', enum.VTypeAsset, b58decode(self.contents))
+    def _layout(self):
+        return encoding.V_ADDR, (enum.VTypeAsset, decode_address(self.contents))
 
 
 class VContract(Tagged, Serializable, NamedTuple('VContract', [('contents', str)])):
-    def to_binary(self):
-        return struct.pack('>b32s', enum.VTypeContract, b58decode(self.contents))
+    def _layout(self):
+        return encoding.V_ADDR, (enum.VTypeContract, decode_address(self.contents))
 
 
 class VMsg(Tagged, Serializable, NamedTuple('VMsg', [('contents', str)])):
-    def to_binary(self):
-        return struct.pack('>bH{}s'.format(str(len(self.contents))), enum.VTypeMsg, len(self.contents),
-                           self.contents.encode())
+    def _layout(self):
+        return layout('>bH{}s', len(self.contents)), (enum.VTypeMsg, len(self.contents), text(self.contents))
 
 
 class VVoid(Tagged, Serializable, NamedTuple('VVoid', [])):
-    def to_binary(self):
-        return struct.pack('>b', enum.VTypeVoid)
+    def _layout(self):
+        return encoding.V_TAG, (enum.VTypeVoid,)
 
 
 VVoid = VVoid()  # type: ignore
@@ -285,7 +416,7 @@ class VDateTime(Tagged, Serializable, NamedTuple('VDateTime', [('contents', date
         result['contents'] = self.contents.strftime("%Y-%m-%dT%H:%M:%S+00:00")
         return result
 
-    def to_binary(self):
+    def _layout(self):
         dt = self.contents
         year = dt.year
         month = dt.month
@@ -295,11 +426,11 @@ class VDateTime(Tagged, Serializable, NamedTuple('VDateTime', [('contents', date
         second = dt.second
         # .weekday() has Monday as 0, Sunday as 6. Uplink Sunday is 0 Monday is 1
         dayofweek = (datetime.date(year, month, day).weekday() + 1) % 7
-        return struct.pack('>bQQQQQQQQ', enum.VTypeDateTime, year, month, day, hour, minute, second, 0, dayofweek)
+        return encoding.V_DATETIME, (enum.VTypeDateTime, year, month, day, hour, minute, second, 0, dayofweek)
 
 
 class VTimeDelta(Tagged, Serializable, NamedTuple('VTimeDelta', [('contents', timedelta)])):
-    def to_binary(self):
+    def _layout(self):
         year = self.contents.year
         month = self.contents.month
         day = self.contents.day
@@ -307,21 +438,20 @@ class VTimeDelta(Tagged, Serializable, NamedTuple('VTimeDelta', [('contents', ti
         minute = self.contents.minute
         second = self.contents.second
         nanosec = self.contents.microsecond * 1000
-        return struct.pack('>bQQQQQQQ', enum.VTypeTimeDelta, year, month, day, hour, minute, second, nanosec)
+        return encoding.V_TIMEDELTA, (enum.VTypeTimeDelta, year, month, day, hour, minute, second, nanosec)
 
 
 class VUndefined(Tagged, Serializable, NamedTuple('VUndefined', [])):
-    def to_binary(self):
-        return struct.pack('>b', enum.VTypeUndefined)
+    def _layout(self):
+        return encoding.V_TAG, (enum.VTypeUndefined,)
 
 
 VUndefined = VUndefined()  # type: ignore
 
 
 class VEnum(Tagged, Serializable, NamedTuple('VEnum', [('contents', str)])):
-    def to_binary(self):
-        return struct.pack('>bH{}s'.format(str(len(self.contents))), enum.VTypeEnum, len(self.contents),
-                           self.contents.encode())
+    def _layout(self):
+        return layout('>bH{}s', len(self.contents)), (enum.VTypeEnum, len(self.contents), text(self.contents))
 
 class Contract(Serializable):
     """Contracts Object"""
@@ -342,28 +472,21 @@ class Contract(Serializable):
         return "<Contract(address=%s)>" % self.address
 
 class Metadata(Serializable, NamedTuple('Metadata', [('contents', dict)])):
-    def to_binary(self):
-        len_pack = struct.pack(">H", len(self.contents))
-        structured = len_pack
-
-        meta_structure = b""
-
+    def _format(self):
+        """Format template, field lengths and values, to embed in a header layout"""
+        lengths = []
+        values = [len(self.contents)]
         for key in sorted(six.iterkeys(self.contents)):
             value = self.contents[key]
-            pack_key = str(len(key)) + "s"
-            key_len = len(key)
-
-            pack_value = str(len(value)) + "s"
-            value_len = len(value)
-
-            metapack = (">H" + pack_key + "H" + pack_value).encode()
+            lengths += (len(key), len(value))
+            values += (len(key), text(key), len(value), text(value))
 
-            meta_structure = meta_structure + \
-                             struct.pack(metapack, key_len, key.encode(),
-                                         value_len, value.encode())
+        return "H" + "H{}sH{}s" * len(self.contents), lengths, values
 
+    def _layout(self):
+        template, lengths, values = self._format()
+        return layout(">" + template, *lengths), values
 
-        return structured + meta_structure
     def _asdict(self):
         result = super(Metadata, self)._asdict()
         return result['contents']
@@ -397,10 +520,203 @@ class Transaction(Serializable):
         self.signature = signature
         self.origin = origin
 
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Transaction from its JSON form, with the header decoded into header
+        objects, e.g. TxAsset(Transfer(TransferAssetHeader(...)))
+        """
+        return cls(header_from_dict(data['header']), data['signature'], data['origin'])
+
     def __repr__(self):
         return "<Transaction(signature=%s)>" % self.signature
 
 
+class LazyTransactions(Sequence):
+    """
+    Read-only list of transactions kept in their JSON form, each decoded into
+    a Transaction the first time it is accessed. Block scanners that only
+    look at a few transactions of each block skip decoding the others.
+
+    :param raw: list of transactions in JSON form
+    :param transaction: class decoding them, Transaction or CompactTransaction
+    """
+
+    __slots__ = ('_raw', '_decoded', '_transaction')
+
+    def __init__(self, raw, transaction=Transaction):
+        self._raw = raw
+        self._decoded = {}
+        self._transaction = transaction
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        if index < 0:
+            index += len(self._raw)
+        if not 0 <= index < len(self._raw):
+            raise IndexError("transaction index out of range")
+        try:
+            return self._decoded[index]
+        except KeyError:
+            tx = self._decoded[index] = self._transaction.from_dict(self._raw[index])
+            return tx
+
+    def __iter__(self):
+        for i in range(len(self._raw)):
+            yield self[i]
+
+    def __repr__(self):
+        return "<LazyTransactions(len=%i)>" % len(self._raw)
+
+
+def _lazy_transactions_to_dict(obj, classkey):
+    """Undecoded transactions convert straight from their JSON form"""
+    decoded = obj._decoded
+    return [_to_dict(decoded.get(i, raw), classkey) for i, raw in enumerate(obj._raw)]
+
+
+_converters[LazyTransactions] = _lazy_transactions_to_dict
+
+
+# ------------------------------------------------------------------------
+# Compact Response Models
+# ------------------------------------------------------------------------
+
+
+class CompactBlock(Serializable):
+    """Block holding its attributes in __slots__, with the same to_dict output"""
+
+    __slots__ = ('header', 'transactions', 'index', 'signatures', 'addr')
+
+    def __init__(self, header, signatures, index, transactions):
+        self.header = CompactBlockHeader(header)
+        self.transactions = LazyTransactions(transactions, CompactTransaction)
+        self.index = index
+        self.signatures = signatures
+        self.addr = None
+
+    def __repr__(self):
+        return "<CompactBlock(index=%i)>" % self.index
+
+
+class CompactBlockHeader(Serializable):
+    """BlockHeader holding its attributes in __slots__"""
+
+    __slots__ = ('origin', 'merkleRoot', 'timestamp', 'prevHash')
+
+    def __init__(self, header):
+        self.origin = header['origin']
+        self.merkleRoot = header['merkleRoot']
+        self.timestamp = header['timestamp']
+        self.prevHash = header['prevHash']
+
+
+class CompactPeer(object):
+    """Peer holding its attributes in __slots__"""
+
+    __slots__ = ('tag', 'contents')
+
+    def __init__(self, tag, contents):
+        self.tag = tag
+        self.contents = CompactPeerContents(contents)
+
+    def __repr__(self):
+        return "<CompactPeer(contents=%s)>" % self.contents
+
+
+class CompactPeerContents(object):
+    """PeerContents holding its attributes in __slots__"""
+
+    __slots__ = ('peer_pid', 'peer_acc_addr')
+
+    def __init__(self, contents):
+        self.peer_pid = contents['peerPid']
+        self.peer_acc_addr = contents['peerAccAddr']
+
+
+class CompactAccount(object):
+    """Account holding its attributes in __slots__"""
+
+    __slots__ = ('timezone', 'public_key', 'address', 'metadata')
+
+    def __init__(self, timezone, publicKey, metadata, address):
+        self.timezone = timezone
+        self.public_key = publicKey
+        self.address = address
+
+        assert type(metadata) is dict
+        self.metadata = dict(metadata)
+
+    def __repr__(self):
+        return "<CompactAccount(addr=%s)>" % self.address
+
+
+class CompactAsset(Serializable):
+    """Asset holding its attributes in __slots__, with the same to_dict output"""
+
+    __slots__ = ('address', 'issuedOn', 'assetType', 'name', 'reference', 'supply', 'holdings', 'issuer',
+                 'metadata')
+
+    def __init__(self, address, issuedOn, assetType, name, reference, supply, holdings, issuer, metadata):
+        self.address = address
+        self.issuedOn = issuedOn
+        self.assetType = AssetType(assetType["tag"], assetType["contents"])
+        self.name = name
+        self.reference = reference
+        self.supply = supply
+        self.holdings = holdings
+        self.issuer = issuer
+        self.metadata = metadata
+
+    def __repr__(self):
+        return "<CompactAsset(name=%s)>" % self.name
+
+
+class CompactContract(Serializable):
+    """Contract holding its attributes in __slots__, with the same to_dict output"""
+
+    __slots__ = ('timestamp', 'script', 'storage', 'localStorageVars', 'localStorage', 'methods', 'address',
+                 'owner', 'state')
+
+    def __init__(self, timestamp, address, storage, methods, script, owner,
+                 state, localStorageVars, localStorage, **kwargs):
+        self.timestamp = timestamp
+        self.script = script
+        self.storage = storage
+        self.localStorageVars = localStorageVars
+        self.localStorage = localStorage
+        self.methods = methods
+        self.address = address
+        self.owner = owner
+        self.state = state
+
+    def __repr__(self):
+        return "<CompactContract(address=%s)>" % self.address
+
+
+class CompactTransaction(Serializable):
+    """Transaction holding its attributes in __slots__, with the same to_dict output"""
+
+    __slots__ = ('header', 'signature', 'origin')
+
+    def __init__(self, header, signature, origin):
+        self.header = header
+        self.signature = signature
+        self.origin = origin
+
+    @classmethod
+    def from_dict(cls, data):
+        """CompactTransaction from its JSON form, see Transaction.from_dict"""
+        return cls(header_from_dict(data['header']), data['signature'], data['origin'])
+
+    def __repr__(self):
+        return "<CompactTransaction(signature=%s)>" % self.signature
+
+
 def tag_from_contents(contents):
     """Retrieve class name from function"""
     return contents.__class__.__name__
@@ -453,21 +769,13 @@ class CreateAccountHeader(Serializable):
         assert type(metadata) is dict
         self.metadata = Metadata(metadata)
 
-    def to_binary(self):
-        pack_timezone = str(len(self.timezone)) + "s"
-        timezone_len = len(self.timezone)
-
-        key_str = self.pubKey
-        pack_pubkey = str(len(key_str)) + "s"
-        pubkey_len = len(key_str)
+    def _layout(self):
+        meta_template, meta_lengths, meta_values = self.metadata._format()
 
-
-        package = ">HHH" + pack_pubkey + "H" + pack_timezone
-        structured = struct.pack(
-            package, enum.TxTypeCreateAccount[0], enum.TxTypeCreateAccount[1], pubkey_len, key_str, timezone_len, self.timezone.encode())
-        structured = structured + self.metadata.to_binary()
-
-        return structured
+        fmt = layout(">HHH{}sH{}s" + meta_template, len(self.pubKey), len(self.timezone), *meta_lengths)
+        values = [enum.TxTypeCreateAccount[0], enum.TxTypeCreateAccount[1],
+                  len(self.pubKey), text(self.pubKey), len(self.timezone), text(self.timezone)]
+        return fmt, values + meta_values
   
 #    def to_dict(self):
 #        return { "tag" : "CreateAccount", "contents" : self)
@@ -498,45 +806,17 @@ class CreateAssetHeader(Serializable):
         self.assetType = asset_type
         self.metadata = Metadata(metadata)
 
-    def to_binary(self):
-        precision = self.assetType.precision
-        _asset_type = self.assetType.type.encode()
-        name_len = str(len(self.assetName)) + "s"
-        reference_len = str(len(self.reference)) + "s"
-        asset_len = str(len(_asset_type)) + "s "
-
-        if _asset_type == b'Fractional':
-            package = ">HHH" + name_len + "QHH" + reference_len + "H" + asset_len + "b"
-            structured = struct.pack(
-                package,
-                enum.TxTypeCreateAsset[0],
-                enum.TxTypeCreateAsset[1],
-                len(self.assetName),
-                self.assetName.encode(),
-                self.supply,
-                1,
-                len(self.reference),
-                self.reference.encode(),
-                len(_asset_type),
-                _asset_type, precision - 1)
+    def _layout(self):
+        type_template, type_lengths, type_values = self.assetType._format()
+        meta_template, meta_lengths, meta_values = self.metadata._format()
 
-        else:
-            package = ">HHH" + name_len + "QHH" + reference_len + "H" + asset_len
-            structured = struct.pack(
-                package,
-                enum.TxTypeCreateAsset[0],
-                enum.TxTypeCreateAsset[1],
-                len(self.assetName),
-                self.assetName.encode(),
-                self.supply,
-                1,
-                len(self.reference),
-                self.reference.encode(),
-                len(_asset_type),
-                _asset_type)
-
-        structured = structured + self.metadata.to_binary()
-        return structured
+        fmt = layout(">HHH{}sQHH{}s" + type_template + meta_template,
+                     len(self.assetName), len(self.reference), *(type_lengths + tuple(meta_lengths)))
+        values = [enum.TxTypeCreateAsset[0], enum.TxTypeCreateAsset[1],
+                  len(self.assetName), text(self.assetName),
+                  self.supply, 1,
+                  len(self.reference), text(self.reference)]
+        return fmt, values + list(type_values) + meta_values
 
 
 # ------------------------------------------------------------------------
@@ -558,14 +838,9 @@ class CreateContractHeader(Serializable):
     def __init__(self, contract):
         self.contract = str(contract)
 
-    def to_binary(self):
-        pack_contract = str(len(self.contract)) + "s"
-        pack_len = len(self.contract)
-
-        structured = struct.pack(
-            ">HHH" + pack_contract, enum.TxTypeCreateContract[0], enum.TxTypeCreateContract[1], pack_len, self.contract.encode())
-
-        return structured
+    def _layout(self):
+        return layout(">HHH{}s", len(self.contract)), (enum.TxTypeCreateContract[0], enum.TxTypeCreateContract[1],
+                                                       len(self.contract), text(self.contract))
 
 # ------------------------------------------------------------------------
 # Memory Pool
@@ -616,10 +891,9 @@ class TransferAssetHeader(Serializable):
         self.toAddr = toAddr
         self.balance = balance
 
-    def to_binary(self):
-        structured = struct.pack(
-            ">HH32s32sq", enum.TxTypeTransfer[0], enum.TxTypeTransfer[1], b58decode(self.assetAddr), b58decode(self.toAddr), self.balance)
-        return structured
+    def _layout(self):
+        return encoding.TRANSFER, (enum.TxTypeTransfer[0], enum.TxTypeTransfer[1],
+                                   decode_address(self.assetAddr), decode_address(self.toAddr), self.balance)
 
 
 # ------------------------------------------------------------------------
@@ -642,10 +916,9 @@ class CirculateAssetHeader(Serializable):
         self.assetAddr = assetAddr
         self.amount = amount
 
-    def to_binary(self):
-        structured = struct.pack(
-            ">HH32sq", enum.TxTypeCirculate[0], enum.TxTypeCirculate[1], b58decode(self.assetAddr), self.amount)
-        return structured
+    def _layout(self):
+        return encoding.CIRCULATE, (enum.TxTypeCirculate[0], enum.TxTypeCirculate[1],
+                                    decode_address(self.assetAddr), self.amount)
 
 
 # ------------------------------------------------------------------------
@@ -667,10 +940,9 @@ class RevokeAccountHeader(Serializable):
     def __init__(self, account_addr):
         self.address = account_addr
 
-    def to_binary(self):
-        structured = struct.pack(
-            ">HH32s", enum.TxTypeRevokeAccount[0], enum.TxTypeRevokeAccount[1], b58decode(self.address))
-        return structured
+    def _layout(self):
+        return encoding.TX_ADDR, (enum.TxTypeRevokeAccount[0], enum.TxTypeRevokeAccount[1],
+                                  decode_address(self.address))
 
 
 # ------------------------------------------------------------------------
@@ -692,10 +964,8 @@ class RevokeAssetHeader(Serializable):
     def __init__(self, asset_addr):
         self.address = asset_addr
 
-    def to_binary(self):
-        structured = struct.pack(
-            ">HH32s", enum.TxTypeRevokeAsset[0], enum.TxTypeRevokeAsset[1], b58decode(self.address))
-        return structured
+    def _layout(self):
+        return encoding.TX_ADDR, (enum.TxTypeRevokeAsset[0], enum.TxTypeRevokeAsset[1], decode_address(self.address))
 
 
 # ------------------------------------------------------------------------
@@ -714,20 +984,62 @@ class Call(Serializable):
 class CallHeader(Serializable):
     """Denotes contract Call Header"""
 
+    # CallTemplate the header was made from, if any
+    _template = None
+
     def __init__(self, contract_addr, method, args):
         self.address = contract_addr
         self.method = method
         self.args = args
 
-    def to_binary(self):
-        binary_args = b''.join([arg.to_binary() for arg in self.args])
-
-        structured = struct.pack(
-            ">HH32sQ{}sQ{}s".format(str(len(self.method)), str(
-                len(binary_args))), enum.TxTypeCall[0], enum.TxTypeCall[1],
-            b58decode(self.address),
-            len(self.method), self.method.encode(), len(self.args), binary_args)
-        return structured
+    def _layout(self):
+        template = self._template
+        if template is not None and template.address == self.address and template.method == self.method:
+            layouts = [template.layout]
+            values = [template.prefix, len(self.args)]
+        else:
+            layouts = [layout(">HH32sQ{}sQ", len(self.method))]
+            values = [enum.TxTypeCall[0], enum.TxTypeCall[1], decode_address(self.address),
+                      len(self.method), text(self.method), len(self.args)]
+        for arg in self.args:
+            fmt, arg_values = arg._layout()
+            layouts.append(fmt)
+            values.extend(arg_values)
+        return concat(layouts), values
+
+
+class CallTemplate(object):
+    """
+    Calls of one contract method, with the encoding of the contract address
+    and method name computed once. Only the arguments are encoded for each
+    call.
+    """
+
+    def __init__(self, contract_addr, method):
+        self._address = contract_addr
+        self._method = method
+        self.prefix = layout(">HH32sQ{}s", len(method)).pack(
+            enum.TxTypeCall[0], enum.TxTypeCall[1], decode_address(contract_addr), len(method), text(method))
+        self.layout = layout(">{}sQ", len(self.prefix))
+
+    @property
+    def address(self):
+        """Contract address, read-only as the encoded prefix depends on it"""
+        return self._address
+
+    @property
+    def method(self):
+        """Method name, read-only as the encoded prefix depends on it"""
+        return self._method
+
+    def header(self, args):
+        """CallHeader of a call with these arguments"""
+        hdr = CallHeader(self.address, self.method, args)
+        hdr._template = self
+        return hdr
+
+    def sign(self, privkey, args, k=None):
+        return self.header(args).sign(privkey, k=k)
 
 
 # ------------------------------------------------------------------------
@@ -751,13 +1063,10 @@ class BindHeader(Serializable):
         self.contract = contract_addr
         self.proof = proof
 
-    def to_binary(self):
+    def _layout(self):
         """Convert bytes for binding asset to a contract"""
-
-        structured = struct.pack(
-            ">HH32s32s{}s".format(len(self.proof)),
-             enum.TxTypeBind[0], enum.TxTypeBind[1], self.contract.encode(), self.asset.encode(), self.proof)
-        return structured
+        return layout(">HH32s32s{}s", len(self.proof)), (enum.TxTypeBind[0], enum.TxTypeBind[1],
+                                                         text(self.contract), text(self.asset), self.proof)
 
 
 # ------------------------------------------------------------------------
@@ -779,8 +1088,112 @@ class SyncHeader(Serializable):
     def __init__(self, contract_addr):
         self.contract = contract_addr
 
-    def to_binary(self):
+    def _layout(self):
         """Convert bytes for syncing local contract"""
-        structured = struct.pack(
-            ">HH32s", enum.TxTypeSyncLocal[0], enum.TxTypeSyncLocal[1], self.contract)
-        return structured
+        return encoding.TX_ADDR, (enum.TxTypeSyncLocal[0], enum.TxTypeSyncLocal[1], self.contract)
+
+
+# ------------------------------------------------------------------------
+# Transaction Types
+# ------------------------------------------------------------------------
+
+
+HEADER_TX_TYPES = {
+    CreateContractHeader: (TxContract, CreateContract),
+    SyncHeader: (TxContract, SyncLocal),
+    CallHeader: (TxContract, Call),
+    CreateAssetHeader: (TxAsset, CreateAsset),
+    TransferAssetHeader: (TxAsset, Transfer),
+    CirculateAssetHeader: (TxAsset, Circulate),
+    BindHeader: (TxAsset, Bind),
+    RevokeAssetHeader: (TxAsset, RevokeAsset),
+    CreateAccountHeader: (TxAccount, CreateAccount),
+    RevokeAccountHeader: (TxAccount, RevokeAccount),
+}
+
+
+def wrap_header(hdr):
+    """Wrap a transaction header in its transaction constructors, e.g. TxAsset(Transfer(hdr))"""
+    tx_type, constructor = HEADER_TX_TYPES[type(hdr)]
+    return tx_type(constructor(hdr))
+
+
+# ------------------------------------------------------------------------
+# Transaction Decoding
+# ------------------------------------------------------------------------
+
+
+def _fixed(data):
+    contents = data['contents']
+    return VFixed(Decimal(str(contents['contents'])), int(contents['tag'][len('Fixed'):]))
+
+
+_VALUE_TYPES = {
+    'VInt': VInt,
+    'VFloat': VFloat,
+    'VBool': VBool,
+    'VAccount': VAccount,
+    'VAsset': VAsset,
+    'VContract': VContract,
+    'VMsg': VMsg,
+    'VEnum': VEnum,
+}
+
+_VALUE_DECODERS = {
+    'VVoid': lambda data: VVoid,
+    'VUndefined': lambda data: VUndefined,
+    'VFixed': _fixed,
+}
+
+
+def _value_from_dict(data):
+    """Contract value from its JSON form, left as a dict if its tag is not known"""
+    tag = data.get('tag')
+    if tag in _VALUE_TYPES:
+        return _VALUE_TYPES[tag](data['contents'])
+    if tag in _VALUE_DECODERS:
+        return _VALUE_DECODERS[tag](data)
+    return data
+
+
+def _create_asset_header(data):
+    asset_type = data['assetType']
+    return CreateAssetHeader(data['assetName'], data['supply'], asset_type['tag'], data['reference'],
+                             data['issuer'], asset_type['contents'], data['metadata'])
+
+
+def _proof(proof):
+    return proof if isinstance(proof, bytes) else proof.encode()
+
+
+# Header constructors by tag, building the header from the JSON contents
+_HEADER_DECODERS = {
+    'CreateContract': lambda data: CreateContractHeader(data['contract']),
+    'SyncLocal': lambda data: SyncHeader(data['contract']),
+    'Call': lambda data: CallHeader(data['address'], data['method'], [_value_from_dict(arg) for arg in data['args']]),
+    'CreateAsset': _create_asset_header,
+    'Transfer': lambda data: TransferAssetHeader(data['assetAddr'], data['toAddr'], data['balance']),
+    'Circulate': lambda data: CirculateAssetHeader(data['assetAddr'], data['amount']),
+    'Bind': lambda data: BindHeader(data['asset'], data['contract'], _proof(data['proof'])),
+    'RevokeAsset': lambda data: RevokeAssetHeader(data['address']),
+    'CreateAccount': lambda data: CreateAccountHeader(data['pubKey'], data['metadata'], None, data['timezone']),
+    'RevokeAccount': lambda data: RevokeAccountHeader(data['address']),
+}
+
+_TX_CONSTRUCTORS = dict((constructor.__name__, (tx_type, constructor))
+                        for tx_type, constructor in HEADER_TX_TYPES.values())
+
+
+def header_from_dict(data):
+    """
+    Transaction header from its JSON form, e.g. TxAsset(Transfer(hdr)). A
+    header of an unknown kind is returned as the dict it was given.
+    """
+    try:
+        tx_type, constructor = _TX_CONSTRUCTORS[data['contents']['tag']]
+        decode = _HEADER_DECODERS[data['contents']['tag']]
+    except (KeyError, TypeError):
+        return data
+    if data.get('tag') != tx_type.__name__:
+        return data
+    return tx_type(constructor(decode(data['contents']['contents'])))
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+# ------------------------------------------------------------------------
+# Curve Parameters
+# ------------------------------------------------------------------------
+
+P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+GX = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
+GY = 0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+
+# ------------------------------------------------------------------------
+# Point Arithmetic
+# ------------------------------------------------------------------------
+
+# Points are kept in Jacobian coordinates (X, Y, Z), standing for the affine
+# point (X / Z^2, Y / Z^3), so that additions need no modular inversion. The
+# point at infinity is None.
+
+
+def _double(point):
+    x, y, z = point
+    if y == 0:
+        return None
+    a = x * x % P
+    b = y * y % P
+    c = b * b % P
+    d = 2 * ((x + b) * (x + b) - a - c) % P
+    e = 3 * a % P
+    x3 = (e * e - 2 * d) % P
+    y3 = (e * (d - x3) - 8 * c) % P
+    z3 = 2 * y * z % P
+    return x3, y3, z3
+
+
+def _add_affine(point, x2, y2):
+    """Add the affine point (x2, y2) to a Jacobian point"""
+    if point is None:
+        return x2, y2, 1
+    x1, y1, z1 = point
+    z1z1 = z1 * z1 % P
+    h = (x2 * z1z1 - x1) % P
+    r = (y2 * z1 * z1z1 - y1) % P
+    if h == 0:
+        return _double(point) if r == 0 else None
+    hh = h * h % P
+    hhh = h * hh % P
+    v = x1 * hh % P
+    x3 = (r * r - hhh - 2 * v) % P
+    y3 = (r * (v - x3) - y1 * hhh) % P
+    z3 = z1 * h % P
+    return x3, y3, z3
+
+
+def _add(p1, p2):
+    """Add two Jacobian points"""
+    if p1 is None:
+        return p2
+    x2, y2, z2 = p2
+    z2inv = pow(z2, P - 2, P)
+    z2inv2 = z2inv * z2inv % P
+    return _add_affine(p1, x2 * z2inv2 % P, y2 * z2inv2 * z2inv % P)
+
+
+def _to_affine(point):
+    x, y, z = point
+    zinv = pow(z, P - 2, P)
+    zinv2 = zinv * zinv % P
+    return x * zinv2 % P, y * zinv2 * zinv % P
+
+
+def _batch_to_affine(points):
+    """Convert many Jacobian points with a single modular inversion"""
+    products = []
+    acc = 1
+    for x, y, z in points:
+        acc = acc * z % P
+        products.append(acc)
+
+    inv = pow(acc, P - 2, P)
+    affine = [None] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        x, y, z = points[i]
+        zinv = inv * products[i - 1] % P if i else inv
+        inv = inv * z % P
+        zinv2 = zinv * zinv % P
+        affine[i] = (x * zinv2 % P, y * zinv2 * zinv % P)
+    return affine
+
+
+# ------------------------------------------------------------------------
+# Fixed Base Multiplication
+# ------------------------------------------------------------------------
+
+# k * Q is computed from a table of the multiples j * 2^(w*i) * Q, in affine
+# coordinates, for every w bit window i of a 256 bit scalar and every window
+# value j. A multiplication then costs one table addition per non zero window
+# of k and a single inversion, instead of a few hundred doublings and
+# additions. The generator's table uses 8 bit windows and is shared by all
+# keys; it is built on first use.
+
+WINDOW = 8
+KEY_WINDOW = 4
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def point_table(x, y, window=KEY_WINDOW):
+    """
+    Precompute the multiples of a point used by table_multiply
+    :param x: affine x coordinate
+    :param y: affine y coordinate
+    :param window: window size in bits
+    :return: table of affine points
+    """
+    rows = []
+    base = (x, y)
+    for _ in range((256 + window - 1) // window):
+        multiples = []
+        point = None
+        for _ in range((1 << window) - 1):
+            point = _add_affine(point, *base)
+            multiples.append(point)
+        row = [None] + _batch_to_affine(multiples)
+        rows.append(row)
+        base = _to_affine(_add_affine(point, *base))
+    return rows
+
+
+def _get_table():
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                _table = point_table(GX, GY, WINDOW)
+    return _table
+
+
+def table_multiply(table, k, point=None):
+    """
+    Multiply a point by a scalar using its precomputed table
+    :param table: table of the point, from point_table
+    :param k: scalar, 0 <= k < 2^256
+    :param point: Jacobian point the product is added to, if any
+    :return: Jacobian point, None for the point at infinity
+    """
+    window = len(table[0]).bit_length() - 1
+    mask = (1 << window) - 1
+    for row in table:
+        digit = k & mask
+        if digit:
+            point = _add_affine(point, *row[digit])
+        k >>= window
+    return point
+
+
+def multiply(x, y, k, point=None):
+    """
+    Multiply a point by a scalar without a table, by double and add
+    :param x: affine x coordinate
+    :param y: affine y coordinate
+    :param k: scalar, 0 <= k < 2^256
+    :param point: Jacobian point the product is added to, if any
+    :return: Jacobian point, None for the point at infinity
+    """
+    product = None
+    for bit in bin(k)[2:]:
+        if product is not None:
+            product = _double(product)
+        if bit == '1':
+            product = _add_affine(product, x, y)
+    if product is None:
+        return point
+    if point is None:
+        return product
+    return _add(point, product)
+
+
+def base_multiply(k):
+    """
+    Multiply the curve generator by a scalar
+    :param k: scalar, 0 < k < N
+    :return: affine coordinates (x, y) of k * G
+    """
+    return _to_affine(table_multiply(_get_table(), k))
+
+
+# ------------------------------------------------------------------------
+# Signing
+# ------------------------------------------------------------------------
+
+
+def sign_number(secret, number, k):
+    """
+    ECDSA signature of a hash, computed exactly as ecdsa.ecdsa.Private_key.sign
+    :param secret: private key scalar
+    :param number: message hash as an integer
+    :param k: nonce, 0 < k < N
+    :return: tuple (r, s)
+    """
+    k = k % N
+    r = base_multiply(k)[0] % N
+    if r == 0:
+        raise RuntimeError("amazingly unlucky random number r")
+    s = pow(k, N - 2, N) * (number + secret * r % N) % N
+    if s == 0:
+        raise RuntimeError("amazingly unlucky random number s")
+    return r, s
+
+
+def verify_number(public, number, r, s, table=None):
+    """
+    Verify an ECDSA signature of a hash
+    :param public: affine coordinates (x, y) of the public key
+    :param number: message hash as an integer
+    :param r: signature r
+    :param s: signature s
+    :param table: precomputed table of the public key, if any
+    :return: True if the signature is valid
+    """
+    if not (0 < r < N and 0 < s < N):
+        return False
+    w = pow(s, N - 2, N)
+    u1 = number * w % N
+    u2 = r * w % N
+
+    point = table_multiply(_get_table(), u1)
+    if table is not None:
+        point = table_multiply(table, u2, point)
+    else:
+        point = multiply(public[0], public[1], u2, point)
+    if point is None:
+        return False
+    return _to_affine(point)[0] % N == r
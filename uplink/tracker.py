@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .exceptions import TransactionNonExistent
+
+TX_PROCESSED = ["Accepted", "Rejected"]
+
+
+class _Tracked(object):
+    """Polling state of a single outstanding transaction"""
+
+    def __init__(self, delay):
+        self.future = Future()
+        self.delay = delay
+        self.next_poll = time.time() + delay
+
+
+class TxTracker(object):
+    """
+    Track outstanding transactions until the node has processed them.
+
+    A single background worker polls every outstanding transaction status,
+    backing off each one from ``min_delay`` up to ``max_delay`` seconds while
+    it is still pending. Tracking the same hash twice shares one poll.
+
+    :param rpc: UplinkJsonRpc client used to query transaction statuses
+    :param min_delay: seconds before the first status query of a transaction
+    :param max_delay: maximum seconds between status queries of a transaction
+    :param backoff: factor the delay grows by after each pending status
+    :param concurrency: maximum number of status queries in flight
+    """
+
+    def __init__(self, rpc, min_delay=0.1, max_delay=5.0, backoff=2.0, concurrency=8):
+        self.rpc = rpc
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.concurrency = concurrency
+
+        self._pending = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._worker = None
+
+    def track(self, tx_hash, callback=None):
+        """
+        Start tracking a transaction
+        :param tx_hash: hash of an issued transaction
+        :param callback: optional function called with the future once resolved
+        :return: future resolving to "Accepted" or "Rejected", or raising
+        TransactionNonExistent if the node does not know the transaction
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("TxTracker is closed")
+            tracked = self._pending.get(tx_hash)
+            if tracked is None:
+                tracked = self._pending[tx_hash] = _Tracked(self.min_delay)
+                self._cond.notify()
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run)
+                self._worker.daemon = True
+                self._worker.start()
+
+        if callback is not None:
+            tracked.future.add_done_callback(callback)
+        return tracked.future
+
+    def wait(self, tx_hashes, timeout=None):
+        """
+        Wait until all transactions are processed
+        :param tx_hashes: hashes of issued transactions
+        :param timeout: maximum seconds to wait for
+        :return: dict of transaction hash to status
+        """
+        futures = [(tx_hash, self.track(tx_hash)) for tx_hash in tx_hashes]
+        deadline = None if timeout is None else time.time() + timeout
+
+        statuses = {}
+        for tx_hash, future in futures:
+            remaining = None if deadline is None else max(0, deadline - time.time())
+            statuses[tx_hash] = future.result(remaining)
+        return statuses
+
+    def close(self):
+        """Stop polling and cancel all outstanding futures"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            pending, self._pending = self._pending, {}
+
+        if self._worker is not None:
+            self._worker.join()
+        for tracked in pending.values():
+            tracked.future.cancel()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _due(self):
+        """Wait until some transactions are due for polling and return them"""
+        with self._cond:
+            while not self._closed:
+                now = time.time()
+                due = [(tx_hash, tracked) for tx_hash, tracked in self._pending.items()
+                       if tracked.next_poll <= now]
+                if due:
+                    return due
+                if self._pending:
+                    timeout = min(t.next_poll for t in self._pending.values()) - now
+                else:
+                    timeout = None
+                self._cond.wait(timeout)
+            return []
+
+    def _run(self):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while True:
+                due = self._due()
+                if not due:
+                    return
+                polls = [pool.submit(self.rpc.uplink_get_transaction_status, tx_hash)
+                         for tx_hash, tracked in due]
+                for (tx_hash, tracked), poll in zip(due, polls):
+                    try:
+                        self._update(tx_hash, tracked, poll)
+                    except Exception:
+                        # e.g. a future the caller cancelled while its result
+                        # was set; the other transactions are still tracked
+                        self._resolve(tx_hash)
+
+    def _update(self, tx_hash, tracked, poll):
+        if tracked.future.cancelled():
+            # The caller gave up on the transaction
+            self._resolve(tx_hash)
+            return
+        try:
+            status = poll.result()
+        except TransactionNonExistent as e:
+            self._resolve(tx_hash)
+            tracked.future.set_exception(e)
+            return
+        except Exception:
+            # Transient failures such as a dropped connection are retried
+            status = None
+
+        if status in TX_PROCESSED:
+            self._resolve(tx_hash)
+            tracked.future.set_result(status)
+        else:
+            tracked.delay = min(tracked.delay * self.backoff, self.max_delay)
+            tracked.next_poll = time.time() + tracked.delay
+
+    def _resolve(self, tx_hash):
+        with self._cond:
+            self._pending.pop(tx_hash, None)
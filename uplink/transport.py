@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+from requests.packages.urllib3.util.retry import Retry
+
+from .exceptions import RpcConnectionFail
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 60.0
+
+
+class HttpTransport(object):
+    """
+    Pooled HTTP transport for the Uplink JSON RPC interface.
+
+    Keeps a ``requests.Session`` whose adapters hold up to ``pool_size``
+    keep-alive connections per node, so repeated RPCs reuse the same TCP (and
+    TLS) connection instead of opening a new one per call.
+
+    :param pool_size: maximum number of pooled connections per node
+    :param connect_timeout: seconds to wait for a connection, None to wait forever
+    :param read_timeout: seconds to wait for a response, None to wait forever
+    :param retries: number of times to retry a request that failed to connect
+    :param backoff: backoff factor between connection retries, in seconds
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=DEFAULT_READ_TIMEOUT, retries=0, backoff=0):
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+
+        # Only failed connection attempts are retried: every RPC is a POST and
+        # the node may already have acted on a request whose response was lost.
+        retry = Retry(total=retries, connect=retries, read=0, redirect=0,
+                      backoff_factor=backoff)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def post(self, url, body):
+        """
+        POST a request body to the node
+        :param url: full url of the RPC endpoint
+        :param body: encoded request body
+        :return: the node's response
+        """
+        try:
+            return self.session.post(url, data=body, timeout=self.timeout)
+        except (RequestsConnectionError, Timeout):
+            raise RpcConnectionFail('connection error:', None)
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
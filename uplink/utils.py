@@ -11,3 +11,11 @@ def to_bytes(n, length, byteorder='big'):
     h = '%x' % n
     s = codecs.decode(('0' * (len(h) % 2) + h).zfill(length * 2), 'hex')
     return s if byteorder == 'big' else s[::-1]
+
+
+def from_bytes(data, byteorder='big'):
+    # int.from_bytes for both python 2 and 3
+    data = bytes(data)
+    if byteorder != 'big':
+        data = data[::-1]
+    return int(codecs.encode(data, 'hex') or b'0', 16)